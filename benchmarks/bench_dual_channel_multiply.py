@@ -0,0 +1,76 @@
+"""
+Regression benchmark of DualChannelAudioMultiplyOperation.
+
+Compares the vectorized implementation (and its in-place variant) with the
+original one, which split the channels into two single-channel operations and
+re-stacked the results. Run with:
+
+    python benchmarks/bench_dual_channel_multiply.py
+"""
+
+import timeit
+import numpy as np
+
+from semantiva_audio.data_types.data_types import (
+    SingleChannelAudioDataType,
+    DualChannelAudioDataType,
+)
+from semantiva_audio.processing.operations import DualChannelAudioOperation
+from semantiva_audio.processing.processors import (
+    SingleChannelAudioMultiplyOperation,
+    DualChannelAudioMultiplyOperation,
+    DualChannelAudioMultiplyInPlaceOperation,
+)
+
+
+class LegacyDualChannelAudioMultiplyOperation(DualChannelAudioOperation):
+    """
+    The original per-channel implementation, kept as the benchmark reference.
+    """
+
+    def _process_logic(self, data, factor):
+        left_channel = SingleChannelAudioDataType(data.data[:, 0])
+        right_channel = SingleChannelAudioDataType(data.data[:, 1])
+
+        single_channel_multiplier = SingleChannelAudioMultiplyOperation()
+
+        left_result = single_channel_multiplier(left_channel, factor)
+        right_result = single_channel_multiplier(right_channel, factor)
+
+        multiplied_data = np.column_stack((left_result.data, right_result.data))
+        return DualChannelAudioDataType(multiplied_data)
+
+
+def best_time(function, repeat: int = 5, number: int = 10) -> float:
+    """
+    Return the best time per call, in seconds.
+    """
+    return min(timeit.repeat(function, repeat=repeat, number=number)) / number
+
+
+def main():
+    operations = {
+        "legacy": LegacyDualChannelAudioMultiplyOperation(),
+        "vectorized": DualChannelAudioMultiplyOperation(),
+        "in-place": DualChannelAudioMultiplyInPlaceOperation(),
+    }
+    print(f"{'samples':>10} {'variant':>12} {'time [ms]':>10} {'speedup':>8}")
+    for length in (1_000, 100_000, 1_000_000, 10_000_000):
+        audio = DualChannelAudioDataType(np.random.rand(length, 2))
+        np.testing.assert_allclose(
+            operations["vectorized"](audio, 1.5).data,
+            operations["legacy"](audio, 1.5).data,
+        )
+        reference = None
+        for name, operation in operations.items():
+            # A factor of 1.0 keeps the in-place variant from drifting across repeats
+            elapsed = best_time(lambda: operation(audio, 1.0))
+            reference = reference or elapsed
+            print(
+                f"{length:>10} {name:>12} {elapsed * 1e3:>10.3f} "
+                f"{reference / elapsed:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
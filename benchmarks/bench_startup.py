@@ -0,0 +1,81 @@
+"""
+Startup benchmark of the audio specialization.
+
+Measures, in fresh interpreters, the time to import the Semantiva component
+loader (the baseline every worker pays), to load the audio specialization, to
+resolve a first processor by name, and to import every processor module
+eagerly, as registering `semantiva_audio.processing.processors` directly did
+when it defined every processor. Run with:
+
+    python benchmarks/bench_startup.py [--runs N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict
+
+_TIMED_SCRIPT = """
+import time
+start = time.perf_counter()
+from semantiva.component_loader import ComponentLoader
+from semantiva.specializations import load_specializations
+baseline = time.perf_counter()
+load_specializations("audio")
+loaded = time.perf_counter()
+ComponentLoader.get_class("SingleChannelAudioMultiplyOperation")
+resolved = time.perf_counter()
+print(baseline - start, loaded - baseline, resolved - loaded)
+"""
+
+_EAGER_SCRIPT = """
+import time
+from importlib import import_module
+from semantiva.component_loader import ComponentLoader
+from semantiva_audio.manifest import PROCESSOR_MANIFEST
+start = time.perf_counter()
+for module in set(PROCESSOR_MANIFEST.values()):
+    import_module(module)
+print(time.perf_counter() - start)
+"""
+
+
+def run(script: str) -> list:
+    """
+    Run a script in a fresh interpreter and return the times it prints.
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+    return [float(value) for value in output.split()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10, help="interpreters per step")
+    options = parser.parse_args()
+
+    samples: Dict[str, list] = {
+        "import component loader": [],
+        "load_specializations('audio')": [],
+        "first processor resolution": [],
+        "eager processors import": [],
+    }
+    for _ in range(options.runs):
+        baseline, loaded, resolved = run(_TIMED_SCRIPT)
+        samples["import component loader"].append(baseline)
+        samples["load_specializations('audio')"].append(loaded)
+        samples["first processor resolution"].append(resolved)
+        samples["eager processors import"].append(run(_EAGER_SCRIPT)[0])
+
+    print(f"{'step':<36}{'median ms':>10}{'min ms':>10}")
+    for step, times in samples.items():
+        print(
+            f"{step:<36}{statistics.median(times) * 1e3:>10.2f}"
+            f"{min(times) * 1e3:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
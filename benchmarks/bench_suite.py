@@ -0,0 +1,338 @@
+"""
+Benchmark suite of the audio data types, operations and pipeline overhead.
+
+Runs offline on synthetic signals at several durations and channel counts, and
+reports for each case the time per call, the throughput in samples/s (frames
+times channels), the real-time factor (seconds of audio processed per second)
+and the peak memory allocated during a call. Run with:
+
+    python benchmarks/bench_suite.py [--quick] [--filter TEXT]
+        [--save baseline.json] [--compare baseline.json]
+
+`--save` writes the results as JSON. `--compare` reports the ratio of each time
+to a saved baseline and exits with status 1 if a case is slower than the
+threshold ratio (1.25 by default).
+"""
+
+import argparse
+import functools
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple
+import numpy as np
+
+from semantiva.logger import Logger
+from semantiva.payload_operations import Pipeline
+from semantiva.specializations import load_specializations
+from semantiva_audio.data_types.data_types import (
+    SingleChannelAudioDataType,
+    DualChannelAudioDataType,
+    MultiChannelAudioDataType,
+    SingleChannelAudioBatchDataType,
+)
+from semantiva_audio.processing.fusion import fuse_elementwise_operations
+from semantiva_audio.processing import processors
+
+SAMPLE_RATE = 48_000
+# Signal durations, in seconds
+DURATIONS = (1.0, 10.0, 60.0)
+QUICK_DURATIONS = (0.1, 1.0)
+CHANNEL_COUNTS = (1, 2, 8)
+# Time ratio to the baseline above which a case is reported as a regression
+REGRESSION_THRESHOLD = 1.25
+
+
+class BenchmarkCase(NamedTuple):
+    """
+    A benchmarked call.
+
+    Attributes:
+        group (str): "construction", "operation" or "pipeline".
+        name (str): Name of the benchmarked call.
+        channels (int): Number of channels of the signal.
+        frames (int): Number of samples per channel of the signal.
+        run (Callable[[], Any]): The call.
+    """
+
+    group: str
+    name: str
+    channels: int
+    frames: int
+    run: Callable[[], Any]
+
+    @property
+    def key(self) -> str:
+        return f"{self.group}/{self.name}/{self.channels}ch/{self.frames}"
+
+
+def synthetic_signal(frames: int, channels: int) -> np.ndarray:
+    """
+    Return a reproducible noisy multi-tone signal, shaped (frames,) for one
+    channel or (frames, channels).
+    """
+    generator = np.random.default_rng(frames * 31 + channels)
+    time = np.arange(frames) / SAMPLE_RATE
+    tones = 0.3 * np.sin(2 * np.pi * np.outer(time, 220.0 * (1 + np.arange(channels))))
+    samples = tones + 0.05 * generator.standard_normal((frames, channels))
+    return samples[:, 0].copy() if channels == 1 else samples
+
+
+def _operation_case(frames, channels, name, data, operation, *args) -> BenchmarkCase:
+    return BenchmarkCase(
+        "operation", name, channels, frames, lambda: operation(data, *args)
+    )
+
+
+def operation_cases(frames: int, channels: int) -> Iterator[BenchmarkCase]:
+    """
+    Yield a case per audio operation (and statistics probe) for the channel count.
+    """
+    samples = synthetic_signal(frames, channels)
+    kernels = {"fir64": np.hanning(64) / 32, "fir1024": np.hanning(1024) / 512}
+    p = processors
+
+    def case(name, data, operation, *args):
+        return _operation_case(frames, channels, name, data, operation, *args)
+
+    audio: Any
+    planar: Any
+    if channels == 1:
+        audio = SingleChannelAudioDataType(samples)
+        yield case("multiply", audio, p.SingleChannelAudioMultiplyOperation(), 0.5)
+        yield case("offset", audio, p.SingleChannelAudioOffsetOperation(), 0.1)
+        yield case("clip", audio, p.SingleChannelAudioClipOperation(), -0.5, 0.5)
+        for name, kernel in kernels.items():
+            fir = p.SingleChannelAudioFIRFilterOperation()
+            yield case(name, audio, fir, kernel)
+        resample = p.SingleChannelAudioResampleOperation()
+        yield case("resample", audio, resample, SAMPLE_RATE, 44_100)
+        stft = p.SingleChannelAudioSTFTOperation()
+        yield case("stft", audio, stft, 1024, 256)
+        spectrogram = stft(audio, 1024, 256)
+        yield case("istft", spectrogram, p.SpectrogramISTFTOperation())
+        statistics = p.SingleChannelAudioStatisticsProbe()
+        yield case("statistics", audio, statistics)
+        yield case("duplicate", audio, p.SingleChannelAudioDuplicateOperation())
+        upmix = p.SingleChannelAudioUpmixOperation()
+        yield case("upmix", audio, upmix, [1.0, 0.7, 0.7, 0.5])
+        clips = samples[: frames // 16 * 16].reshape(16, -1)
+        batch = SingleChannelAudioBatchDataType(clips)
+        multiply = p.SingleChannelAudioBatchMultiplyOperation()
+        yield case("batch_multiply", batch, multiply, np.linspace(0.5, 1.0, 16))
+        return
+
+    if channels == 2:
+        audio = DualChannelAudioDataType(samples)
+        planar = audio.to_layout("planar")
+        factors = [0.5, 0.8]
+        yield case("multiply", audio, p.DualChannelAudioMultiplyOperation(), factors)
+        yield case("offset", audio, p.DualChannelAudioOffsetOperation(), 0.1)
+        yield case("clip", audio, p.DualChannelAudioClipOperation(), -0.5, 0.5)
+        yield case("to_planar", audio, p.DualChannelToPlanarOperation())
+        yield case("to_interleaved", planar, p.DualChannelToInterleavedOperation())
+        downmix: Any = p.DualChannelAudioDownmixOperation()
+        yield case("downmix", audio, downmix, [0.5, 0.5])
+        operations: Dict[str, Any] = {
+            "fir": p.DualChannelAudioFIRFilterOperation,
+            "resample": p.DualChannelAudioResampleOperation,
+            "statistics": p.DualChannelAudioStatisticsProbe,
+        }
+    else:
+        audio = MultiChannelAudioDataType(samples)
+        planar = audio.to_layout("planar")
+        matrix = np.random.default_rng(0).uniform(0, 1, (channels, channels))
+        yield case("mix", audio, p.MultiChannelAudioMixOperation(), matrix)
+        downmix = p.MultiChannelAudioDownmixOperation()
+        yield case("downmix", audio, downmix, np.full(channels, 1 / channels))
+        yield case("to_planar", audio, p.MultiChannelToPlanarOperation())
+        yield case("to_interleaved", planar, p.MultiChannelToInterleavedOperation())
+        operations = {
+            "fir": p.MultiChannelAudioFIRFilterOperation,
+            "resample": p.MultiChannelAudioResampleOperation,
+            "statistics": p.MultiChannelAudioStatisticsProbe,
+        }
+    for name, kernel in kernels.items():
+        yield case(name, planar, operations["fir"](), kernel)
+    resample = operations["resample"]()
+    yield case("resample", planar, resample, SAMPLE_RATE, 44_100)
+    yield case("statistics", audio, operations["statistics"]())
+
+
+def construction_cases(frames: int, channels: int) -> Iterator[BenchmarkCase]:
+    """
+    Yield cases constructing (and validating) audio data from int16 PCM samples.
+    """
+    samples = (synthetic_signal(frames, channels) * 32767).astype(np.int16)
+    data_type: Any = {1: SingleChannelAudioDataType, 2: DualChannelAudioDataType}.get(
+        channels, MultiChannelAudioDataType
+    )
+    for name, construct in (
+        ("constructor", data_type),
+        ("from_external", data_type.from_external),
+        ("from_validated", data_type.from_validated),
+    ):
+        yield BenchmarkCase(
+            "construction",
+            name,
+            channels,
+            frames,
+            functools.partial(construct, samples, sample_format="int16"),
+        )
+    audio = data_type(samples, sample_format="int16")
+    yield BenchmarkCase("construction", "as_float", channels, frames, audio.as_float)
+
+
+def pipeline_cases(frames: int, channels: int) -> Iterator[BenchmarkCase]:
+    """
+    Yield cases running a gain, offset and clip pipeline, its fused version and
+    the equivalent NumPy expression.
+    """
+    if channels > 2:
+        return
+    prefix = "SingleChannel" if channels == 1 else "DualChannel"
+    node_configurations = [
+        {
+            "processor": f"{prefix}AudioMultiplyOperation",
+            "parameters": {"factor": 0.5},
+        },
+        {"processor": f"{prefix}AudioOffsetOperation", "parameters": {"offset": 0.1}},
+        {
+            "processor": f"{prefix}AudioClipOperation",
+            "parameters": {"minimum": -0.5, "maximum": 0.5},
+        },
+    ]
+    samples = synthetic_signal(frames, channels)
+    audio = (SingleChannelAudioDataType if channels == 1 else DualChannelAudioDataType)(
+        samples
+    )
+    logger = Logger(level="WARNING")
+    pipeline = Pipeline(node_configurations, logger)
+    fused = Pipeline(fuse_elementwise_operations(node_configurations), logger)
+    yield BenchmarkCase(
+        "pipeline", "pipeline", channels, frames, lambda: pipeline.process(audio)
+    )
+    yield BenchmarkCase(
+        "pipeline", "fused", channels, frames, lambda: fused.process(audio)
+    )
+    yield BenchmarkCase(
+        "pipeline",
+        "numpy",
+        channels,
+        frames,
+        lambda: np.clip(samples * 0.5 + 0.1, -0.5, 0.5),
+    )
+
+
+def benchmark_cases(durations=DURATIONS, channel_counts=CHANNEL_COUNTS):
+    """
+    Yield every benchmark case, for each signal duration and channel count.
+    """
+    for duration in durations:
+        frames = int(duration * SAMPLE_RATE)
+        for channels in channel_counts:
+            yield from construction_cases(frames, channels)
+            yield from operation_cases(frames, channels)
+            yield from pipeline_cases(frames, channels)
+
+
+def measure(case: BenchmarkCase, repeat: int = 3) -> Dict[str, Any]:
+    """
+    Time a case (best of `repeat` runs of about 0.2 s) and measure the peak
+    memory allocated by one call.
+    """
+    timer = timeit.Timer(case.run)
+    number, _ = timer.autorange()
+    seconds = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    tracemalloc.start()
+    try:
+        case.run()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "group": case.group,
+        "name": case.name,
+        "channels": case.channels,
+        "frames": case.frames,
+        "seconds": seconds,
+        "samples_per_second": case.frames * case.channels / seconds,
+        "realtime_factor": case.frames / SAMPLE_RATE / seconds,
+        "peak_bytes": peak_bytes,
+    }
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any], threshold: float
+) -> List[str]:
+    """
+    Print the time ratio of each case to the baseline, and return the keys of
+    the cases slower than the threshold ratio.
+    """
+    regressions = []
+    print(f"\n{'case':<48} {'ratio':>7}")
+    for key, result in results.items():
+        reference = baseline["results"].get(key)
+        if reference is None:
+            continue
+        ratio = result["seconds"] / reference["seconds"]
+        flag = "  REGRESSION" if ratio > threshold else ""
+        print(f"{key:<48} {ratio:>6.2f}x{flag}")
+        if ratio > threshold:
+            regressions.append(key)
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--quick", action="store_true", help="short signals only")
+    parser.add_argument("--filter", default="", help="only run cases matching TEXT")
+    parser.add_argument("--save", help="save the results to a JSON baseline")
+    parser.add_argument("--compare", help="compare the results to a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    arguments = parser.parse_args(argv)
+
+    load_specializations("audio")
+    durations = QUICK_DURATIONS if arguments.quick else DURATIONS
+    results: Dict[str, Dict[str, Any]] = {}
+    print(
+        f"{'case':<48} {'time [ms]':>10} {'Msamples/s':>11} {'RT factor':>10} "
+        f"{'peak [MB]':>10}"
+    )
+    for case in benchmark_cases(durations):
+        if arguments.filter not in case.key:
+            continue
+        result = measure(case)
+        results[case.key] = result
+        print(
+            f"{case.key:<48} {result['seconds'] * 1e3:>10.3f} "
+            f"{result['samples_per_second'] / 1e6:>11.1f} "
+            f"{result['realtime_factor']:>10.0f} "
+            f"{result['peak_bytes'] / 2**20:>10.2f}"
+        )
+
+    if arguments.save:
+        baseline = {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "sample_rate": SAMPLE_RATE,
+            "results": results,
+        }
+        with open(arguments.save, "w", encoding="utf-8") as file:
+            json.dump(baseline, file, indent=2)
+    if arguments.compare:
+        with open(arguments.compare, encoding="utf-8") as file:
+            regressions = compare(results, json.load(file), arguments.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {arguments.threshold}x")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,7 +6,9 @@ class AudioSpecialization(SemantivaSpecialization):
     """Specialization for audio processing"""
 
     def register(self) -> None:
+        # Processors are resolved through the manifest, which imports the module
+        # defining a processor only when the processor is first looked up
         registered_modules = [
-            "semantiva_audio.processing.processors",
+            "semantiva_audio.manifest",
         ]
         ComponentLoader.register_modules(registered_modules)
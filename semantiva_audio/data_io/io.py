@@ -1,24 +1,80 @@
-from abc import abstractmethod
+import os
+import queue
+import threading
+from abc import ABC, abstractmethod
+from typing import (
+    Any,
+    AsyncIterable,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+import numpy as np
 from semantiva.data_io import (
+    DataSource,
     PayloadSource,
     PayloadSink,
 )
 from semantiva.context_processors.context_types import ContextType
 from semantiva_audio.data_types.data_types import (
+    SAMPLE_FORMATS,
     SingleChannelAudioDataType,
     DualChannelAudioDataType,
+    MultiChannelAudioDataType,
 )
 
 
-class SingleChannelAudioSource(PayloadSource):
+def _iter_blocks(
+    data: np.ndarray, block_size: int, overlap: int = 0
+) -> Iterator[np.ndarray]:
+    """
+    Yield consecutive views of `data` along its first (time) axis.
+
+    Consecutive blocks share `overlap` samples. The last block may be shorter
+    than `block_size`. No samples are copied.
+
+    Raises:
+        ValueError: If `block_size` is not positive or `overlap` is not in [0, block_size).
+    """
+    if block_size <= 0:
+        raise ValueError(f"block_size must be positive, got {block_size}.")
+    if not 0 <= overlap < block_size:
+        raise ValueError(
+            f"overlap must be in [0, {block_size}) for block_size {block_size}, "
+            f"got {overlap}."
+        )
+    hop = block_size - overlap
+    length = data.shape[0]
+    start = 0
+    while start < length:
+        yield data[start : start + block_size]
+        if start + block_size >= length:
+            break
+        start += hop
+
+
+class SingleChannelAudioSource(DataSource):
     """
     Abstract base class for single-channel audio data sources.
 
     This class defines methods to provide single-channel audio data.
     """
 
+    @staticmethod
+    def output_data_type():
+        """
+        Specify the data type provided by the source.
+
+        Returns:
+            type: `SingleChannelAudioDataType`, representing single-channel audio.
+        """
+        return SingleChannelAudioDataType
+
     @abstractmethod
-    def _get_data(self):
+    def _get_data(self, *args, **kwargs):
         """
         Retrieve single-channel audio data.
 
@@ -26,25 +82,59 @@ class SingleChannelAudioSource(PayloadSource):
             SingleChannelAudioDataType: The encapsulated audio data.
         """
 
-    def get_data(self):
+    def get_data(self, *args, **kwargs):
         """
         Fetch and return single-channel audio data.
 
         Returns:
             SingleChannelAudioDataType: The encapsulated audio data.
         """
-        return self._get_data()
+        return self._get_data(*args, **kwargs)
+
+    def iter_chunks(
+        self, *args, block_size: int, overlap: int = 0, **kwargs
+    ) -> Iterator[SingleChannelAudioDataType]:
+        """
+        Yield the single-channel audio data as consecutive fixed-size chunks.
+
+        Chunks are views of the data returned by `get_data`. With a memory-mapped
+        source, only the pages of the chunk being processed are resident.
+
+        Args:
+            *args: Positional arguments forwarded to `get_data`.
+            block_size (int): Number of samples per chunk. The last chunk may be shorter.
+            overlap (int): Number of samples shared by consecutive chunks. Defaults to 0.
+            **kwargs: Keyword arguments forwarded to `get_data`.
+
+        Yields:
+            SingleChannelAudioDataType: The audio chunks, in time order.
+        """
+        audio = self.get_data(*args, **kwargs)
+        for block in _iter_blocks(audio.data, block_size, overlap):
+            yield SingleChannelAudioDataType.from_validated(
+                block, audio.recorded_sample_format
+            )
 
 
-class DualChannelAudioSource(PayloadSource):
+class DualChannelAudioSource(DataSource):
     """
     Abstract base class for dual-channel audio data sources.
 
     This class defines methods to provide dual-channel audio data.
     """
 
+    @staticmethod
+    def output_data_type():
+        """
+        Specify the data type provided by the source.
+
+        Returns:
+            type: `DualChannelAudioDataType`, representing dual-channel audio.
+        """
+        return DualChannelAudioDataType
+
     @abstractmethod
-    def _get_data(self):
+    def _get_data(self, *args, **kwargs):
         """
         Retrieve dual-channel audio data.
 
@@ -52,14 +142,98 @@ class DualChannelAudioSource(PayloadSource):
             DualChannelAudioDataType: The encapsulated audio data.
         """
 
-    def get_data(self):
+    def get_data(self, *args, **kwargs):
         """
         Fetch and return dual-channel audio data.
 
         Returns:
             DualChannelAudioDataType: The encapsulated audio data.
         """
-        return self._get_data()
+        return self._get_data(*args, **kwargs)
+
+    def iter_chunks(
+        self, *args, block_size: int, overlap: int = 0, **kwargs
+    ) -> Iterator[DualChannelAudioDataType]:
+        """
+        Yield the dual-channel audio data as consecutive fixed-size chunks.
+
+        Chunks are views of the data returned by `get_data`. With a memory-mapped
+        source, only the pages of the chunk being processed are resident.
+
+        Args:
+            *args: Positional arguments forwarded to `get_data`.
+            block_size (int): Number of samples per chunk. The last chunk may be shorter.
+            overlap (int): Number of samples shared by consecutive chunks. Defaults to 0.
+            **kwargs: Keyword arguments forwarded to `get_data`.
+
+        Yields:
+            DualChannelAudioDataType: The audio chunks, in time order.
+        """
+        audio = self.get_data(*args, **kwargs)
+        for block in _iter_blocks(audio.data, block_size, overlap):
+            yield DualChannelAudioDataType.from_validated(
+                block, audio.recorded_sample_format
+            )
+
+
+class MultiChannelAudioSource(DataSource):
+    """
+    Abstract base class for multi-channel audio data sources.
+
+    This class defines methods to provide multi-channel audio data.
+    """
+
+    @staticmethod
+    def output_data_type():
+        """
+        Specify the data type provided by the source.
+
+        Returns:
+            type: `MultiChannelAudioDataType`, representing multi-channel audio.
+        """
+        return MultiChannelAudioDataType
+
+    @abstractmethod
+    def _get_data(self, *args, **kwargs):
+        """
+        Retrieve multi-channel audio data.
+
+        Returns:
+            MultiChannelAudioDataType: The encapsulated audio data.
+        """
+
+    def get_data(self, *args, **kwargs):
+        """
+        Fetch and return multi-channel audio data.
+
+        Returns:
+            MultiChannelAudioDataType: The encapsulated audio data.
+        """
+        return self._get_data(*args, **kwargs)
+
+    def iter_chunks(
+        self, *args, block_size: int, overlap: int = 0, **kwargs
+    ) -> Iterator[MultiChannelAudioDataType]:
+        """
+        Yield the multi-channel audio data as consecutive fixed-size chunks.
+
+        Chunks are views of the data returned by `get_data`. With a memory-mapped
+        source, only the pages of the chunk being processed are resident.
+
+        Args:
+            *args: Positional arguments forwarded to `get_data`.
+            block_size (int): Number of samples per chunk. The last chunk may be shorter.
+            overlap (int): Number of samples shared by consecutive chunks. Defaults to 0.
+            **kwargs: Keyword arguments forwarded to `get_data`.
+
+        Yields:
+            MultiChannelAudioDataType: The audio chunks, in time order.
+        """
+        audio = self.get_data(*args, **kwargs)
+        for block in _iter_blocks(audio.data, block_size, overlap):
+            yield MultiChannelAudioDataType.from_validated(
+                block, audio.recorded_sample_format
+            )
 
 
 class SingleChannelAudioSink(PayloadSink):
@@ -121,8 +295,18 @@ class SingleChannelPayloadSource(PayloadSource):
     This class defines methods to provide payloads containing single-channel audio data.
     """
 
+    @staticmethod
+    def output_data_type():
+        """
+        Specify the data type provided by the source.
+
+        Returns:
+            type: `SingleChannelAudioDataType`, representing single-channel audio.
+        """
+        return SingleChannelAudioDataType
+
     @abstractmethod
-    def _get_payload(self):
+    def _get_payload(self, *args, **kwargs):
         """
         Retrieve a payload of single-channel audio data.
 
@@ -130,14 +314,14 @@ class SingleChannelPayloadSource(PayloadSource):
             SingleChannelAudioDataType: The encapsulated audio data payload.
         """
 
-    def get_payload(self):
+    def get_payload(self, *args, **kwargs):
         """
         Fetch and return a payload of single-channel audio data.
 
         Returns:
             SingleChannelAudioDataType: The encapsulated audio data payload.
         """
-        return self._get_payload()
+        return self._get_payload(*args, **kwargs)
 
 
 class DualChannelPayloadSource(PayloadSource):
@@ -147,8 +331,18 @@ class DualChannelPayloadSource(PayloadSource):
     This class defines methods to provide payloads containing dual-channel audio data.
     """
 
+    @staticmethod
+    def output_data_type():
+        """
+        Specify the data type provided by the source.
+
+        Returns:
+            type: `DualChannelAudioDataType`, representing dual-channel audio.
+        """
+        return DualChannelAudioDataType
+
     @abstractmethod
-    def _get_payload(self):
+    def _get_payload(self, *args, **kwargs):
         """
         Retrieve a payload of dual-channel audio data.
 
@@ -156,14 +350,50 @@ class DualChannelPayloadSource(PayloadSource):
             DualChannelAudioDataType: The encapsulated audio data payload.
         """
 
-    def get_payload(self):
+    def get_payload(self, *args, **kwargs):
         """
         Fetch and return a payload of dual-channel audio data.
 
         Returns:
             DualChannelAudioDataType: The encapsulated audio data payload.
         """
-        return self._get_payload()
+        return self._get_payload(*args, **kwargs)
+
+
+class MultiChannelPayloadSource(PayloadSource):
+    """
+    Abstract base class for multi-channel audio payload sources.
+
+    This class defines methods to provide payloads containing multi-channel audio data.
+    """
+
+    @staticmethod
+    def output_data_type():
+        """
+        Specify the data type provided by the source.
+
+        Returns:
+            type: `MultiChannelAudioDataType`, representing multi-channel audio.
+        """
+        return MultiChannelAudioDataType
+
+    @abstractmethod
+    def _get_payload(self, *args, **kwargs):
+        """
+        Retrieve a payload of multi-channel audio data.
+
+        Returns:
+            MultiChannelAudioDataType: The encapsulated audio data payload.
+        """
+
+    def get_payload(self, *args, **kwargs):
+        """
+        Fetch and return a payload of multi-channel audio data.
+
+        Returns:
+            MultiChannelAudioDataType: The encapsulated audio data payload.
+        """
+        return self._get_payload(*args, **kwargs)
 
 
 class SingleChannelPayloadSink(PayloadSink[SingleChannelAudioDataType]):
@@ -173,6 +403,16 @@ class SingleChannelPayloadSink(PayloadSink[SingleChannelAudioDataType]):
     This class defines methods to consume and store payloads containing single-channel audio data.
     """
 
+    @staticmethod
+    def input_data_type():
+        """
+        Specify the data type consumed by the sink.
+
+        Returns:
+            type: `SingleChannelAudioDataType`, representing single-channel audio.
+        """
+        return SingleChannelAudioDataType
+
     @abstractmethod
     def _send_payload(
         self, data: SingleChannelAudioDataType, context: ContextType, *args, **kwargs
@@ -195,6 +435,58 @@ class SingleChannelPayloadSink(PayloadSink[SingleChannelAudioDataType]):
         """
         self._send_payload(data, context, *args, **kwargs)
 
+    def _begin_stream(self, context: ContextType, *args, **kwargs):
+        """
+        Prepare the sink to receive a stream of chunks. Does nothing by default.
+
+        Args:
+            context (ContextType): The context associated with the stream.
+        """
+
+    def _send_chunk(
+        self, data: SingleChannelAudioDataType, context: ContextType, *args, **kwargs
+    ):
+        """
+        Consume one chunk of a stream. Sends it as a payload by default.
+
+        Args:
+            data (SingleChannelAudioDataType): The audio chunk to store.
+            context (ContextType): The context associated with the stream.
+        """
+        self._send_payload(data, context, *args, **kwargs)
+
+    def _end_stream(self, context: ContextType, *args, **kwargs):
+        """
+        Finalize a stream of chunks. Does nothing by default.
+
+        Args:
+            context (ContextType): The context associated with the stream.
+        """
+
+    def send_stream(
+        self,
+        chunks: Iterable[SingleChannelAudioDataType],
+        context: ContextType,
+        *args,
+        **kwargs,
+    ):
+        """
+        Consume and store a stream of single-channel audio chunks incrementally.
+
+        Each chunk is released before the next one is requested, so memory usage is
+        bounded by the chunk size. The stream is finalized even if a chunk fails.
+
+        Args:
+            chunks (Iterable[SingleChannelAudioDataType]): The audio chunks, in time order.
+            context (ContextType): The context associated with the stream.
+        """
+        self._begin_stream(context, *args, **kwargs)
+        try:
+            for chunk in chunks:
+                self._send_chunk(chunk, context, *args, **kwargs)
+        finally:
+            self._end_stream(context, *args, **kwargs)
+
 
 class DualChannelPayloadSink(PayloadSink):
     """
@@ -203,6 +495,16 @@ class DualChannelPayloadSink(PayloadSink):
     This class defines methods to consume and store payloads containing dual-channel audio data.
     """
 
+    @staticmethod
+    def input_data_type():
+        """
+        Specify the data type consumed by the sink.
+
+        Returns:
+            type: `DualChannelAudioDataType`, representing dual-channel audio.
+        """
+        return DualChannelAudioDataType
+
     @abstractmethod
     def _send_payload(
         self, data: DualChannelAudioDataType, context: ContextType, *args, **kwargs
@@ -224,3 +526,1165 @@ class DualChannelPayloadSink(PayloadSink):
             payload (DualChannelAudioDataType): The audio data payload to store.
         """
         self._send_payload(data, context, *args, **kwargs)
+
+    def _begin_stream(self, context: ContextType, *args, **kwargs):
+        """
+        Prepare the sink to receive a stream of chunks. Does nothing by default.
+
+        Args:
+            context (ContextType): The context associated with the stream.
+        """
+
+    def _send_chunk(
+        self, data: DualChannelAudioDataType, context: ContextType, *args, **kwargs
+    ):
+        """
+        Consume one chunk of a stream. Sends it as a payload by default.
+
+        Args:
+            data (DualChannelAudioDataType): The audio chunk to store.
+            context (ContextType): The context associated with the stream.
+        """
+        self._send_payload(data, context, *args, **kwargs)
+
+    def _end_stream(self, context: ContextType, *args, **kwargs):
+        """
+        Finalize a stream of chunks. Does nothing by default.
+
+        Args:
+            context (ContextType): The context associated with the stream.
+        """
+
+    def send_stream(
+        self,
+        chunks: Iterable[DualChannelAudioDataType],
+        context: ContextType,
+        *args,
+        **kwargs,
+    ):
+        """
+        Consume and store a stream of dual-channel audio chunks incrementally.
+
+        Each chunk is released before the next one is requested, so memory usage is
+        bounded by the chunk size. The stream is finalized even if a chunk fails.
+
+        Args:
+            chunks (Iterable[DualChannelAudioDataType]): The audio chunks, in time order.
+            context (ContextType): The context associated with the stream.
+        """
+        self._begin_stream(context, *args, **kwargs)
+        try:
+            for chunk in chunks:
+                self._send_chunk(chunk, context, *args, **kwargs)
+        finally:
+            self._end_stream(context, *args, **kwargs)
+
+
+class AsyncAudioSource(ABC):
+    """
+    Abstract base class for asynchronous audio data sources.
+
+    The asynchronous counterpart of the audio data sources, for sources waiting on
+    I/O (object stores, sockets, ...): `get_data` is a coroutine, so the event
+    loop runs other tasks while the data is retrieved.
+    """
+
+    @staticmethod
+    @abstractmethod
+    def output_data_type():
+        """
+        Specify the data type provided by the source.
+
+        Returns:
+            type: The audio data type.
+        """
+
+    @abstractmethod
+    async def _get_data(self, *args, **kwargs):
+        """
+        Retrieve audio data.
+
+        Returns:
+            BaseDataType: The encapsulated audio data.
+        """
+
+    async def get_data(self, *args, **kwargs):
+        """
+        Fetch and return audio data.
+
+        Returns:
+            BaseDataType: The encapsulated audio data.
+        """
+        return await self._get_data(*args, **kwargs)
+
+
+class AsyncSingleChannelAudioSource(AsyncAudioSource):
+    """
+    Abstract base class for asynchronous single-channel audio data sources.
+    """
+
+    @staticmethod
+    def output_data_type():
+        """
+        Specify the data type provided by the source.
+
+        Returns:
+            type: `SingleChannelAudioDataType`, representing single-channel audio.
+        """
+        return SingleChannelAudioDataType
+
+
+class AsyncDualChannelAudioSource(AsyncAudioSource):
+    """
+    Abstract base class for asynchronous dual-channel audio data sources.
+    """
+
+    @staticmethod
+    def output_data_type():
+        """
+        Specify the data type provided by the source.
+
+        Returns:
+            type: `DualChannelAudioDataType`, representing dual-channel audio.
+        """
+        return DualChannelAudioDataType
+
+
+class AsyncMultiChannelAudioSource(AsyncAudioSource):
+    """
+    Abstract base class for asynchronous multi-channel audio data sources.
+    """
+
+    @staticmethod
+    def output_data_type():
+        """
+        Specify the data type provided by the source.
+
+        Returns:
+            type: `MultiChannelAudioDataType`, representing multi-channel audio.
+        """
+        return MultiChannelAudioDataType
+
+
+class AsyncAudioPayloadSource(ABC):
+    """
+    Abstract base class for asynchronous audio payload sources.
+
+    The asynchronous counterpart of the audio payload sources: `get_payload` is a
+    coroutine returning the data and its context.
+    """
+
+    @staticmethod
+    @abstractmethod
+    def output_data_type():
+        """
+        Specify the data type provided by the source.
+
+        Returns:
+            type: The audio data type.
+        """
+
+    @abstractmethod
+    async def _get_payload(self, *args, **kwargs) -> Tuple[Any, ContextType]:
+        """
+        Retrieve a payload of audio data.
+
+        Returns:
+            Tuple[BaseDataType, ContextType]: The audio data and its context.
+        """
+
+    async def get_payload(self, *args, **kwargs) -> Tuple[Any, ContextType]:
+        """
+        Fetch and return a payload of audio data.
+
+        Returns:
+            Tuple[BaseDataType, ContextType]: The audio data and its context.
+        """
+        return await self._get_payload(*args, **kwargs)
+
+
+class AsyncSingleChannelPayloadSource(AsyncAudioPayloadSource):
+    """
+    Abstract base class for asynchronous single-channel audio payload sources.
+    """
+
+    @staticmethod
+    def output_data_type():
+        """
+        Specify the data type provided by the source.
+
+        Returns:
+            type: `SingleChannelAudioDataType`, representing single-channel audio.
+        """
+        return SingleChannelAudioDataType
+
+
+class AsyncDualChannelPayloadSource(AsyncAudioPayloadSource):
+    """
+    Abstract base class for asynchronous dual-channel audio payload sources.
+    """
+
+    @staticmethod
+    def output_data_type():
+        """
+        Specify the data type provided by the source.
+
+        Returns:
+            type: `DualChannelAudioDataType`, representing dual-channel audio.
+        """
+        return DualChannelAudioDataType
+
+
+class AsyncMultiChannelPayloadSource(AsyncAudioPayloadSource):
+    """
+    Abstract base class for asynchronous multi-channel audio payload sources.
+    """
+
+    @staticmethod
+    def output_data_type():
+        """
+        Specify the data type provided by the source.
+
+        Returns:
+            type: `MultiChannelAudioDataType`, representing multi-channel audio.
+        """
+        return MultiChannelAudioDataType
+
+
+class AsyncAudioPayloadSink(ABC):
+    """
+    Abstract base class for asynchronous audio payload sinks.
+
+    The asynchronous counterpart of the audio payload sinks: `send_payload` and
+    `send_stream` are coroutines, and streams may be asynchronous iterables.
+    """
+
+    @staticmethod
+    @abstractmethod
+    def input_data_type():
+        """
+        Specify the data type consumed by the sink.
+
+        Returns:
+            type: The audio data type.
+        """
+
+    @abstractmethod
+    async def _send_payload(self, data, context: ContextType, *args, **kwargs):
+        """
+        Consume a payload of audio data.
+
+        Args:
+            data (BaseDataType): The audio data to store.
+            context (ContextType): The context associated with the data.
+        """
+
+    async def send_payload(self, data, context: ContextType, *args, **kwargs):
+        """
+        Consume and store a payload of audio data.
+
+        Args:
+            data (BaseDataType): The audio data to store.
+            context (ContextType): The context associated with the data.
+        """
+        await self._send_payload(data, context, *args, **kwargs)
+
+    async def _begin_stream(self, context: ContextType, *args, **kwargs):
+        """
+        Prepare the sink to receive a stream of chunks. Does nothing by default.
+
+        Args:
+            context (ContextType): The context associated with the stream.
+        """
+
+    async def _send_chunk(self, data, context: ContextType, *args, **kwargs):
+        """
+        Consume one chunk of a stream. Sends it as a payload by default.
+
+        Args:
+            data (BaseDataType): The audio chunk to store.
+            context (ContextType): The context associated with the stream.
+        """
+        await self._send_payload(data, context, *args, **kwargs)
+
+    async def _end_stream(self, context: ContextType, *args, **kwargs):
+        """
+        Finalize a stream of chunks. Does nothing by default.
+
+        Args:
+            context (ContextType): The context associated with the stream.
+        """
+
+    async def send_stream(
+        self,
+        chunks: Union[Iterable[Any], AsyncIterable[Any]],
+        context: ContextType,
+        *args,
+        **kwargs,
+    ):
+        """
+        Consume and store a stream of audio chunks incrementally.
+
+        Each chunk is sent before the next one is requested. The stream is
+        finalized even if a chunk fails.
+
+        Args:
+            chunks (Union[Iterable, AsyncIterable]): The audio chunks, in time order.
+            context (ContextType): The context associated with the stream.
+        """
+        await self._begin_stream(context, *args, **kwargs)
+        try:
+            if isinstance(chunks, AsyncIterable):
+                async for chunk in chunks:
+                    await self._send_chunk(chunk, context, *args, **kwargs)
+            else:
+                for chunk in chunks:
+                    await self._send_chunk(chunk, context, *args, **kwargs)
+        finally:
+            await self._end_stream(context, *args, **kwargs)
+
+
+class AsyncSingleChannelPayloadSink(AsyncAudioPayloadSink):
+    """
+    Abstract base class for asynchronous single-channel audio payload sinks.
+    """
+
+    @staticmethod
+    def input_data_type():
+        """
+        Specify the data type consumed by the sink.
+
+        Returns:
+            type: `SingleChannelAudioDataType`, representing single-channel audio.
+        """
+        return SingleChannelAudioDataType
+
+
+class AsyncDualChannelPayloadSink(AsyncAudioPayloadSink):
+    """
+    Abstract base class for asynchronous dual-channel audio payload sinks.
+    """
+
+    @staticmethod
+    def input_data_type():
+        """
+        Specify the data type consumed by the sink.
+
+        Returns:
+            type: `DualChannelAudioDataType`, representing dual-channel audio.
+        """
+        return DualChannelAudioDataType
+
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_IEEE_FLOAT = 0x0003
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+class WavHeader(NamedTuple):
+    """
+    Layout information of a RIFF/WAVE file, as needed to map its samples.
+
+    Attributes:
+        sample_rate (int): Sampling frequency in Hz.
+        channels (int): Number of interleaved channels.
+        dtype (np.dtype): On-disk sample type (little-endian). 24-bit samples
+            are described as 3-byte void items.
+        data_offset (int): Byte offset of the first sample in the file.
+        frames (int): Number of sample frames (samples per channel).
+        sample_format (str): Name of the sample format (see `SAMPLE_FORMATS`).
+    """
+
+    sample_rate: int
+    channels: int
+    dtype: np.dtype
+    data_offset: int
+    frames: int
+    sample_format: str
+
+
+def read_wav_header(path: str) -> WavHeader:
+    """
+    Parse the RIFF chunks of a WAV file without reading its sample data.
+
+    Only the `fmt ` and `data` chunks are interpreted; any other chunk is skipped.
+
+    Args:
+        path (str): Path to the WAV file.
+
+    Returns:
+        WavHeader: The layout of the sample data inside the file.
+
+    Raises:
+        ValueError: If the file is not a WAV file or its sample format is not supported.
+    """
+    with open(path, "rb") as wav_file:
+        riff = wav_file.read(12)
+        if len(riff) < 12 or riff[0:4] != b"RIFF" or riff[8:12] != b"WAVE":
+            raise ValueError(f"{path} is not a RIFF/WAVE file.")
+
+        fmt = None
+        while True:
+            chunk_header = wav_file.read(8)
+            if len(chunk_header) < 8:
+                raise ValueError(f"{path} has no data chunk.")
+            chunk_id = chunk_header[0:4]
+            chunk_size = int.from_bytes(chunk_header[4:8], "little")
+            if chunk_id == b"fmt ":
+                fmt = wav_file.read(chunk_size)
+            elif chunk_id == b"data":
+                data_offset = wav_file.tell()
+                break
+            else:
+                wav_file.seek(chunk_size, 1)
+            # Chunks are word aligned
+            if chunk_size % 2:
+                wav_file.seek(1, 1)
+
+    if fmt is None:
+        raise ValueError(f"{path} has no fmt chunk before its data chunk.")
+
+    format_tag = int.from_bytes(fmt[0:2], "little")
+    channels = int.from_bytes(fmt[2:4], "little")
+    sample_rate = int.from_bytes(fmt[4:8], "little")
+    bits_per_sample = int.from_bytes(fmt[14:16], "little")
+    if format_tag == _WAVE_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+        # The actual format tag is the first two bytes of the sub-format GUID
+        format_tag = int.from_bytes(fmt[24:26], "little")
+
+    if format_tag == _WAVE_FORMAT_PCM and bits_per_sample in (8, 16, 24, 32):
+        sample_format = {8: "uint8", 16: "int16", 24: "int24", 32: "int32"}[
+            bits_per_sample
+        ]
+        dtype = np.dtype({8: "u1", 16: "<i2", 24: "V3", 32: "<i4"}[bits_per_sample])
+    elif format_tag == _WAVE_FORMAT_IEEE_FLOAT and bits_per_sample in (32, 64):
+        sample_format = {32: "float32", 64: "float64"}[bits_per_sample]
+        dtype = np.dtype({32: "<f4", 64: "<f8"}[bits_per_sample])
+    else:
+        raise ValueError(
+            f"Unsupported WAV sample format in {path}: "
+            f"format tag {format_tag:#06x}, {bits_per_sample} bits per sample."
+        )
+
+    # Streamed files may carry a placeholder data size, so trust the file size
+    data_size = min(chunk_size, os.path.getsize(path) - data_offset)
+    frames = data_size // (dtype.itemsize * channels)
+    return WavHeader(sample_rate, channels, dtype, data_offset, frames, sample_format)
+
+
+def _memmap_samples(
+    path: str, dtype: np.dtype, offset: int, frames: int, channels: int
+) -> np.ndarray:
+    """
+    Map the interleaved samples of a file as a read-only array.
+
+    Mono files are mapped as a 1-D array, all others as a (frames, channels) array.
+    Samples which do not start at a multiple of their size (e.g. float64 samples
+    after a 44-byte WAV header) cannot be mapped as an aligned array, so they are
+    read into memory instead.
+    """
+    shape = (frames,) if channels == 1 else (frames, channels)
+    if frames == 0:
+        return np.empty(shape, dtype=dtype)
+    if offset % dtype.itemsize:
+        samples = np.fromfile(path, dtype=dtype, count=frames * channels, offset=offset)
+        return samples.reshape(shape)
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape)
+
+
+def _read_int24_samples(
+    path: str, offset: int, frames: int, channels: int
+) -> np.ndarray:
+    """
+    Read packed little-endian 24-bit samples into int32 containers.
+
+    NumPy has no 24-bit type, so these samples cannot be memory-mapped: they are
+    converted in one pass, by copying each 3-byte sample into the upper bytes of
+    an int32 and shifting it back, which sign-extends it.
+    """
+    shape = (frames,) if channels == 1 else (frames, channels)
+    samples = np.zeros(shape, dtype="<i4")
+    if frames:
+        packed = np.memmap(
+            path, dtype=np.uint8, mode="r", offset=offset, shape=(samples.size, 3)
+        )
+        samples.reshape(-1).view(np.uint8).reshape(-1, 4)[:, 1:] = packed
+        samples >>= 8
+    return samples
+
+
+def _wav_samples(path: str, header: WavHeader) -> np.ndarray:
+    """
+    Map (or, for 24-bit files, read) the samples of a WAV file.
+    """
+    if header.sample_format == "int24":
+        return _read_int24_samples(
+            path, header.data_offset, header.frames, header.channels
+        )
+    return _memmap_samples(
+        path, header.dtype, header.data_offset, header.frames, header.channels
+    )
+
+
+def _raw_frame_count(path: str, dtype: np.dtype, offset: int, channels: int) -> int:
+    """
+    Compute the number of complete sample frames in a headerless file.
+    """
+    size = os.path.getsize(path)
+    if size < offset:
+        raise ValueError(f"Offset {offset} is beyond the end of {path}.")
+    return (size - offset) // (dtype.itemsize * channels)
+
+
+class WavSingleChannelAudioLoader(SingleChannelAudioSource):
+    """
+    Loads a mono WAV file as a memory-mapped `SingleChannelAudioDataType`.
+
+    The samples are not read when the file is opened: pages are loaded on demand
+    when an operation accesses them. Samples keep their on-disk format, except
+    24-bit samples, which are read into int32 containers. Samples not aligned to
+    their size in the file are read into memory.
+    """
+
+    def _get_data(self, path: str):
+        """
+        Map the samples of a mono WAV file.
+
+        Args:
+            path (str): Path to the WAV file.
+
+        Returns:
+            SingleChannelAudioDataType: The memory-mapped audio data.
+
+        Raises:
+            ValueError: If the file does not contain exactly one channel.
+        """
+        header = read_wav_header(path)
+        if header.channels != 1:
+            raise ValueError(f"Expected a single-channel WAV file, got {path}.")
+        return SingleChannelAudioDataType.from_external(
+            _wav_samples(path, header), header.sample_format
+        )
+
+
+class WavDualChannelAudioLoader(DualChannelAudioSource):
+    """
+    Loads a stereo WAV file as a memory-mapped `DualChannelAudioDataType`.
+
+    The interleaved samples are mapped as a (frames, 2) array, and pages are
+    loaded on demand when an operation accesses them. 24-bit samples are read
+    into int32 containers, and samples not aligned to their size in the file are
+    read into memory.
+    """
+
+    def _get_data(self, path: str):
+        """
+        Map the samples of a stereo WAV file.
+
+        Args:
+            path (str): Path to the WAV file.
+
+        Returns:
+            DualChannelAudioDataType: The memory-mapped audio data.
+
+        Raises:
+            ValueError: If the file does not contain exactly two channels.
+        """
+        header = read_wav_header(path)
+        if header.channels != 2:
+            raise ValueError(f"Expected a dual-channel WAV file, got {path}.")
+        return DualChannelAudioDataType.from_external(
+            _wav_samples(path, header), header.sample_format
+        )
+
+
+class WavSingleChannelPayloadLoader(SingleChannelPayloadSource):
+    """
+    Loads a mono WAV file as a memory-mapped payload.
+
+    The context of the payload holds the `sample_rate` of the file.
+    """
+
+    def _get_payload(self, path: str):
+        """
+        Map the samples of a mono WAV file and collect its sample rate.
+
+        Args:
+            path (str): Path to the WAV file.
+
+        Returns:
+            Tuple[SingleChannelAudioDataType, ContextType]: The audio data and its context.
+        """
+        data = WavSingleChannelAudioLoader().get_data(path)
+        return data, ContextType({"sample_rate": read_wav_header(path).sample_rate})
+
+
+class WavDualChannelPayloadLoader(DualChannelPayloadSource):
+    """
+    Loads a stereo WAV file as a memory-mapped payload.
+
+    The context of the payload holds the `sample_rate` of the file.
+    """
+
+    def _get_payload(self, path: str):
+        """
+        Map the samples of a stereo WAV file and collect its sample rate.
+
+        Args:
+            path (str): Path to the WAV file.
+
+        Returns:
+            Tuple[DualChannelAudioDataType, ContextType]: The audio data and its context.
+        """
+        data = WavDualChannelAudioLoader().get_data(path)
+        return data, ContextType({"sample_rate": read_wav_header(path).sample_rate})
+
+
+class RawSingleChannelAudioLoader(SingleChannelAudioSource):
+    """
+    Loads a headerless mono PCM file as a memory-mapped `SingleChannelAudioDataType`.
+    """
+
+    def _get_data(self, path: str, dtype: str = "<i2", offset: int = 0):
+        """
+        Map the samples of a headerless mono file.
+
+        Args:
+            path (str): Path to the raw file.
+            dtype (str): Numpy type string of the samples. Defaults to little-endian int16.
+            offset (int): Number of bytes to skip at the start of the file. Defaults to 0.
+
+        Returns:
+            SingleChannelAudioDataType: The memory-mapped audio data.
+        """
+        sample_type = np.dtype(dtype)
+        frames = _raw_frame_count(path, sample_type, offset, channels=1)
+        return SingleChannelAudioDataType.from_external(
+            _memmap_samples(path, sample_type, offset, frames, channels=1)
+        )
+
+
+class RawDualChannelAudioLoader(DualChannelAudioSource):
+    """
+    Loads a headerless, interleaved stereo PCM file as a memory-mapped
+    `DualChannelAudioDataType`.
+    """
+
+    def _get_data(self, path: str, dtype: str = "<i2", offset: int = 0):
+        """
+        Map the samples of a headerless, interleaved stereo file.
+
+        Args:
+            path (str): Path to the raw file.
+            dtype (str): Numpy type string of the samples. Defaults to little-endian int16.
+            offset (int): Number of bytes to skip at the start of the file. Defaults to 0.
+
+        Returns:
+            DualChannelAudioDataType: The memory-mapped audio data.
+        """
+        sample_type = np.dtype(dtype)
+        frames = _raw_frame_count(path, sample_type, offset, channels=2)
+        return DualChannelAudioDataType.from_external(
+            _memmap_samples(path, sample_type, offset, frames, channels=2)
+        )
+
+
+class WavMultiChannelAudioLoader(MultiChannelAudioSource):
+    """
+    Loads a WAV file with any number of channels as a memory-mapped
+    `MultiChannelAudioDataType`.
+
+    The interleaved samples are mapped as a (frames, channels) array, and pages
+    are loaded on demand when an operation accesses them. 24-bit samples are read
+    into int32 containers.
+    """
+
+    def _get_data(self, path: str):
+        """
+        Map the samples of a WAV file.
+
+        Args:
+            path (str): Path to the WAV file.
+
+        Returns:
+            MultiChannelAudioDataType: The memory-mapped audio data.
+        """
+        header = read_wav_header(path)
+        samples = _wav_samples(path, header).reshape(header.frames, header.channels)
+        return MultiChannelAudioDataType.from_external(samples, header.sample_format)
+
+
+class WavMultiChannelPayloadLoader(MultiChannelPayloadSource):
+    """
+    Loads a WAV file with any number of channels as a memory-mapped payload.
+
+    The context of the payload holds the `sample_rate` of the file.
+    """
+
+    def _get_payload(self, path: str):
+        """
+        Map the samples of a WAV file and collect its sample rate.
+
+        Args:
+            path (str): Path to the WAV file.
+
+        Returns:
+            Tuple[MultiChannelAudioDataType, ContextType]: The audio data and its context.
+        """
+        data = WavMultiChannelAudioLoader().get_data(path)
+        return data, ContextType({"sample_rate": read_wav_header(path).sample_rate})
+
+
+class RawMultiChannelAudioLoader(MultiChannelAudioSource):
+    """
+    Loads a headerless, interleaved PCM file with any number of channels as a
+    memory-mapped `MultiChannelAudioDataType`.
+    """
+
+    def _get_data(self, path: str, channels: int, dtype: str = "<i2", offset: int = 0):
+        """
+        Map the samples of a headerless, interleaved file.
+
+        Args:
+            path (str): Path to the raw file.
+            channels (int): Number of channels.
+            dtype (str): Numpy type string of the samples. Defaults to little-endian int16.
+            offset (int): Number of bytes to skip at the start of the file. Defaults to 0.
+
+        Returns:
+            MultiChannelAudioDataType: The memory-mapped audio data.
+        """
+        sample_type = np.dtype(dtype)
+        frames = _raw_frame_count(path, sample_type, offset, channels)
+        samples = _memmap_samples(path, sample_type, offset, frames, channels)
+        return MultiChannelAudioDataType.from_external(
+            samples.reshape(frames, channels)
+        )
+
+
+# Size of the file buffer of the audio sinks, and number of frames converted at once
+WRITE_BUFFER_SIZE = 1 << 20
+WRITE_BLOCK_FRAMES = 1 << 16
+
+# WAV format tag and bits per sample of each writable sample format
+_WAV_SAMPLE_FORMATS = {
+    "uint8": (_WAVE_FORMAT_PCM, 8),
+    "int16": (_WAVE_FORMAT_PCM, 16),
+    "int24": (_WAVE_FORMAT_PCM, 24),
+    "int32": (_WAVE_FORMAT_PCM, 32),
+    "float32": (_WAVE_FORMAT_IEEE_FLOAT, 32),
+    "float64": (_WAVE_FORMAT_IEEE_FLOAT, 64),
+}
+# Byte offsets of the RIFF and data chunk sizes in the header written by the sinks
+_WAV_RIFF_SIZE_OFFSET = 4
+_WAV_DATA_SIZE_OFFSET = 40
+_WAV_HEADER_SIZE = 44
+
+
+def _wav_header(
+    sample_format: str, channels: int, sample_rate: int, data_size: int
+) -> bytes:
+    """
+    Build the header of a WAV file with a 16-byte `fmt ` chunk and a data chunk.
+    """
+    format_tag, bits_per_sample = _WAV_SAMPLE_FORMATS[sample_format]
+    block_align = channels * bits_per_sample // 8
+    fields = [
+        b"RIFF",
+        (_WAV_HEADER_SIZE - 8 + data_size).to_bytes(4, "little"),
+        b"WAVEfmt ",
+        (16).to_bytes(4, "little"),
+        format_tag.to_bytes(2, "little"),
+        channels.to_bytes(2, "little"),
+        sample_rate.to_bytes(4, "little"),
+        (sample_rate * block_align).to_bytes(4, "little"),
+        block_align.to_bytes(2, "little"),
+        bits_per_sample.to_bytes(2, "little"),
+        b"data",
+        data_size.to_bytes(4, "little"),
+    ]
+    return b"".join(fields)
+
+
+class _AudioFileStream(NamedTuple):
+    """
+    An audio file being written by a sink.
+    """
+
+    file: Any
+    path: str
+
+
+class AudioFileSinkMixin:
+    """
+    Buffered writing of audio payloads to WAV or raw PCM files.
+
+    Each payload is written to the file given as `path`, through a large file
+    buffer. Samples are converted to the target sample format block by block,
+    into scratch buffers reused for every block, so writing allocates no
+    payload-sized temporaries; samples already in the target format (and
+    interleaved) are written without conversion. Float values, and integers
+    without a recorded sample format, are rounded and saturated to the range of
+    integer formats, as in `to_sample_format`.
+
+    Streams of chunks are appended to the same file as they arrive: the WAV
+    header is written first with placeholder sizes, which are filled in when the
+    stream ends.
+
+    With `background=True`, payloads and chunks are queued to a writer thread,
+    so writing overlaps with the processing of the next payloads; `send_payload`
+    only blocks while `max_queue` items are waiting. The samples of a queued
+    payload must not be modified until it is written (see `flush`). A failure
+    of the writer thread is raised by the next call to the sink.
+
+    Attributes:
+        sample_format (str): Name of the sample format of the files.
+        sample_rate (Optional[int]): Sampling frequency written to WAV files
+            whose context has no `sample_rate`.
+        background (bool): Whether a writer thread writes the files.
+        max_queue (int): Maximum number of items waiting for the writer thread.
+    """
+
+    _wav: bool = True
+    _channels: int = 1
+
+    def __init__(
+        self,
+        sample_format: str = "int16",
+        sample_rate: Optional[int] = None,
+        background: bool = False,
+        max_queue: int = 8,
+    ):
+        """
+        Initialize the sink.
+
+        Args:
+            sample_format (str): Name of the sample format of the files (see
+                `SAMPLE_FORMATS`). Defaults to "int16".
+            sample_rate (Optional[int]): Sampling frequency of WAV files whose
+                context has no `sample_rate`.
+            background (bool): Write the files from a writer thread. Defaults
+                to False.
+            max_queue (int): Maximum number of items waiting for the writer
+                thread. Defaults to 8.
+
+        Raises:
+            ValueError: If the sample format cannot be written.
+        """
+        if sample_format not in _WAV_SAMPLE_FORMATS:
+            raise ValueError(f"Cannot write samples in format '{sample_format}'.")
+        self.sample_format = sample_format
+        self.sample_rate = sample_rate
+        self.background = background
+        self.max_queue = max_queue
+        target = SAMPLE_FORMATS[sample_format]
+        self._target_dtype = target.dtype.newbyteorder("<")
+        self._stream: Optional[_AudioFileStream] = None
+        self._float_block: Optional[np.ndarray] = None
+        self._target_block: Optional[np.ndarray] = None
+        self._packed_block: Optional[np.ndarray] = None
+        self._queue: Optional[queue.Queue] = None
+        self._writer: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+
+    # Writer side: runs in the caller's thread, or in the writer thread
+
+    def _scratch(self, frames: int):
+        """
+        Views of the scratch buffers for a block of `frames` frames.
+        """
+        if self._float_block is None:
+            size = WRITE_BLOCK_FRAMES * self._channels
+            self._float_block = np.empty(size)
+            self._target_block = np.empty(size, dtype=self._target_dtype)
+            self._packed_block = np.empty((size, 3), dtype=np.uint8)
+        assert self._target_block is not None and self._packed_block is not None
+        shape = (frames,) if self._channels == 1 else (frames, self._channels)
+        size = frames * self._channels
+        return (
+            self._float_block[:size].reshape(shape),
+            self._target_block[:size].reshape(shape),
+            self._packed_block[:size],
+        )
+
+    def _encode(self, block: np.ndarray, source_format: Optional[str]):
+        """
+        Convert a block of samples to the bytes of the target sample format.
+        """
+        float_block, target_block, packed_block = self._scratch(len(block))
+        target = SAMPLE_FORMATS[self.sample_format]
+        if source_format == self.sample_format:
+            if block.dtype == self._target_dtype and block.flags.c_contiguous:
+                target_block = block
+            else:
+                np.copyto(target_block, block, casting="unsafe")
+        else:
+            if source_format is None:
+                np.copyto(float_block, block, casting="unsafe")
+            else:
+                source = SAMPLE_FORMATS[source_format]
+                np.subtract(block, source.offset, out=float_block, casting="unsafe")
+                if source.scale != 1.0:
+                    float_block *= source.scale
+            if target.dtype.kind != "f":
+                maximum = 1.0 / target.scale
+                float_block *= maximum
+                np.rint(float_block, out=float_block)
+                np.clip(float_block, -maximum, maximum - 1, out=float_block)
+                if target.offset:
+                    float_block += target.offset
+            np.copyto(target_block, float_block, casting="unsafe")
+        if self.sample_format == "int24":
+            # Keep the three low bytes of each little-endian int32 container
+            packed_block[:] = (
+                target_block.reshape(-1).view(np.uint8).reshape(-1, 4)[:, :3]
+            )
+            return packed_block
+        return target_block
+
+    def _write_samples(self, file, data) -> None:
+        """
+        Append the samples of audio data to a file.
+        """
+        samples = data.data
+        source_format = data.sample_format
+        for start in range(0, len(samples), WRITE_BLOCK_FRAMES):
+            block = samples[start : start + WRITE_BLOCK_FRAMES]
+            file.write(memoryview(self._encode(block, source_format)).cast("B"))
+
+    def _open(self, path: str, context: ContextType) -> Any:
+        """
+        Create a file and write its header, with placeholder sizes.
+        """
+        file = open(path, "wb", buffering=WRITE_BUFFER_SIZE)
+        if self._wav:
+            sample_rate = context.get_value("sample_rate") if context else None
+            sample_rate = sample_rate or self.sample_rate
+            if not sample_rate:
+                file.close()
+                raise ValueError(f"No sample rate to write {path}.")
+            file.write(
+                _wav_header(self.sample_format, self._channels, int(sample_rate), 0)
+            )
+        return file
+
+    def _finish(self, file, path: str) -> None:
+        """
+        Write the sizes of a WAV file into its header, and close the file.
+        """
+        try:
+            if self._wav:
+                data_size = file.tell() - _WAV_HEADER_SIZE
+                if data_size + _WAV_HEADER_SIZE - 8 > 0xFFFFFFFF:
+                    raise ValueError(f"{path} exceeds the 4 GiB limit of WAV files.")
+                if data_size % 2:
+                    # Chunks are word aligned
+                    file.write(b"\0")
+                riff_size = file.tell() - 8
+                file.seek(_WAV_RIFF_SIZE_OFFSET)
+                file.write(riff_size.to_bytes(4, "little"))
+                file.seek(_WAV_DATA_SIZE_OFFSET)
+                file.write(data_size.to_bytes(4, "little"))
+        finally:
+            file.close()
+
+    def _write_payload(self, data, context: ContextType, path: str) -> None:
+        file = self._open(path, context)
+        try:
+            self._write_samples(file, data)
+        except BaseException:
+            file.close()
+            raise
+        self._finish(file, path)
+
+    def _write_begin(self, context: ContextType, path: str) -> None:
+        if self._stream is not None:
+            raise ValueError(f"A stream to {self._stream.path} is already open.")
+        self._stream = _AudioFileStream(self._open(path, context), path)
+
+    def _write_chunk(self, data) -> None:
+        if self._stream is None:
+            raise ValueError("No stream is open.")
+        self._write_samples(self._stream.file, data)
+
+    def _write_end(self) -> None:
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            self._finish(stream.file, stream.path)
+
+    # Caller side
+
+    def _run_writer(self) -> None:
+        assert self._queue is not None
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                function, args = item
+                # Bound methods are created on access: compare them by equality
+                if self._error is None or function == self._write_end:
+                    function(*args)
+            # The thread must keep draining the queue: failures are re-raised to
+            # the caller on its next call instead
+            except BaseException as error:  # pylint: disable=broad-exception-caught
+                if self._error is None:
+                    self._error = error
+            finally:
+                self._queue.task_done()
+
+    def _raise_error(self) -> None:
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _submit(self, function, *args) -> None:
+        """
+        Run a write now, or queue it to the writer thread, raising the failure of
+        a previous write. The end of a stream is queued before raising, so the
+        file of a failed stream is still completed.
+        """
+        ends_stream = function == self._write_end
+        if not ends_stream:
+            self._raise_error()
+        if not self.background:
+            function(*args)
+            return
+        self._start_writer()
+        assert self._queue is not None
+        self._queue.put((function, args))
+        if ends_stream:
+            self._raise_error()
+
+    def _start_writer(self) -> None:
+        if self._writer is None:
+            self._queue = queue.Queue(maxsize=self.max_queue)
+            self._writer = threading.Thread(
+                target=self._run_writer, name="audio-file-sink", daemon=True
+            )
+            self._writer.start()
+
+    def _send_payload(self, data, context: ContextType, path: str):
+        """
+        Write audio data to a file, replacing it.
+
+        Args:
+            data (BaseDataType): The audio data.
+            context (ContextType): The context. Its `sample_rate` is written to
+                WAV files.
+            path (str): Path of the file.
+        """
+        self._submit(self._write_payload, data, context, path)
+
+    def _begin_stream(self, context: ContextType, path: str):
+        """
+        Create a file to which the chunks of a stream are appended.
+
+        Args:
+            context (ContextType): The context of the stream.
+            path (str): Path of the file.
+        """
+        self._submit(self._write_begin, context, path)
+
+    def _send_chunk(self, data, context: ContextType, path: str):
+        """
+        Append a chunk of a stream to its file.
+
+        Args:
+            data (BaseDataType): The audio chunk.
+            context (ContextType): The context of the stream.
+            path (str): Path of the file.
+        """
+        self._submit(self._write_chunk, data)
+
+    def _end_stream(self, context: ContextType, path: str):
+        """
+        Complete the file of a stream.
+
+        Args:
+            context (ContextType): The context of the stream.
+            path (str): Path of the file.
+        """
+        self._submit(self._write_end)
+
+    def flush(self) -> None:
+        """
+        Wait until every queued payload and chunk is written.
+
+        Raises:
+            Exception: The first failure of the writer thread since the last call.
+        """
+        if self._queue is not None:
+            self._queue.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """
+        Write the queued payloads and chunks, and stop the writer thread.
+
+        Raises:
+            Exception: The first failure of the writer thread since the last call.
+        """
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            assert self._queue is not None
+            self._queue.put(None)
+            writer.join()
+            self._queue = None
+        self._write_end()
+        self._raise_error()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class WavSingleChannelPayloadSink(AudioFileSinkMixin, SingleChannelPayloadSink):
+    """
+    Writes mono payloads to WAV files, with buffered writes and an optional
+    writer thread (see `AudioFileSinkMixin`).
+
+    The sample rate of a file is the `sample_rate` of the payload context.
+
+    Example:
+        >>> with WavSingleChannelPayloadSink("int16", background=True) as sink:
+        ...     sink.send_payload(data, context, "output.wav")
+    """
+
+    _wav = True
+    _channels = 1
+
+
+class WavDualChannelPayloadSink(AudioFileSinkMixin, DualChannelPayloadSink):
+    """
+    Writes stereo payloads to interleaved WAV files, with buffered writes and an
+    optional writer thread (see `AudioFileSinkMixin`). Planar data is
+    interleaved while it is converted.
+
+    The sample rate of a file is the `sample_rate` of the payload context.
+    """
+
+    _wav = True
+    _channels = 2
+
+
+class RawSingleChannelPayloadSink(AudioFileSinkMixin, SingleChannelPayloadSink):
+    """
+    Writes mono payloads to headerless, little-endian PCM files, with buffered
+    writes and an optional writer thread (see `AudioFileSinkMixin`).
+    """
+
+    _wav = False
+    _channels = 1
+
+
+class RawDualChannelPayloadSink(AudioFileSinkMixin, DualChannelPayloadSink):
+    """
+    Writes stereo payloads to headerless, interleaved, little-endian PCM files,
+    with buffered writes and an optional writer thread (see `AudioFileSinkMixin`).
+    """
+
+    _wav = False
+    _channels = 2
@@ -0,0 +1,457 @@
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+import numpy as np
+from semantiva.component_loader import ComponentLoader
+from semantiva.data_processors import DataOperation
+from semantiva_audio.data_types.data_types import (
+    SAMPLE_FORMATS,
+    SingleChannelAudioDataType,
+    DualChannelAudioDataType,
+    MultiChannelAudioDataType,
+)
+
+# Number of block latencies kept by a `RealtimeAudioProcessor` for its statistics
+REALTIME_LATENCY_HISTORY = 1024
+
+
+class AudioRingBuffer:
+    """
+    A preallocated ring buffer of audio frames between one producer and one consumer.
+
+    The producer (e.g. a capture callback) calls `write` and the consumer (e.g. a
+    playback callback) calls `read_into`, possibly from different threads, without
+    locking: each side only advances its own position, after copying the frames,
+    so the other side never sees a partially copied block. Frames are copied
+    into and out of the preallocated array, so neither call allocates sample
+    memory.
+
+    Writes beyond the free space are dropped (an overrun) and reads beyond the
+    available frames come short (an underrun); both are counted, in frames.
+
+    Attributes:
+        capacity (int): Number of frames the buffer holds.
+        channels (int): Number of channels. Frames of one channel are scalars,
+            others are rows of `channels` samples.
+        overruns (int): Number of frames dropped because the buffer was full.
+        underruns (int): Number of frames requested while the buffer was empty.
+        sample_format (Optional[str]): Name of the sample format of the samples,
+            or None if not given. Integer samples are PCM only with a format.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        channels: int = 1,
+        dtype=None,
+        sample_format: Optional[str] = None,
+    ):
+        """
+        Allocate the buffer.
+
+        Args:
+            capacity (int): Number of frames the buffer holds.
+            channels (int): Number of channels. Defaults to 1.
+            dtype (np.dtype): Type of the samples. Defaults to the storage type of
+                the sample format, or float64.
+            sample_format (Optional[str]): Name of the sample format (see
+                `SAMPLE_FORMATS`), e.g. "int16" for integer PCM. Defaults to None.
+
+        Raises:
+            ValueError: If the capacity or the number of channels is not positive,
+                or the dtype is not the storage type of the sample format.
+        """
+        if capacity <= 0 or channels <= 0:
+            raise ValueError("The capacity and number of channels must be positive.")
+        if sample_format is not None:
+            storage = SAMPLE_FORMATS[sample_format].dtype
+            if dtype is not None and np.dtype(dtype) != storage:
+                raise ValueError(
+                    f"Sample format {sample_format} is stored as {storage}, "
+                    f"got {np.dtype(dtype)}."
+                )
+            dtype = storage
+        self.capacity = capacity
+        self.channels = channels
+        self.sample_format = sample_format
+        self.overruns = 0
+        self.underruns = 0
+        shape = (capacity,) if channels == 1 else (capacity, channels)
+        self._frames = np.zeros(shape, dtype=np.float64 if dtype is None else dtype)
+        # Total numbers of frames written and read, each advanced by one side only
+        self._written = 0
+        self._read = 0
+
+    @property
+    def dtype(self) -> np.dtype:
+        """
+        Type of the samples.
+        """
+        return self._frames.dtype
+
+    @property
+    def available(self) -> int:
+        """
+        Number of frames ready to be read.
+        """
+        return self._written - self._read
+
+    @property
+    def free(self) -> int:
+        """
+        Number of frames that can be written.
+        """
+        return self.capacity - (self._written - self._read)
+
+    def _check_frames(self, samples: np.ndarray) -> None:
+        expected = 1 if self.channels == 1 else 2
+        if samples.ndim != expected or (
+            self.channels > 1 and samples.shape[1] != self.channels
+        ):
+            raise ValueError(
+                f"Expected frames of {self.channels} channel(s), "
+                f"got a {samples.shape} array."
+            )
+
+    def write(self, samples: np.ndarray) -> int:
+        """
+        Copy frames into the buffer, dropping those which do not fit.
+
+        Args:
+            samples (np.ndarray): The frames, shaped (frames,) for one channel or
+                (frames, channels).
+
+        Returns:
+            int: The number of frames written.
+
+        Raises:
+            ValueError: If the frames do not have the channels of the buffer.
+        """
+        self._check_frames(samples)
+        frames = min(len(samples), self.free)
+        self.overruns += len(samples) - frames
+        start = self._written % self.capacity
+        head = min(frames, self.capacity - start)
+        self._frames[start : start + head] = samples[:head]
+        self._frames[: frames - head] = samples[head:frames]
+        self._written += frames
+        return frames
+
+    def read_into(self, out: np.ndarray) -> int:
+        """
+        Copy the oldest frames into an array, up to its length.
+
+        Args:
+            out (np.ndarray): The array to fill, shaped (frames,) for one channel
+                or (frames, channels). Frames beyond the available ones are left
+                unchanged.
+
+        Returns:
+            int: The number of frames read.
+
+        Raises:
+            ValueError: If the array does not have the channels of the buffer.
+        """
+        self._check_frames(out)
+        frames = min(len(out), self.available)
+        self.underruns += len(out) - frames
+        start = self._read % self.capacity
+        head = min(frames, self.capacity - start)
+        out[:head] = self._frames[start : start + head]
+        out[head:frames] = self._frames[: frames - head]
+        self._read += frames
+        return frames
+
+
+def _pcm_format(buffer: AudioRingBuffer) -> Optional[str]:
+    """
+    Return the PCM sample format of ring buffer samples, or None for float samples
+    and integers without a sample format.
+    """
+    return None if buffer.dtype.kind == "f" else buffer.sample_format
+
+
+class RealtimeStats(NamedTuple):
+    """
+    Latency statistics of a `RealtimeAudioProcessor`.
+
+    Attributes:
+        blocks (int): Number of blocks processed.
+        deadline (float): Processing deadline of a block, in seconds.
+        deadline_misses (int): Number of blocks processed in more than the deadline.
+        mean_latency (float): Mean processing latency of the recent blocks, in seconds.
+        p99_latency (float): 99th percentile of the recent latencies, in seconds.
+        max_latency (float): Largest latency of all blocks, in seconds.
+    """
+
+    blocks: int
+    deadline: float
+    deadline_misses: int
+    mean_latency: float
+    p99_latency: float
+    max_latency: float
+
+
+class RealtimeAudioProcessor:
+    """
+    Run audio operations block by block between two ring buffers, in real time.
+
+    Each call to `process_available` (typically from the capture callback, or a
+    processing thread woken by it) takes every complete block from the input
+    buffer, runs the operations of the node configuration on it, and writes the
+    result to the output buffer. The operations process the blocks as one stream
+    (see `AudioStreamMixin.start_stream`), so filters carry their state from one
+    block to the next.
+
+    No sample memory is allocated per block once the first block has been
+    processed: blocks are read into a preallocated array, and the operations
+    which keep the shape of the block write into preallocated buffers through
+    `process_into`. Operations changing the number of frames (e.g. resamplers),
+    or not writing into output buffers, allocate their result every block, and
+    debug logging formats messages for every operation call.
+
+    Ring buffers of integer samples with a sample format (e.g. "int16") hold PCM:
+    blocks are normalized to float32 in [-1, 1) before the operations, and
+    results are rounded and saturated back to the format of the output buffer,
+    both through preallocated buffers. Integer samples without a sample format
+    are plain numbers, like in the audio data types: blocks reach the operations
+    unscaled, and results are only rounded and saturated to the range of the
+    output dtype.
+
+    The time taken by each block, from reading it to writing its result, is
+    measured with `clock` and compared to the deadline, the duration of a block
+    by default. Passing a synthetic clock makes the measurements deterministic.
+
+    Attributes:
+        block_size (int): Number of frames per block.
+        sample_rate (float): Sampling frequency, in Hz.
+        deadline (float): Processing deadline of a block, in seconds.
+        input_buffer (AudioRingBuffer): The buffer blocks are read from.
+        output_buffer (AudioRingBuffer): The buffer results are written to.
+    """
+
+    def __init__(
+        self,
+        node_configurations: List[Dict],
+        input_buffer: AudioRingBuffer,
+        output_buffer: AudioRingBuffer,
+        block_size: int,
+        sample_rate: float,
+        deadline: Optional[float] = None,
+        clock: Callable[[], float] = time.perf_counter,
+        history: int = REALTIME_LATENCY_HISTORY,
+    ):
+        """
+        Initialize the processor and start the streams of its operations.
+
+        Args:
+            node_configurations (List[Dict]): The operations, as pipeline node
+                configurations with a `processor` (class or class name) and
+                optional `parameters`.
+            input_buffer (AudioRingBuffer): The buffer blocks are read from.
+            output_buffer (AudioRingBuffer): The buffer results are written to.
+            block_size (int): Number of frames per block.
+            sample_rate (float): Sampling frequency, in Hz.
+            deadline (Optional[float]): Processing deadline of a block, in seconds.
+                Defaults to the duration of a block.
+            clock (Callable[[], float]): Clock measuring the latencies, in seconds.
+                Defaults to `time.perf_counter`.
+            history (int): Number of recent latencies kept for the statistics.
+                Defaults to `REALTIME_LATENCY_HISTORY`.
+
+        Raises:
+            ValueError: If the block size is not positive or does not fit in the
+                input buffer, or a processor is not a data operation.
+        """
+        if not 0 < block_size <= input_buffer.capacity:
+            raise ValueError(
+                f"The block size must be positive and at most the input buffer "
+                f"capacity ({input_buffer.capacity}), got {block_size}."
+            )
+        self.block_size = block_size
+        self.sample_rate = sample_rate
+        self.deadline = block_size / sample_rate if deadline is None else deadline
+        self.input_buffer = input_buffer
+        self.output_buffer = output_buffer
+        self._clock = clock
+
+        self._nodes: List[Any] = []
+        for node in node_configurations:
+            processor = node["processor"]
+            if isinstance(processor, str):
+                processor = ComponentLoader.get_class(processor)
+            if not (
+                isinstance(processor, type) and issubclass(processor, DataOperation)
+            ):
+                raise ValueError(f"{processor} is not a data operation.")
+            operation = processor()
+            if hasattr(operation, "start_stream"):
+                operation.start_stream()
+            self._nodes.append((operation, dict(node.get("parameters", {}))))
+
+        channels = input_buffer.channels
+        self._data_type: Any = (
+            SingleChannelAudioDataType
+            if channels == 1
+            else (
+                DualChannelAudioDataType if channels == 2 else MultiChannelAudioDataType
+            )
+        )
+        shape = (block_size,) if channels == 1 else (block_size, channels)
+        self._block = np.empty(shape, dtype=input_buffer.dtype)
+        self._input_format = _pcm_format(input_buffer)
+        self._output_format = _pcm_format(output_buffer)
+        # Normalized input block, and output block being converted to PCM
+        self._float_block = (
+            None if self._input_format is None else np.empty(shape, dtype=np.float32)
+        )
+        self._pcm_block: Optional[np.ndarray] = None
+        # Output buffer of each node, allocated from the output of its first block,
+        # or None if the node cannot write into a buffer
+        self._buffers: Optional[List[Optional[np.ndarray]]] = None
+
+        self._latencies = np.zeros(history)
+        self.blocks = 0
+        self.deadline_misses = 0
+        self.max_latency = 0.0
+
+    def _run_nodes(self, data: Any) -> Any:
+        """
+        Run the operations on a block, allocating their buffers on the first block.
+        """
+        if self._buffers is None:
+            buffers: List[Optional[np.ndarray]] = []
+            for operation, parameters in self._nodes:
+                output = operation.process(data, **parameters)
+                fixed_shape = output.data.shape == data.data.shape
+                buffers.append(
+                    np.empty_like(output.data)
+                    if fixed_shape and hasattr(operation, "process_into")
+                    else None
+                )
+                data = output
+            self._buffers = buffers
+            return data
+        for (operation, parameters), buffer in zip(self._nodes, self._buffers):
+            if buffer is None:
+                data = operation.process(data, **parameters)
+            else:
+                data = operation.process_into(data, buffer, **parameters)
+        return data
+
+    def _normalized(self) -> np.ndarray:
+        """
+        Return the block read from the input buffer, normalized if it holds PCM.
+        """
+        if self._float_block is None:
+            return self._block
+        assert self._input_format is not None
+        sample_format = SAMPLE_FORMATS[self._input_format]
+        # Casting copies, unlike casting ufuncs, need no temporary buffer
+        np.copyto(self._float_block, self._block, casting="unsafe")
+        if sample_format.offset:
+            self._float_block -= sample_format.offset
+        self._float_block *= sample_format.scale
+        return self._float_block
+
+    def _encoded(self, output: Any) -> np.ndarray:
+        """
+        Return the samples of a result, converted to PCM if the output buffer holds
+        PCM, or rounded and saturated to the range of its integer dtype.
+        """
+        dtype = self.output_buffer.dtype
+        if dtype.kind == "f" or (
+            self._output_format is None and output.data.dtype == dtype
+        ):
+            return output.data
+        samples = output.data if output.data.dtype.kind == "f" else output.as_float()
+        if self._pcm_block is None or self._pcm_block.shape != samples.shape:
+            self._pcm_block = np.empty(samples.shape)
+        pcm = self._pcm_block
+        np.copyto(pcm, samples)
+        if self._output_format is None:
+            limits = np.iinfo(dtype)
+            low, high, offset = float(limits.min), float(limits.max), 0
+        else:
+            sample_format = SAMPLE_FORMATS[self._output_format]
+            high = 1.0 / sample_format.scale
+            pcm *= high
+            low, high, offset = -high, high - 1, sample_format.offset
+        np.rint(pcm, out=pcm)
+        np.clip(pcm, low, high, out=pcm)
+        pcm += offset
+        return pcm
+
+    def process_block(self) -> bool:
+        """
+        Process one block, if a complete block is available.
+
+        Returns:
+            bool: Whether a block was processed.
+        """
+        if self.input_buffer.available < self.block_size:
+            return False
+        start = self._clock()
+        self.input_buffer.read_into(self._block)
+        output = self._run_nodes(self._data_type.from_validated(self._normalized()))
+        self.output_buffer.write(self._encoded(output))
+        latency = self._clock() - start
+
+        self._latencies[self.blocks % len(self._latencies)] = latency
+        self.blocks += 1
+        if latency > self.deadline:
+            self.deadline_misses += 1
+        if latency > self.max_latency:
+            self.max_latency = latency
+        return True
+
+    def process_available(self) -> int:
+        """
+        Process every complete block of the input buffer.
+
+        Returns:
+            int: The number of blocks processed.
+        """
+        count = 0
+        while self.process_block():
+            count += 1
+        return count
+
+    def stats(self) -> RealtimeStats:
+        """
+        Return the latency statistics of the blocks processed so far.
+
+        Returns:
+            RealtimeStats: The statistics.
+        """
+        recent = self._latencies[: min(self.blocks, len(self._latencies))]
+        has_recent = len(recent) > 0
+        return RealtimeStats(
+            self.blocks,
+            self.deadline,
+            self.deadline_misses,
+            float(recent.mean()) if has_recent else 0.0,
+            float(np.percentile(recent, 99)) if has_recent else 0.0,
+            self.max_latency,
+        )
+
+    def reset_stats(self) -> None:
+        """
+        Reset the latency statistics, e.g. after a warm-up period.
+        """
+        self.blocks = 0
+        self.deadline_misses = 0
+        self.max_latency = 0.0
+
+    def close(self) -> None:
+        """
+        Stop the streams of the operations, dropping their state.
+        """
+        for operation, _ in self._nodes:
+            if hasattr(operation, "stop_stream"):
+                operation.stop_stream()
+
+    def __enter__(self) -> "RealtimeAudioProcessor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -1 +1,16 @@
-from .data_types import SingleChannelAudioDataType, DualChannelAudioDataType
+from .data_types import (
+    SingleChannelAudioDataType,
+    DualChannelAudioDataType,
+    MultiChannelAudioDataType,
+    SpectrogramDataType,
+    SingleChannelAudioBatchDataType,
+    DualChannelAudioBatchDataType,
+    SampleFormat,
+    SAMPLE_FORMATS,
+    infer_sample_format,
+    INTERLEAVED,
+    PLANAR,
+    CHANNEL_LAYOUTS,
+    channel_layout,
+)
+from .shared_memory import SharedAudioBuffer
@@ -1,8 +1,350 @@
+from typing import Dict, Iterator, NamedTuple, Optional
 import numpy as np
-from semantiva.data_types import BaseDataType
+from semantiva.data_types import BaseDataType, DataCollectionType
+from semantiva_audio.data_types.shared_memory import AudioSharedMemoryMixin
 
+# Sample dtype kinds accepted by the audio data types: signed, unsigned and float
+_SAMPLE_KINDS = "iuf"
 
-class SingleChannelAudioDataType(BaseDataType[np.ndarray]):
+
+class SampleFormat(NamedTuple):
+    """
+    Storage format of audio samples.
+
+    Stored samples `x` represent the float values `(x - offset) * scale`, in [-1, 1)
+    for PCM formats.
+
+    Attributes:
+        name (str): Name of the format.
+        dtype (np.dtype): Type of the array holding the samples.
+        scale (float): Scale from stored values to float values.
+        offset (int): Stored value representing silence.
+    """
+
+    name: str
+    dtype: np.dtype
+    scale: float
+    offset: int
+
+
+SAMPLE_FORMATS: Dict[str, SampleFormat] = {
+    "uint8": SampleFormat("uint8", np.dtype(np.uint8), 2.0**-7, 128),
+    "int16": SampleFormat("int16", np.dtype(np.int16), 2.0**-15, 0),
+    # 24-bit samples are held in the low bits of int32 containers
+    "int24": SampleFormat("int24", np.dtype(np.int32), 2.0**-23, 0),
+    "int32": SampleFormat("int32", np.dtype(np.int32), 2.0**-31, 0),
+    "float32": SampleFormat("float32", np.dtype(np.float32), 1.0, 0),
+    "float64": SampleFormat("float64", np.dtype(np.float64), 1.0, 0),
+}
+
+# Format inferred from the array dtype when none is given (int32 is never int24)
+_DEFAULT_SAMPLE_FORMATS = ("uint8", "int16", "int32", "float32", "float64")
+
+
+# Memory layouts of multi-channel samples, which are always indexed (samples, channels)
+INTERLEAVED = "interleaved"  # Frame-major: the samples of a frame are adjacent
+PLANAR = "planar"  # Channel-major: the samples of a channel are adjacent
+CHANNEL_LAYOUTS = (INTERLEAVED, PLANAR)
+
+
+def channel_layout(data: np.ndarray) -> str:
+    """
+    Return the memory layout of (samples, channels) data.
+
+    Data is planar when consecutive samples of a channel are adjacent in memory,
+    as in the transpose of a C-contiguous (channels, samples) array. Everything
+    else, including the ambiguous single-frame case, is reported as interleaved.
+    """
+    if data.ndim >= 2 and data.shape[0] > 1 and data.strides[0] == data.itemsize:
+        return PLANAR
+    return INTERLEAVED
+
+
+def _same_storage(first: np.dtype, second: np.dtype) -> bool:
+    """
+    Whether two dtypes store samples the same way, regardless of byte order.
+    """
+    return first.kind == second.kind and first.itemsize == second.itemsize
+
+
+def infer_sample_format(dtype) -> Optional[str]:
+    """
+    Return the name of the default sample format of a dtype, or None if it has none.
+    """
+    dtype = np.dtype(dtype)
+    for name in _DEFAULT_SAMPLE_FORMATS:
+        if _same_storage(SAMPLE_FORMATS[name].dtype, dtype):
+            return name
+    return None
+
+
+def _validate_samples(
+    data, ndim: int, message: str, sample_format: Optional[str] = None
+) -> None:
+    """
+    Check that `data` is an aligned, numeric ndarray with `ndim` dimensions,
+    stored as required by `sample_format` if one is given.
+
+    Raises:
+        AssertionError: If any of the checks fails.
+    """
+    assert isinstance(data, np.ndarray), "Data must be a numpy ndarray."
+    assert data.ndim == ndim, message
+    assert (
+        data.dtype.kind in _SAMPLE_KINDS
+    ), f"Data must hold integer or float samples, got {data.dtype}."
+    assert data.flags.aligned, "Data must be aligned in memory."
+    if sample_format is not None:
+        assert (
+            sample_format in SAMPLE_FORMATS
+        ), f"Unknown sample format '{sample_format}'."
+        assert _same_storage(
+            SAMPLE_FORMATS[sample_format].dtype, data.dtype
+        ), f"Sample format '{sample_format}' cannot be stored as {data.dtype}."
+
+
+class AudioDataConstructionMixin:
+    """
+    Alternative constructors for audio data types, depending on how far the data
+    can be trusted.
+
+    - `from_external` is meant for pipeline boundaries (sources, user input). On
+      top of the regular validation, it requires contiguous samples, so that
+      strided data is rejected once instead of slowing down every later node.
+    - `from_validated` skips validation altogether. Operations use it for outputs
+      derived from already validated inputs.
+    """
+
+    _data: np.ndarray
+    _sample_format: Optional[str] = None
+
+    @classmethod
+    def from_external(cls, data: np.ndarray, sample_format: Optional[str] = None):
+        """
+        Create an instance from data entering the pipeline.
+
+        Args:
+            data (np.ndarray): The samples to encapsulate.
+            sample_format (Optional[str]): The sample format. Defaults to the format
+                inferred from the dtype.
+
+        Raises:
+            AssertionError: If the data is invalid or not contiguous in memory.
+        """
+        instance = cls(data, sample_format)  # type: ignore[call-arg]
+        assert (
+            data.flags.c_contiguous or data.flags.f_contiguous
+        ), "Data entering the pipeline must be contiguous in memory."
+        return instance
+
+    @classmethod
+    def from_validated(cls, data: np.ndarray, sample_format: Optional[str] = None):
+        """
+        Create an instance without validating the data.
+
+        Only use it with samples derived from a validated instance of the same type
+        (same number of dimensions, numeric dtype).
+
+        Args:
+            data (np.ndarray): The samples to encapsulate.
+            sample_format (Optional[str]): The sample format. Defaults to the format
+                inferred from the dtype.
+        """
+        instance = cls.__new__(cls)
+        instance._data = data
+        instance._sample_format = sample_format
+        return instance
+
+
+class AudioSampleFormatMixin:
+    """
+    Sample format support for audio data types.
+
+    Samples are kept in their storage format (e.g. int16 PCM), which is 2 to 4
+    times smaller than float64. `as_float` converts them only when an operation
+    needs float samples.
+
+    Integer samples are PCM only when their sample format is recorded: given
+    explicitly, e.g. by the file loaders or `to_sample_format`. Integer samples
+    without one are plain numbers, never scaled, whatever their dtype.
+    """
+
+    _data: np.ndarray
+    _sample_format: Optional[str] = None
+
+    @property
+    def sample_format(self) -> Optional[str]:
+        """
+        Name of the sample format: the recorded one, or the format of float
+        samples. None for integer samples without a recorded format.
+        """
+        if self._sample_format is None and self._data.dtype.kind == "f":
+            return infer_sample_format(self._data.dtype)
+        return self._sample_format
+
+    @property
+    def recorded_sample_format(self) -> Optional[str]:
+        """
+        Name of the sample format given explicitly, or None if it was not given
+        (even for float samples).
+        """
+        return self._sample_format
+
+    @property
+    def scale(self) -> float:
+        """
+        Scale from stored sample values to float values.
+        """
+        sample_format = self.sample_format
+        return 1.0 if sample_format is None else SAMPLE_FORMATS[sample_format].scale
+
+    def as_float(self, dtype=None) -> np.ndarray:
+        """
+        Return the samples as floats, converting integer PCM to [-1, 1).
+
+        Float samples are returned as they are (without copy) unless another float
+        dtype is requested. Integer samples are converted in a single pass,
+        without scaling if they have no recorded sample format.
+
+        Args:
+            dtype (np.dtype): The float type of the result. Defaults to the type of
+                float samples, float32 for integer PCM, or float64 for integers
+                without a sample format, which it holds exactly up to 2**53.
+
+        Returns:
+            np.ndarray: The float samples.
+        """
+        data = self._data
+        if data.dtype.kind == "f":
+            return data if dtype is None or data.dtype == dtype else data.astype(dtype)
+        sample_format = self.sample_format
+        if sample_format is None:
+            return data.astype(np.float64 if dtype is None else dtype)
+        dtype = np.float32 if dtype is None else dtype
+        sample_format_info = SAMPLE_FORMATS[sample_format]
+        if sample_format_info.offset:
+            samples = np.subtract(data, sample_format_info.offset, dtype=dtype)
+            return np.multiply(samples, sample_format_info.scale, out=samples)
+        return np.multiply(data, sample_format_info.scale, dtype=dtype)
+
+    def to_sample_format(self, sample_format: str):
+        """
+        Convert the samples to another storage format.
+
+        Float values, and integers without a recorded sample format, are rounded
+        and saturated to the range of integer formats. The result records the
+        format.
+
+        Args:
+            sample_format (str): Name of the target format.
+
+        Returns:
+            The same audio data type, holding the converted samples.
+        """
+        target = SAMPLE_FORMATS[sample_format]
+        if sample_format == self.sample_format:
+            return self
+        # Unrecorded integers are plain numbers: as_float does not scale them
+        samples = self.as_float(np.float64)
+        if target.dtype.kind == "f":
+            converted = samples.astype(target.dtype)
+        else:
+            maximum = 1.0 / target.scale
+            converted = np.rint(samples * maximum)
+            np.clip(converted, -maximum, maximum - 1, out=converted)
+            converted = (converted + target.offset).astype(target.dtype)
+        return type(self).from_validated(  # type: ignore[attr-defined]
+            converted, sample_format
+        )
+
+
+class AudioChannelLayoutMixin:
+    """
+    Memory layout support for multi-channel audio data types.
+
+    Samples are always indexed (samples, channels), but can be stored either
+    interleaved, with the samples of a frame adjacent in memory (the usual layout
+    of audio files), or planar, with each channel contiguous. Planar storage makes
+    per-channel processing (filters, resamplers, transforms) read contiguous
+    memory instead of strided views. Conversions copy the samples once; the data
+    is returned unchanged when it already has the requested layout.
+    """
+
+    _data: np.ndarray
+    _sample_format: Optional[str] = None
+
+    @classmethod
+    def from_planar(cls, data: np.ndarray, sample_format: Optional[str] = None):
+        """
+        Create an instance from (channels, samples) data entering the pipeline.
+
+        The samples are not copied: the instance holds a planar view of them.
+
+        Args:
+            data (np.ndarray): The samples, with one row per channel.
+            sample_format (Optional[str]): The sample format. Defaults to the format
+                inferred from the dtype.
+
+        Raises:
+            AssertionError: If the data is invalid or not contiguous in memory.
+        """
+        return cls.from_external(data.T, sample_format)  # type: ignore[attr-defined]
+
+    @property
+    def layout(self) -> str:
+        """
+        Memory layout of the samples, either `INTERLEAVED` or `PLANAR`.
+        """
+        return channel_layout(self._data)
+
+    def to_layout(self, layout: str):
+        """
+        Return the audio data stored with the requested memory layout.
+
+        Args:
+            layout (str): Either `INTERLEAVED` or `PLANAR`.
+
+        Returns:
+            The same audio data type: this instance if it already has the layout,
+            otherwise a copy with the samples rearranged.
+
+        Raises:
+            ValueError: If the layout is unknown.
+        """
+        if layout not in CHANNEL_LAYOUTS:
+            raise ValueError(
+                f"Unknown channel layout '{layout}', expected one of {CHANNEL_LAYOUTS}."
+            )
+        if layout == self.layout:
+            return self
+        if layout == PLANAR:
+            converted = np.ascontiguousarray(np.moveaxis(self._data, 0, -1))
+            converted = np.moveaxis(converted, -1, 0)
+        else:
+            converted = np.ascontiguousarray(self._data)
+        return type(self).from_validated(  # type: ignore[attr-defined]
+            converted, self._sample_format
+        )
+
+    def channel(self, index: int) -> np.ndarray:
+        """
+        Return a view of the samples of one channel, contiguous for planar data.
+
+        Args:
+            index (int): Index of the channel.
+
+        Returns:
+            np.ndarray: The samples of the channel.
+        """
+        return self._data[..., index]
+
+
+class SingleChannelAudioDataType(
+    AudioSharedMemoryMixin,
+    AudioSampleFormatMixin,
+    AudioDataConstructionMixin,
+    BaseDataType[np.ndarray],
+):
     """
     Represents single-channel audio data.
 
@@ -13,46 +355,367 @@ class SingleChannelAudioDataType(BaseDataType[np.ndarray]):
         _data (np.ndarray): The encapsulated single-channel audio data.
     """
 
-    def __init__(self, data: np.ndarray, *args, **kwargs):
+    def __init__(
+        self, data: np.ndarray, sample_format: Optional[str] = None, *args, **kwargs
+    ):
         """
         Initialize the SingleChannelAudioDataType with the provided data.
 
         Args:
             data (np.ndarray): The single-channel audio data to encapsulate.
+            sample_format (Optional[str]): Storage format of the samples (see
+                `SAMPLE_FORMATS`). Defaults to the format inferred from the dtype.
 
         Raises:
-            AssertionError: If the input data is not a numpy ndarray.
+            AssertionError: If the input data is not an aligned, numeric numpy ndarray.
         """
+        self._sample_format = sample_format
         super().__init__(data)
 
     def validate(self, data):
-        assert isinstance(data, np.ndarray), "Data must be a numpy ndarray."
-        assert data.ndim == 1, "Data must be single channel ndarray."
+        _validate_samples(
+            data, 1, "Data must be single channel ndarray.", self._sample_format
+        )
 
 
-class DualChannelAudioDataType(BaseDataType[np.ndarray]):
+class DualChannelAudioDataType(
+    AudioSharedMemoryMixin,
+    AudioChannelLayoutMixin,
+    AudioSampleFormatMixin,
+    AudioDataConstructionMixin,
+    BaseDataType[np.ndarray],
+):
     """
     Represents dual-channel (stereo) audio data.
 
     This class encapsulates audio data in a dual-channel format, ensuring
-    type consistency and providing a base for operations on such data.
+    type consistency and providing a base for operations on such data. The data
+    is shaped (samples, 2), and stored either interleaved or planar (see
+    `AudioChannelLayoutMixin`).
 
     Attributes:
         _data (np.ndarray): The encapsulated dual-channel audio data.
     """
 
-    def __init__(self, data: np.ndarray, *args, **kwargs):
+    def __init__(
+        self, data: np.ndarray, sample_format: Optional[str] = None, *args, **kwargs
+    ):
         """
         Initialize the DualChannelAudioDataType with the provided data.
 
         Args:
             data (np.ndarray): The dual-channel audio data to encapsulate.
+            sample_format (Optional[str]): Storage format of the samples (see
+                `SAMPLE_FORMATS`). Defaults to the format inferred from the dtype.
+
+        Raises:
+            AssertionError: If the input data is not an aligned, numeric numpy ndarray.
+        """
+        self._sample_format = sample_format
+        super().__init__(data)
+
+    def validate(self, data):
+        _validate_samples(
+            data, 2, "Data must be dual channel ndarray.", self._sample_format
+        )
+
+
+class MultiChannelAudioDataType(
+    AudioSharedMemoryMixin,
+    AudioChannelLayoutMixin,
+    AudioSampleFormatMixin,
+    AudioDataConstructionMixin,
+    BaseDataType[np.ndarray],
+):
+    """
+    Represents audio data with any number of channels (e.g. microphone arrays).
+
+    The data is shaped (samples, channels), and stored either interleaved or
+    planar (see `AudioChannelLayoutMixin`).
+
+    Attributes:
+        _data (np.ndarray): The encapsulated multi-channel audio data.
+    """
+
+    def __init__(
+        self, data: np.ndarray, sample_format: Optional[str] = None, *args, **kwargs
+    ):
+        """
+        Initialize the MultiChannelAudioDataType with the provided data.
+
+        Args:
+            data (np.ndarray): The (samples, channels) audio data to encapsulate.
+            sample_format (Optional[str]): Storage format of the samples (see
+                `SAMPLE_FORMATS`). Defaults to the format inferred from the dtype.
+
+        Raises:
+            AssertionError: If the input data is not an aligned, numeric numpy ndarray.
+        """
+        self._sample_format = sample_format
+        super().__init__(data)
+
+    def validate(self, data):
+        _validate_samples(
+            data,
+            2,
+            "Data must be a (samples, channels) ndarray.",
+            self._sample_format,
+        )
+
+    @property
+    def channels(self) -> int:
+        """
+        Number of channels.
+        """
+        return self._data.shape[1]
+
+
+class SpectrogramDataType(BaseDataType[np.ndarray]):
+    """
+    Represents the short-time Fourier transform of single-channel audio data.
+
+    The data is a complex (frames, bins) array, with `bins = frame_size // 2 + 1`.
+    The framing parameters are kept with the data, so that later nodes can work
+    in the time-frequency domain, and the signal can be reconstructed, without
+    recomputing the transform.
+
+    Attributes:
+        _data (np.ndarray): The encapsulated complex spectrogram.
+        frame_size (int): Number of samples per frame (FFT size).
+        hop_size (int): Number of samples between consecutive frames.
+        window (str): Type of the analysis window.
+        length (Optional[int]): Number of samples of the analyzed signal.
+    """
+
+    def __init__(
+        self,
+        data: np.ndarray,
+        frame_size: Optional[int] = None,
+        hop_size: Optional[int] = None,
+        window: str = "hann",
+        length: Optional[int] = None,
+        *args,
+        **kwargs,
+    ):
+        """
+        Initialize the SpectrogramDataType with the provided data.
+
+        Args:
+            data (np.ndarray): The complex (frames, bins) spectrogram.
+            frame_size (Optional[int]): Number of samples per frame. Defaults to
+                `2 * (bins - 1)`.
+            hop_size (Optional[int]): Number of samples between consecutive frames.
+                Defaults to a quarter of the frame size.
+            window (str): Type of the analysis window. Defaults to "hann".
+            length (Optional[int]): Number of samples of the analyzed signal.
 
         Raises:
-            AssertionError: If the input data is not a numpy ndarray.
+            AssertionError: If the data is not a 2-D complex numpy ndarray, or does
+                not match the frame size.
         """
         super().__init__(data)
+        self.frame_size = 2 * (data.shape[1] - 1) if frame_size is None else frame_size
+        self.hop_size = max(self.frame_size // 4, 1) if hop_size is None else hop_size
+        self.window = window
+        self.length = length
+        assert (
+            data.shape[1] == self.frame_size // 2 + 1
+        ), f"A frame size of {self.frame_size} requires {self.frame_size // 2 + 1} bins."
 
     def validate(self, data):
         assert isinstance(data, np.ndarray), "Data must be a numpy ndarray."
-        assert data.ndim == 2, "Data must be dual channel ndarray."
+        assert data.ndim == 2, "Data must be a (frames, bins) ndarray."
+        assert data.dtype.kind == "c", f"Data must be complex, got {data.dtype}."
+
+    @property
+    def magnitude(self) -> np.ndarray:
+        """
+        Magnitude of the spectrogram.
+        """
+        return np.abs(self._data)
+
+
+class SingleChannelAudioBatchDataType(
+    AudioSampleFormatMixin,
+    AudioDataConstructionMixin,
+    DataCollectionType[SingleChannelAudioDataType, np.ndarray],
+):
+    """
+    Represents a batch of single-channel audio clips of equal length.
+
+    The clips are stored densely as a (clips, samples) array, so batch operations
+    can process the whole batch in a single NumPy call. Iterating the batch yields
+    `SingleChannelAudioDataType` views of its rows.
+
+    Attributes:
+        _data (np.ndarray): The encapsulated (clips, samples) audio data.
+    """
+
+    def __init__(
+        self,
+        data: Optional[np.ndarray] = None,
+        sample_format: Optional[str] = None,
+        *args,
+        **kwargs,
+    ):
+        """
+        Initialize the SingleChannelAudioBatchDataType with the provided data.
+
+        Args:
+            data (Optional[np.ndarray]): The (clips, samples) audio data. Defaults to an empty batch.
+            sample_format (Optional[str]): Storage format of the samples. Defaults to
+                the format inferred from the dtype.
+
+        Raises:
+            AssertionError: If the input data is not a 2-D numpy ndarray.
+        """
+        self._sample_format = sample_format
+        super().__init__(data)
+
+    def validate(self, data):
+        _validate_samples(
+            data, 2, "Data must be a (clips, samples) ndarray.", self._sample_format
+        )
+
+    @classmethod
+    def _initialize_empty(cls) -> np.ndarray:
+        return np.empty((0, 0))
+
+    @classmethod
+    def from_list(cls, items):
+        """
+        Create a batch from single-channel clips with a single allocation.
+
+        Args:
+            items (list[SingleChannelAudioDataType]): Clips of equal length.
+
+        Returns:
+            SingleChannelAudioBatchDataType: The batch of clips.
+        """
+        if not items:
+            return cls()
+        return cls(
+            np.stack([item.data for item in items]), items[0].recorded_sample_format
+        )
+
+    def __iter__(self) -> Iterator[SingleChannelAudioDataType]:
+        for clip in self._data:
+            yield SingleChannelAudioDataType.from_validated(clip, self._sample_format)
+
+    def append(self, item: SingleChannelAudioDataType) -> None:
+        """
+        Append a clip to the batch.
+
+        Raises:
+            TypeError: If the item is not single-channel audio data.
+            ValueError: If the clip length differs from the clips in the batch.
+        """
+        if not isinstance(item, SingleChannelAudioDataType):
+            raise TypeError(f"Expected SingleChannelAudioDataType, got {type(item)}.")
+        if len(self) == 0:
+            self._data = item.data[np.newaxis].copy()
+            return
+        if item.data.shape[0] != self._data.shape[1]:
+            raise ValueError(
+                f"Clip length {item.data.shape[0]} differs from batch clip length "
+                f"{self._data.shape[1]}."
+            )
+        self._data = np.concatenate((self._data, item.data[np.newaxis]))
+
+    def __len__(self) -> int:
+        return self._data.shape[0]
+
+
+class DualChannelAudioBatchDataType(
+    AudioSampleFormatMixin,
+    AudioDataConstructionMixin,
+    DataCollectionType[DualChannelAudioDataType, np.ndarray],
+):
+    """
+    Represents a batch of dual-channel audio clips of equal length.
+
+    The clips are stored densely as a (clips, samples, channels) array, so batch
+    operations can process the whole batch in a single NumPy call. Iterating the
+    batch yields `DualChannelAudioDataType` views of its clips.
+
+    Attributes:
+        _data (np.ndarray): The encapsulated (clips, samples, channels) audio data.
+    """
+
+    def __init__(
+        self,
+        data: Optional[np.ndarray] = None,
+        sample_format: Optional[str] = None,
+        *args,
+        **kwargs,
+    ):
+        """
+        Initialize the DualChannelAudioBatchDataType with the provided data.
+
+        Args:
+            data (Optional[np.ndarray]): The (clips, samples, channels) audio data.
+                Defaults to an empty batch.
+            sample_format (Optional[str]): Storage format of the samples. Defaults to
+                the format inferred from the dtype.
+
+        Raises:
+            AssertionError: If the input data is not a 3-D numpy ndarray.
+        """
+        self._sample_format = sample_format
+        super().__init__(data)
+
+    def validate(self, data):
+        _validate_samples(
+            data,
+            3,
+            "Data must be a (clips, samples, channels) ndarray.",
+            self._sample_format,
+        )
+
+    @classmethod
+    def _initialize_empty(cls) -> np.ndarray:
+        return np.empty((0, 0, 2))
+
+    @classmethod
+    def from_list(cls, items):
+        """
+        Create a batch from dual-channel clips with a single allocation.
+
+        Args:
+            items (list[DualChannelAudioDataType]): Clips of equal shape.
+
+        Returns:
+            DualChannelAudioBatchDataType: The batch of clips.
+        """
+        if not items:
+            return cls()
+        return cls(
+            np.stack([item.data for item in items]), items[0].recorded_sample_format
+        )
+
+    def __iter__(self) -> Iterator[DualChannelAudioDataType]:
+        for clip in self._data:
+            yield DualChannelAudioDataType.from_validated(clip, self._sample_format)
+
+    def append(self, item: DualChannelAudioDataType) -> None:
+        """
+        Append a clip to the batch.
+
+        Raises:
+            TypeError: If the item is not dual-channel audio data.
+            ValueError: If the clip shape differs from the clips in the batch.
+        """
+        if not isinstance(item, DualChannelAudioDataType):
+            raise TypeError(f"Expected DualChannelAudioDataType, got {type(item)}.")
+        if len(self) == 0:
+            self._data = item.data[np.newaxis].copy()
+            return
+        if item.data.shape != self._data.shape[1:]:
+            raise ValueError(
+                f"Clip shape {item.data.shape} differs from batch clip shape "
+                f"{self._data.shape[1:]}."
+            )
+        self._data = np.concatenate((self._data, item.data[np.newaxis]))
+
+    def __len__(self) -> int:
+        return self._data.shape[0]
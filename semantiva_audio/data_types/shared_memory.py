@@ -0,0 +1,252 @@
+import sys
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Literal, Optional, Tuple
+import numpy as np
+
+# Memory order of the array of a buffer: "C", or "F" for planar data
+MemoryOrder = Literal["C", "F"]
+
+
+def _attach_memory(name: str) -> SharedMemory:
+    """
+    Open an existing shared memory block without taking ownership of it.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    # Older versions register attached blocks with the resource tracker as well.
+    # Registration is idempotent in the tracker shared by multiprocessing
+    # processes, and the owner unregisters the block when unlinking it.
+    return SharedMemory(name=name)
+
+
+class SharedAudioBuffer:
+    """
+    An array of audio samples stored in a named shared memory block.
+
+    Pickling a buffer only sends the name of its block, with the shape, dtype and
+    memory order of the array, and unpickling attaches to the same block: the
+    samples are shared between processes without being copied.
+
+    The process creating the buffer owns the block. The lifecycle is explicit:
+    every process calls `close` once it no longer uses the samples, and the owner
+    calls `unlink` to free the block, once no other process needs it. Used as a
+    context manager, a buffer is closed (and unlinked by its owner) on exit.
+
+    Attributes:
+        shape (Tuple[int, ...]): Shape of the array.
+        dtype (np.dtype): Type of the samples.
+        order (MemoryOrder): Memory order of the array, "C" or "F" (planar data).
+        owner (bool): Whether this process created the block.
+    """
+
+    def __init__(
+        self,
+        memory: SharedMemory,
+        shape: Tuple[int, ...],
+        dtype,
+        order: MemoryOrder = "C",
+        owner: bool = False,
+    ):
+        """
+        Wrap a shared memory block. Use `create`, `from_array` or `attach` instead.
+
+        Args:
+            memory (SharedMemory): The shared memory block.
+            shape (Tuple[int, ...]): Shape of the array.
+            dtype (np.dtype): Type of the samples.
+            order (MemoryOrder): Memory order of the array, "C" or "F".
+            owner (bool): Whether this process created the block.
+        """
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.order = order
+        self.owner = owner
+        self._memory = memory
+        self._array: Optional[np.ndarray] = np.ndarray(
+            self.shape, self.dtype, buffer=memory.buf, order=order
+        )
+
+    @classmethod
+    def create(cls, shape: Tuple[int, ...], dtype, order: MemoryOrder = "C"):
+        """
+        Allocate an uninitialized buffer in a new shared memory block.
+
+        Args:
+            shape (Tuple[int, ...]): Shape of the array.
+            dtype (np.dtype): Type of the samples.
+            order (MemoryOrder): Memory order of the array, "C" or "F". Defaults to "C".
+
+        Returns:
+            SharedAudioBuffer: The buffer, owned by this process.
+        """
+        size = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        memory = SharedMemory(create=True, size=max(size, 1))
+        return cls(memory, shape, dtype, order, owner=True)
+
+    @classmethod
+    def from_array(cls, array: np.ndarray):
+        """
+        Copy samples into a new shared memory block, keeping their memory order.
+
+        Args:
+            array (np.ndarray): The samples.
+
+        Returns:
+            SharedAudioBuffer: The buffer, owned by this process.
+        """
+        order: MemoryOrder = "C"
+        if array.ndim > 1 and array.flags.f_contiguous:
+            order = "F"
+        buffer = cls.create(array.shape, array.dtype, order)
+        np.copyto(buffer.array, array)
+        return buffer
+
+    @classmethod
+    def attach(cls, name: str, shape: Tuple[int, ...], dtype, order: MemoryOrder = "C"):
+        """
+        Attach to the shared memory block of a buffer created by another process.
+
+        Args:
+            name (str): Name of the shared memory block.
+            shape (Tuple[int, ...]): Shape of the array.
+            dtype (np.dtype): Type of the samples.
+            order (MemoryOrder): Memory order of the array, "C" or "F".
+
+        Returns:
+            SharedAudioBuffer: The buffer, not owned by this process.
+        """
+        return cls(_attach_memory(name), shape, dtype, order, owner=False)
+
+    @property
+    def name(self) -> str:
+        """
+        Name of the shared memory block.
+        """
+        return self._memory.name
+
+    @property
+    def array(self) -> np.ndarray:
+        """
+        The samples, as an array viewing the shared memory block.
+
+        Raises:
+            ValueError: If the buffer is closed.
+        """
+        if self._array is None:
+            raise ValueError(f"Shared audio buffer '{self.name}' is closed.")
+        return self._array
+
+    @property
+    def closed(self) -> bool:
+        """
+        Whether this process closed its access to the block.
+        """
+        return self._array is None
+
+    def close(self) -> None:
+        """
+        Close the access of this process to the block. Does nothing if already closed.
+
+        Raises:
+            BufferError: If arrays viewing the samples (other than `array`) are
+                still referenced.
+        """
+        if self._array is None:
+            return
+        self._array = None
+        self._memory.close()
+
+    def unlink(self) -> None:
+        """
+        Free the shared memory block, once every process is done with it.
+
+        Processes which have the block open keep access to it until they close it.
+
+        Raises:
+            ValueError: If this process does not own the block.
+        """
+        if not self.owner:
+            raise ValueError(
+                f"Shared audio buffer '{self.name}' is owned by another process."
+            )
+        self._memory.unlink()
+        self.owner = False
+
+    def __enter__(self) -> "SharedAudioBuffer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+        if self.owner:
+            self.unlink()
+
+    def __reduce__(self):
+        return (
+            type(self).attach,
+            (self.name, self.shape, self.dtype.str, self.order),
+        )
+
+
+class AudioSharedMemoryMixin:
+    """
+    Shared memory backing for audio data types.
+
+    `to_shared_memory` copies the samples into a `SharedAudioBuffer`. Pickling the
+    resulting instance (e.g. to send it to a worker process) only sends the handle
+    of the buffer, and unpickling attaches to the same memory, without copying
+    the samples. See `SharedAudioBuffer` for the lifecycle of the memory.
+    """
+
+    _data: Any
+    _sample_format: Optional[str] = None
+    _shared_buffer: Optional[SharedAudioBuffer] = None
+    from_validated: Any
+
+    def to_shared_memory(self):
+        """
+        Return a copy of the data backed by a new shared memory block.
+
+        Returns:
+            The data, of the same type, owning its shared memory block.
+        """
+        buffer = SharedAudioBuffer.from_array(self._data)
+        instance = self.from_validated(buffer.array, self._sample_format)
+        instance._shared_buffer = buffer
+        return instance
+
+    @property
+    def shared_buffer(self) -> Optional[SharedAudioBuffer]:
+        """
+        The shared memory buffer backing the data, or None for regular arrays.
+        """
+        return self._shared_buffer
+
+    def release_shared_memory(self) -> None:
+        """
+        Close the shared memory block backing the data, and unlink it if this
+        process owns it. The samples are no longer available afterwards.
+
+        Raises:
+            BufferError: If arrays viewing the samples are still referenced.
+        """
+        buffer = self._shared_buffer
+        if buffer is None:
+            return
+        self._data = None
+        self._shared_buffer = None
+        buffer.close()
+        if buffer.owner:
+            buffer.unlink()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        buffer = self._shared_buffer
+        if buffer is not None and not buffer.closed and self._data is buffer.array:
+            # The samples travel with the buffer handle
+            state["_data"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self._data is None and self._shared_buffer is not None:
+            self._data = self._shared_buffer.array
@@ -0,0 +1,74 @@
+from importlib import import_module
+from typing import Any, Dict, List
+
+_PROCESSORS = "semantiva_audio.processing.processors"
+_PROBES = "semantiva_audio.processing.probes"
+_FILTERS = "semantiva_audio.processing.filters"
+_RESAMPLERS = "semantiva_audio.processing.resamplers"
+_SPECTROGRAMS = "semantiva_audio.processing.spectrograms"
+
+# Module defining each processor that can be named in a pipeline configuration.
+# The specialization registers this module with the `ComponentLoader`, which
+# looks processor names up as its attributes: a defining module is only imported
+# when one of its processors is first resolved.
+PROCESSOR_MANIFEST: Dict[str, str] = {
+    "SingleChannelAudioMultiplyOperation": _PROCESSORS,
+    "DualChannelAudioMultiplyOperation": _PROCESSORS,
+    "DualChannelAudioMultiplyInPlaceOperation": _PROCESSORS,
+    "SingleChannelAudioOffsetOperation": _PROCESSORS,
+    "DualChannelAudioOffsetOperation": _PROCESSORS,
+    "SingleChannelAudioClipOperation": _PROCESSORS,
+    "DualChannelAudioClipOperation": _PROCESSORS,
+    "SingleChannelAudioBatchMultiplyOperation": _PROCESSORS,
+    "DualChannelAudioBatchMultiplyOperation": _PROCESSORS,
+    "DualChannelToPlanarOperation": _PROCESSORS,
+    "DualChannelToInterleavedOperation": _PROCESSORS,
+    "MultiChannelToPlanarOperation": _PROCESSORS,
+    "MultiChannelToInterleavedOperation": _PROCESSORS,
+    "MultiChannelAudioMixOperation": _PROCESSORS,
+    "MultiChannelAudioDownmixOperation": _PROCESSORS,
+    "DualChannelAudioDownmixOperation": _PROCESSORS,
+    "SingleChannelAudioDuplicateOperation": _PROCESSORS,
+    "SingleChannelAudioUpmixOperation": _PROCESSORS,
+    "SingleChannelAudioStatisticsProbe": _PROBES,
+    "DualChannelAudioStatisticsProbe": _PROBES,
+    "MultiChannelAudioStatisticsProbe": _PROBES,
+    "SingleChannelAudioFIRFilterOperation": _FILTERS,
+    "DualChannelAudioFIRFilterOperation": _FILTERS,
+    "MultiChannelAudioFIRFilterOperation": _FILTERS,
+    "SingleChannelAudioResampleOperation": _RESAMPLERS,
+    "DualChannelAudioResampleOperation": _RESAMPLERS,
+    "MultiChannelAudioResampleOperation": _RESAMPLERS,
+    "SingleChannelAudioBatchResampleOperation": _RESAMPLERS,
+    "DualChannelAudioBatchResampleOperation": _RESAMPLERS,
+    "SingleChannelAudioSTFTOperation": _SPECTROGRAMS,
+    "SpectrogramISTFTOperation": _SPECTROGRAMS,
+}
+
+
+def resolve_processor(name: str) -> Any:
+    """
+    Import the module defining a processor and return the processor class.
+
+    Args:
+        name (str): The processor class name.
+
+    Returns:
+        type: The processor class.
+
+    Raises:
+        ValueError: If the processor is not in the manifest.
+    """
+    if name not in PROCESSOR_MANIFEST:
+        raise ValueError(f"Processor '{name}' is not in the audio manifest.")
+    return getattr(import_module(PROCESSOR_MANIFEST[name]), name)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in PROCESSOR_MANIFEST:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return resolve_processor(name)
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + list(PROCESSOR_MANIFEST))
@@ -0,0 +1,159 @@
+import asyncio
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Union,
+)
+from semantiva.logger import Logger
+from semantiva.payload_operations import Pipeline
+from semantiva_audio.data_io.io import AsyncAudioPayloadSink, AsyncAudioPayloadSource
+
+
+async def _iterate(inputs: Union[Iterable[Any], AsyncIterable[Any]]) -> AsyncIterator:
+    """
+    Iterate over an iterable or an asynchronous iterable.
+    """
+    if isinstance(inputs, AsyncIterable):
+        async for item in inputs:
+            yield item
+    else:
+        for item in inputs:
+            yield item
+
+
+class AsyncPipelineDriver:
+    """
+    Run a pipeline over payloads read from an asynchronous source and written to an
+    asynchronous sink, overlapping I/O with computation.
+
+    While a payload is computed, in a worker thread so the event loop keeps
+    running, the next payloads are already being fetched (up to `prefetch` of
+    them), and the previous results are still being flushed to the sink (up to
+    `max_flushes` at a time). Payloads are computed one at a time, in input
+    order; flushes may complete in any order.
+
+    Memory is bounded by `prefetch` payloads being fetched, the one being
+    computed and `max_flushes` results being flushed. The first failure (of the
+    source, the pipeline or the sink) cancels the remaining work and is raised.
+
+    Example:
+        >>> driver = AsyncPipelineDriver(node_configurations, source, sink)
+        >>> asyncio.run(driver.run(object_keys))
+    """
+
+    def __init__(
+        self,
+        node_configurations: List[Dict],
+        source: AsyncAudioPayloadSource,
+        sink: AsyncAudioPayloadSink,
+        prefetch: int = 1,
+        max_flushes: int = 2,
+        logger: Optional[Logger] = None,
+    ):
+        """
+        Initialize the driver and its pipeline.
+
+        Args:
+            node_configurations (List[Dict]): The pipeline configuration.
+            source (AsyncAudioPayloadSource): The source of the input payloads.
+            sink (AsyncAudioPayloadSink): The sink of the output payloads.
+            prefetch (int): Maximum number of payloads fetched ahead of the one
+                being computed. Defaults to 1.
+            max_flushes (int): Maximum number of results being sent to the sink
+                at a time. Defaults to 2.
+            logger (Optional[Logger]): The logger of the pipeline.
+
+        Raises:
+            ValueError: If `prefetch` or `max_flushes` is not positive.
+        """
+        if prefetch <= 0 or max_flushes <= 0:
+            raise ValueError("The prefetch and flush bounds must be positive.")
+        self.source = source
+        self.sink = sink
+        self.prefetch = prefetch
+        self.max_flushes = max_flushes
+        self.pipeline = Pipeline(node_configurations, logger)
+
+    async def run(
+        self,
+        inputs: Union[Iterable[Any], AsyncIterable[Any]],
+        **source_parameters,
+    ) -> int:
+        """
+        Run the pipeline on the payload of each input and send the results to the sink.
+
+        Args:
+            inputs (Union[Iterable, AsyncIterable]): The inputs passed to the
+                source, e.g. object keys. Consumed lazily.
+            **source_parameters: Keyword arguments passed to the source for every
+                input.
+
+        Returns:
+            int: The number of payloads processed.
+        """
+        items = _iterate(inputs)
+        fetches: Deque[asyncio.Task] = deque()
+        flushes: Set[asyncio.Task] = set()
+        flush_slots = asyncio.Semaphore(self.max_flushes)
+        failures: List[BaseException] = []
+        exhausted = False
+
+        async def fetch_ahead() -> None:
+            nonlocal exhausted
+            while not exhausted and len(fetches) < self.prefetch:
+                try:
+                    item = await items.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    return
+                fetches.append(
+                    asyncio.ensure_future(
+                        self.source.get_payload(item, **source_parameters)
+                    )
+                )
+
+        async def flush(data: Any, context: Any) -> None:
+            try:
+                await self.sink.send_payload(data, context)
+            finally:
+                flush_slots.release()
+
+        def flushed(task: asyncio.Task) -> None:
+            flushes.discard(task)
+            if not task.cancelled() and task.exception() is not None:
+                failures.append(task.exception())  # type: ignore[arg-type]
+
+        count = 0
+        try:
+            await fetch_ahead()
+            while fetches:
+                data, context = await fetches.popleft()
+                await fetch_ahead()
+                data, context = await asyncio.to_thread(
+                    self.pipeline.process, data, context
+                )
+                await flush_slots.acquire()
+                if failures:
+                    raise failures[0]
+                task = asyncio.ensure_future(flush(data, context))
+                flushes.add(task)
+                task.add_done_callback(flushed)
+                count += 1
+            await asyncio.gather(*flushes)
+        except BaseException:
+            pending = [*fetches, *flushes]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            raise
+        if failures:
+            raise failures[0]
+        return count
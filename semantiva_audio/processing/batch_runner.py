@@ -0,0 +1,336 @@
+import os
+import time
+import traceback
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+from semantiva.payload_operations import Pipeline
+from semantiva.payload_operations.nodes.nodes import ProbeResultCollectorNode
+from semantiva.specializations import load_specializations
+from semantiva_audio.data_io.io import WavSingleChannelPayloadLoader
+
+# Pipeline and payload source of the worker process, built once by its initializer
+_worker_pipeline: Optional[Pipeline] = None
+_worker_source: Any = None
+
+
+class BatchItemResult(NamedTuple):
+    """
+    The outcome of running the pipeline on one input of a batch.
+
+    Attributes:
+        position (int): Position of the input in the batch.
+        input (Any): The input passed to the payload source (e.g. a file path).
+        data (Any): The output data, or None if the run failed or outputs are not kept.
+        context (Optional[Dict[str, Any]]): The output context values, or None if
+            the run failed.
+        error (Optional[str]): The formatted exception if the run failed.
+        audio_seconds (float): Duration of the input audio, or 0.0 if unknown.
+        probe_results (Optional[Dict[str, List[Any]]]): The results of the probe
+            collector nodes (probes configured without a `context_keyword`) for
+            this input, keyed as by `Pipeline.get_probe_results`, or None if the
+            run failed.
+    """
+
+    position: int
+    input: Any
+    data: Any
+    context: Optional[Dict[str, Any]]
+    error: Optional[str]
+    audio_seconds: float
+    probe_results: Optional[Dict[str, List[Any]]] = None
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the pipeline ran successfully on the input.
+        """
+        return self.error is None
+
+
+class BatchRunReport:
+    """
+    The results of a batch run, in input order, and its throughput.
+
+    Attributes:
+        results (List[BatchItemResult]): One result per input, in input order.
+        elapsed (float): Wall-clock duration of the run, in seconds.
+    """
+
+    def __init__(self, results: List[BatchItemResult], elapsed: float):
+        """
+        Initialize the report.
+
+        Args:
+            results (List[BatchItemResult]): One result per input, in input order.
+            elapsed (float): Wall-clock duration of the run, in seconds.
+        """
+        self.results = results
+        self.elapsed = elapsed
+
+    @property
+    def failures(self) -> List[BatchItemResult]:
+        """
+        The results of the inputs on which the pipeline failed.
+        """
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def audio_seconds(self) -> float:
+        """
+        Total duration of the audio processed successfully, in seconds.
+        """
+        return sum(result.audio_seconds for result in self.results if result.ok)
+
+    @property
+    def files_per_second(self) -> float:
+        """
+        Number of inputs processed per second of wall-clock time.
+        """
+        return len(self.results) / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def audio_seconds_per_second(self) -> float:
+        """
+        Seconds of audio processed per second of wall-clock time.
+        """
+        return self.audio_seconds / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Return the counts and throughput of the run, e.g. for logging.
+
+        Returns:
+            Dict[str, Any]: The number of files and failures, the elapsed time and
+            the throughput in files/s and audio seconds/s.
+        """
+        return {
+            "files": len(self.results),
+            "failures": len(self.failures),
+            "elapsed": self.elapsed,
+            "files_per_second": self.files_per_second,
+            "audio_seconds_per_second": self.audio_seconds_per_second,
+        }
+
+
+def _format_error(error: BaseException) -> str:
+    """
+    Format an exception as its type and message.
+    """
+    return "".join(traceback.format_exception_only(type(error), error)).strip()
+
+
+def _initialize_worker(node_configurations: List[Dict], source: Any) -> None:
+    """
+    Build the pipeline and payload source of a worker process once.
+    """
+    global _worker_pipeline, _worker_source
+    load_specializations("audio")
+    _worker_pipeline = Pipeline(node_configurations)
+    _worker_source = source()
+
+
+def _take_probe_results(pipeline: Pipeline) -> Dict[str, List[Any]]:
+    """
+    Return the results of the probe collector nodes of a pipeline and clear them,
+    so the collectors of a worker pipeline only hold the results of one input.
+    """
+    probe_results = {
+        name: list(results) for name, results in pipeline.get_probe_results().items()
+    }
+    for node in pipeline.nodes:
+        if isinstance(node, ProbeResultCollectorNode):
+            node.clear_collected_data()
+    return probe_results
+
+
+def _run_item(
+    index: int, item: Any, source_parameters: Dict[str, Any], keep_outputs: bool
+) -> BatchItemResult:
+    """
+    Load one input and run the pipeline of the worker on it, catching any failure.
+    """
+    assert _worker_pipeline is not None, "The worker was not initialized."
+    audio_seconds = 0.0
+    try:
+        data, context = _worker_source.get_payload(item, **source_parameters)
+        sample_rate = context.get_value("sample_rate")
+        if sample_rate:
+            audio_seconds = data.data.shape[0] / sample_rate
+        data, context = _worker_pipeline.process(data, context)
+    # Any failure on one input is reported in its result instead of stopping the run
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        return BatchItemResult(
+            index, item, None, None, _format_error(error), audio_seconds
+        )
+    finally:
+        probe_results = _take_probe_results(_worker_pipeline)
+    output = data if keep_outputs else None
+    values = {key: context.get_value(key) for key in context.keys()}
+    return BatchItemResult(
+        index, item, output, values, None, audio_seconds, probe_results
+    )
+
+
+def _collect(index: int, item: Any, future: Future) -> BatchItemResult:
+    """
+    Wait for the result of an input, reporting failures of the worker itself
+    (e.g. a crashed process, or a result that cannot be sent back).
+    """
+    try:
+        return future.result()
+    # A worker failure is reported in the result of its input, like input failures
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        return BatchItemResult(index, item, None, None, _format_error(error), 0.0)
+
+
+class AudioBatchRunner:
+    """
+    Run one pipeline over many audio inputs (e.g. files) on a process pool.
+
+    Every worker process builds the pipeline once from its node configuration
+    (the list passed to `Pipeline`), then loads each input it receives with the
+    payload source and runs the pipeline on it. At most `max_in_flight` inputs
+    are submitted ahead of the results yielded, which bounds memory use however
+    many inputs there are, and results are yielded in input order.
+
+    A failure on an input (unreadable file, invalid data, processing error) is
+    reported in its result and does not stop the run.
+
+    Processors given as classes in the node configuration must be importable by
+    the worker processes (defined at module level).
+
+    Example:
+        >>> with AudioBatchRunner(node_configurations, max_workers=8) as runner:
+        ...     report = runner.run(paths)
+        >>> report.summary()["audio_seconds_per_second"]
+    """
+
+    def __init__(
+        self,
+        node_configurations: List[Dict],
+        source: Any = WavSingleChannelPayloadLoader,
+        max_workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        keep_outputs: bool = True,
+    ):
+        """
+        Initialize the runner and its process pool.
+
+        Args:
+            node_configurations (List[Dict]): The pipeline configuration.
+            source (type): The payload source class loading each input. Defaults
+                to `WavSingleChannelPayloadLoader`.
+            max_workers (Optional[int]): Number of worker processes. Defaults to
+                the number of CPUs.
+            max_in_flight (Optional[int]): Maximum number of inputs submitted and
+                not yet yielded. Defaults to twice the number of workers.
+            keep_outputs (bool): Return the output data of each input. Disable it
+                when only context values (e.g. probe results) are needed, to avoid
+                sending the audio back from the workers.
+
+        Raises:
+            ValueError: If the number of workers or in-flight inputs is not positive.
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        max_in_flight = max_in_flight or 2 * max_workers
+        if max_workers <= 0 or max_in_flight <= 0:
+            raise ValueError(
+                "The number of workers and in-flight inputs must be positive."
+            )
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight
+        self.keep_outputs = keep_outputs
+        self._pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_initialize_worker,
+            initargs=(node_configurations, source),
+        )
+
+    def __enter__(self) -> "AudioBatchRunner":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker processes once their current inputs are done.
+        """
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def iter_results(
+        self, inputs: Iterable[Any], **source_parameters
+    ) -> Iterator[BatchItemResult]:
+        """
+        Run the pipeline on each input, yielding the results in input order.
+
+        Args:
+            inputs (Iterable[Any]): The inputs passed to the payload source, e.g.
+                file paths. Consumed lazily.
+            **source_parameters: Keyword arguments passed to the payload source
+                for every input (e.g. the sample type of raw files).
+
+        Yields:
+            BatchItemResult: The result of each input, in input order.
+        """
+        pending: Deque[Tuple[int, Any, Future]] = deque()
+        for index, item in enumerate(inputs):
+            if len(pending) >= self.max_in_flight:
+                yield _collect(*pending.popleft())
+            future = self._pool.submit(
+                _run_item, index, item, source_parameters, self.keep_outputs
+            )
+            pending.append((index, item, future))
+        while pending:
+            yield _collect(*pending.popleft())
+
+    def run(self, inputs: Iterable[Any], **source_parameters) -> BatchRunReport:
+        """
+        Run the pipeline on every input and collect the results.
+
+        Args:
+            inputs (Iterable[Any]): The inputs passed to the payload source.
+            **source_parameters: Keyword arguments passed to the payload source
+                for every input.
+
+        Returns:
+            BatchRunReport: The results, in input order, and the throughput.
+        """
+        start = time.perf_counter()
+        results = list(self.iter_results(inputs, **source_parameters))
+        return BatchRunReport(results, time.perf_counter() - start)
+
+
+def run_pipeline_batch(
+    node_configurations: List[Dict],
+    inputs: Iterable[Any],
+    source_parameters: Optional[Dict[str, Any]] = None,
+    **options,
+) -> BatchRunReport:
+    """
+    Run a pipeline over many inputs on a process pool and report the results.
+
+    Args:
+        node_configurations (List[Dict]): The pipeline configuration.
+        inputs (Iterable[Any]): The inputs passed to the payload source, e.g. file paths.
+        source_parameters (Optional[Dict[str, Any]]): Keyword arguments passed to
+            the payload source for every input (e.g. the sample type of raw files).
+        **options: Options of `AudioBatchRunner` (source, max_workers,
+            max_in_flight, keep_outputs).
+
+    Returns:
+        BatchRunReport: The results, in input order, and the throughput.
+    """
+    with AudioBatchRunner(node_configurations, **options) as runner:
+        return runner.run(inputs, **(source_parameters or {}))
@@ -0,0 +1,118 @@
+import threading
+from collections import defaultdict
+from typing import Dict, List, Tuple
+import numpy as np
+
+
+class AudioBufferPool:
+    """
+    A pool of reusable sample buffers, keyed by shape and dtype.
+
+    Audio operations given a pool take their output buffers from it instead of
+    allocating. Once a payload is no longer needed, releasing its buffer makes it
+    available to the next operation requesting the same shape and dtype, so a
+    steady-state process allocates almost nothing. The pool is thread-safe.
+
+    Attributes:
+        max_buffers_per_key (int): Maximum number of free buffers kept per (shape, dtype).
+        allocations (int): Number of buffers allocated by the pool.
+        reuses (int): Number of requests served with a released buffer.
+    """
+
+    def __init__(self, max_buffers_per_key: int = 4):
+        """
+        Initialize an empty pool.
+
+        Args:
+            max_buffers_per_key (int): Maximum number of free buffers kept per
+                (shape, dtype). Buffers released beyond it are left to the garbage
+                collector. Defaults to 4.
+        """
+        self.max_buffers_per_key = max_buffers_per_key
+        self.allocations = 0
+        self.reuses = 0
+        self._free: Dict[Tuple[Tuple[int, ...], str], List[np.ndarray]] = defaultdict(
+            list
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(shape, dtype) -> Tuple[Tuple[int, ...], str]:
+        shape = (shape,) if isinstance(shape, int) else tuple(shape)
+        return shape, np.dtype(dtype).str
+
+    def acquire(self, shape, dtype=np.float64) -> np.ndarray:
+        """
+        Get an uninitialized buffer of the given shape and dtype.
+
+        Args:
+            shape (int | Tuple[int, ...]): Shape of the buffer.
+            dtype (np.dtype): Type of the samples. Defaults to float64.
+
+        Returns:
+            np.ndarray: A C-contiguous buffer, with arbitrary content.
+        """
+        key = self._key(shape, dtype)
+        with self._lock:
+            free = self._free.get(key)
+            if free:
+                self.reuses += 1
+                return free.pop()
+            self.allocations += 1
+        return np.empty(key[0], dtype=key[1])
+
+    def release(self, buffer: np.ndarray) -> bool:
+        """
+        Return a buffer to the pool.
+
+        Only C-contiguous, writeable arrays owning their memory are kept, or the
+        transpose of such an array (as used for planar multi-channel data). The
+        caller must not use the buffer (or any view of it) after releasing it.
+
+        Args:
+            buffer (np.ndarray): The buffer to return.
+
+        Returns:
+            bool: Whether the buffer was kept for reuse.
+        """
+        if (
+            isinstance(buffer, np.ndarray)
+            and not buffer.flags.c_contiguous
+            and isinstance(buffer.base, np.ndarray)
+            and buffer.base.shape == buffer.shape[::-1]
+            and buffer.base.flags.c_contiguous
+            and buffer.T.flags.c_contiguous
+            and buffer.ctypes.data == buffer.base.ctypes.data
+        ):
+            buffer = buffer.base
+        if not (
+            isinstance(buffer, np.ndarray)
+            and type(buffer) is np.ndarray
+            and buffer.flags.owndata
+            and buffer.flags.c_contiguous
+            and buffer.flags.writeable
+        ):
+            return False
+        key = self._key(buffer.shape, buffer.dtype)
+        with self._lock:
+            free = self._free[key]
+            if len(free) >= self.max_buffers_per_key or any(
+                pooled is buffer for pooled in free
+            ):
+                return False
+            free.append(buffer)
+        return True
+
+    def clear(self) -> None:
+        """
+        Drop all free buffers.
+        """
+        with self._lock:
+            self._free.clear()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of free buffers held by the pool.
+        """
+        with self._lock:
+            return sum(len(free) for free in self._free.values())
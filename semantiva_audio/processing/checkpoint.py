@@ -0,0 +1,320 @@
+import hashlib
+import importlib
+import os
+import pickle
+import re
+import shutil
+import sys
+import tempfile
+import types
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from semantiva.context_processors.context_types import ContextType
+from semantiva.logger import Logger
+from semantiva.payload_operations import Pipeline
+from semantiva.payload_operations.nodes.nodes import ProbeResultCollectorNode
+from semantiva_audio.processing.cache import array_digest
+
+# Files of a checkpoint: the samples, memory-mappable, and the rest of the payload
+CHECKPOINT_DATA_FILE = "data.npy"
+CHECKPOINT_PAYLOAD_FILE = "payload.pkl"
+
+
+# Names of the entries of a checkpoint directory: checkpoint keys (SHA-256 hex
+# digests) and the staging directories of checkpoints being written
+_CHECKPOINT_ENTRY = re.compile(r"[0-9a-f]{64}|\.staging-.*")
+
+# Values represented by `repr`, which is identical across runs for these types
+_SCALAR_TYPES = (type(None), bool, int, float, complex, str, bytes, np.generic)
+
+
+def _import_path(value: Any) -> str:
+    """
+    Return the import path of a class or function, checking that it resolves to
+    the value itself.
+
+    Generated classes (e.g. fused operations) share the path of their factory, so
+    they are represented by their path and their `checkpoint_key`, a stable
+    description of what they compute.
+
+    Raises:
+        ValueError: If the path does not resolve to the value and the value has
+            no `checkpoint_key`.
+    """
+    path = f"{value.__module__}.{value.__qualname__}"
+    checkpoint_key = getattr(value, "checkpoint_key", None)
+    if callable(checkpoint_key):
+        return f"{path}({_stable_repr(checkpoint_key())})"
+    try:
+        resolved: Any = sys.modules.get(value.__module__) or importlib.import_module(
+            value.__module__
+        )
+        for name in value.__qualname__.split("."):
+            resolved = getattr(resolved, name)
+    except (ImportError, AttributeError):
+        resolved = None
+    if resolved is not value:
+        raise ValueError(
+            f"Cannot derive a checkpoint key from {path}, which is not importable "
+            "from its module and defines no checkpoint_key."
+        )
+    return path
+
+
+def _stable_repr(value: Any) -> str:
+    """
+    Represent a configuration value identically across runs and processes:
+    scalars by their `repr`, classes and functions by their import path (see
+    `_import_path`), arrays by their content digest, containers item by item.
+
+    Raises:
+        ValueError: If the value has no such representation (e.g. an object whose
+            `repr` includes its memory address), since it would change the
+            checkpoint keys on every run.
+    """
+    if isinstance(value, _SCALAR_TYPES):
+        return repr(value)
+    if isinstance(value, (type, types.FunctionType, types.BuiltinFunctionType)):
+        return _import_path(value)
+    if isinstance(value, np.ndarray):
+        return f"array({value.shape},{value.dtype.str},{array_digest(value).hex()})"
+    if isinstance(value, dict):
+        items = sorted((_stable_repr(k), _stable_repr(v)) for k, v in value.items())
+        return "{" + ",".join(f"{k}:{v}" for k, v in items) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(_stable_repr(item) for item in value) + "]"
+    if isinstance(value, (set, frozenset)):
+        return "{" + ",".join(sorted(_stable_repr(item) for item in value)) + "}"
+    raise ValueError(
+        f"Cannot derive a checkpoint key from a value of type "
+        f"{type(value).__name__}: {value!r}."
+    )
+
+
+def _data_state(data: Any) -> Dict[str, Any]:
+    """
+    Return the attributes of a data instance other than its samples.
+    """
+    return {
+        name: value
+        for name, value in vars(data).items()
+        if name not in ("_data", "_shared_buffer")
+    }
+
+
+def _context_values(context: Any) -> Dict[str, Any]:
+    """
+    Return the values of a context (`ContextType` or dictionary) as a dictionary.
+    """
+    if isinstance(context, ContextType):
+        return {key: context.get_value(key) for key in context.keys()}
+    return dict(context or {})
+
+
+class PipelineCheckpointer:
+    """
+    Run pipelines while persisting selected intermediate payloads to a directory.
+
+    Nodes are selected by adding `"checkpoint": True` to their configuration.
+    After each selected node, the payload is saved: the samples as a `.npy` file,
+    and the data type, its metadata and the context in a pickle file. A
+    checkpoint is keyed by a digest of the input payload and of the configuration
+    of every node up to the selected one, so changing any upstream node (or the
+    input) invalidates it, while changing downstream nodes does not.
+
+    A run resumes from the last valid checkpoint: its samples are memory-mapped
+    (read-only) instead of recomputing the nodes before it. Checkpoints are
+    written to a temporary directory and renamed, so an interrupted run never
+    leaves a partial checkpoint behind.
+
+    The results of probe collector nodes (probes without a `context_keyword`)
+    are saved with the checkpoints, so a resumed run reports the results of the
+    nodes before its checkpoint too.
+
+    Every value of the configuration, input data and context must have a
+    representation identical across runs (see `checkpoint_keys`).
+
+    Attributes:
+        directory (str): The checkpoint directory.
+        resumed_from (Optional[int]): Index of the node whose checkpoint the last
+            run resumed from, or None if it ran from the start.
+        probe_results (Dict[str, List[Any]]): The results of the probe collector
+            nodes of the last run, keyed as by `Pipeline.get_probe_results` for
+            the whole pipeline (e.g. "Node 2/ProbeName").
+    """
+
+    def __init__(self, directory: str):
+        """
+        Initialize the checkpointer, creating the directory if needed.
+
+        Args:
+            directory (str): The checkpoint directory.
+        """
+        self.directory = str(directory)
+        self.resumed_from: Optional[int] = None
+        self.probe_results: Dict[str, List[Any]] = {}
+        os.makedirs(self.directory, exist_ok=True)
+
+    def checkpoint_keys(
+        self, node_configurations: List[Dict], data: Any, context: Any = None
+    ) -> Dict[int, str]:
+        """
+        Return the key of the checkpoint of each selected node.
+
+        Args:
+            node_configurations (List[Dict]): The pipeline configuration.
+            data (BaseDataType): The input data.
+            context (Any): The input context.
+
+        Returns:
+            Dict[int, str]: The checkpoint key of each selected node index.
+
+        Raises:
+            ValueError: If a value has no representation identical across runs.
+        """
+        digest = hashlib.sha256()
+        digest.update(
+            _stable_repr(
+                [type(data), _data_state(data), data.data, _context_values(context)]
+            ).encode()
+        )
+        keys = {}
+        for index, node in enumerate(node_configurations):
+            digest.update(_stable_repr(node).encode())
+            if node.get("checkpoint"):
+                keys[index] = digest.copy().hexdigest()
+        return keys
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def save(
+        self,
+        key: str,
+        data: Any,
+        context: Any,
+        probe_results: Optional[Dict[str, List[Any]]] = None,
+    ) -> None:
+        """
+        Save a payload as a checkpoint, atomically.
+
+        Args:
+            key (str): The checkpoint key.
+            data (BaseDataType): The data, backed by a NumPy array.
+            context (Any): The context.
+            probe_results (Optional[Dict[str, List[Any]]]): The probe collector
+                results up to the checkpoint.
+        """
+        staging = tempfile.mkdtemp(prefix=".staging-", dir=self.directory)
+        try:
+            np.save(os.path.join(staging, CHECKPOINT_DATA_FILE), data.data)
+            payload = {
+                "data_type": type(data),
+                "state": _data_state(data),
+                "context": _context_values(context),
+                "probe_results": probe_results or {},
+            }
+            with open(os.path.join(staging, CHECKPOINT_PAYLOAD_FILE), "wb") as file:
+                pickle.dump(payload, file)
+            shutil.rmtree(self._path(key), ignore_errors=True)
+            os.replace(staging, self._path(key))
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+    def _load(self, key: str) -> Optional[Tuple[Any, ContextType, Dict]]:
+        """
+        Load a checkpoint and the probe collector results saved with it.
+        """
+        path = self._path(key)
+        if not os.path.isdir(path):
+            return None
+        with open(os.path.join(path, CHECKPOINT_PAYLOAD_FILE), "rb") as file:
+            payload = pickle.load(file)
+        data_type = payload["data_type"]
+        data = data_type.__new__(data_type)
+        data.__dict__.update(payload["state"])
+        data._data = np.load(os.path.join(path, CHECKPOINT_DATA_FILE), mmap_mode="r")
+        return data, ContextType(payload["context"]), payload["probe_results"]
+
+    def load(self, key: str) -> Optional[Tuple[Any, ContextType]]:
+        """
+        Load a checkpoint, memory-mapping its samples.
+
+        Args:
+            key (str): The checkpoint key.
+
+        Returns:
+            Optional[Tuple[BaseDataType, ContextType]]: The payload, or None if
+            there is no such checkpoint.
+        """
+        loaded = self._load(key)
+        return None if loaded is None else loaded[:2]
+
+    def clear(self) -> None:
+        """
+        Delete every checkpoint of the directory, and the staging directories of
+        interrupted runs. Other entries of the directory are left untouched.
+        """
+        for name in os.listdir(self.directory):
+            if _CHECKPOINT_ENTRY.fullmatch(name):
+                shutil.rmtree(self._path(name), ignore_errors=True)
+
+    def run(
+        self,
+        node_configurations: List[Dict],
+        data: Any,
+        context: Any = None,
+        logger: Optional[Logger] = None,
+    ) -> Tuple[Any, ContextType]:
+        """
+        Run a pipeline, resuming from and saving checkpoints.
+
+        Args:
+            node_configurations (List[Dict]): The pipeline configuration, with
+                `"checkpoint": True` on the nodes whose output is saved.
+            data (BaseDataType): The input data.
+            context (Any): The input context (`ContextType` or dictionary).
+            logger (Optional[Logger]): The logger of the pipelines.
+
+        Returns:
+            Tuple[BaseDataType, ContextType]: The output data and context. The
+            probe collector results are left in `probe_results`.
+
+        Raises:
+            ValueError: If a value has no representation identical across runs.
+        """
+        keys = self.checkpoint_keys(node_configurations, data, context)
+        nodes = [
+            {name: value for name, value in node.items() if name != "checkpoint"}
+            for node in node_configurations
+        ]
+        context = ContextType(_context_values(context))
+
+        self.resumed_from = None
+        self.probe_results = {}
+        start = 0
+        for index in sorted(keys, reverse=True):
+            loaded = self._load(keys[index])
+            if loaded is not None:
+                data, context, self.probe_results = loaded
+                self.resumed_from = index
+                start = index + 1
+                break
+
+        for stop in [index + 1 for index in sorted(keys) if index >= start] + [
+            len(nodes)
+        ]:
+            if stop > start:
+                pipeline = Pipeline(nodes[start:stop], logger)
+                data, context = pipeline.process(data, context)
+                # Key the results by the position of the node in the whole pipeline
+                for offset, node in enumerate(pipeline.nodes):
+                    if isinstance(node, ProbeResultCollectorNode):
+                        name = f"Node {start + offset + 1}/"
+                        name += type(node.processor).__name__
+                        self.probe_results[name] = node.get_collected_data()
+                if stop - 1 in keys:
+                    self.save(keys[stop - 1], data, context, self.probe_results)
+            start = stop
+        return data, context
@@ -0,0 +1,296 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+import numpy as np
+from semantiva_audio.processing.cache import array_digest
+
+# Kernels up to this length are always applied directly
+DIRECT_MAX_KERNEL_SIZE = 32
+# Relative cost of one FFT butterfly compared to one multiply-add of np.convolve,
+# measured with NumPy 2.2 (np.convolve is vectorized)
+FFT_COST_FACTOR = 16.0
+# Smallest FFT size used by the overlap-add method
+MIN_FFT_SIZE = 256
+
+
+def _next_power_of_two(value: int) -> int:
+    return 1 << max(int(value) - 1, 0).bit_length()
+
+
+def overlap_add_fft_size(signal_size: int, kernel_size: int) -> int:
+    """
+    Return the FFT size used to convolve a signal with a kernel by overlap-add.
+
+    The size is a power of two of about 8 times the kernel length, which keeps
+    the fraction of each FFT spent on the kernel tail small, without exceeding the
+    size of a single FFT of the whole signal. It is at least twice the kernel
+    length, so that the tail of each block only overlaps the next block.
+    """
+    full_size = _next_power_of_two(signal_size + kernel_size - 1)
+    fft_size = min(_next_power_of_two(8 * kernel_size), full_size)
+    return max(fft_size, _next_power_of_two(2 * kernel_size), MIN_FFT_SIZE)
+
+
+def choose_convolution_method(signal_size: int, kernel_size: int) -> str:
+    """
+    Choose between direct convolution and FFT overlap-add from the problem size.
+
+    Direct convolution costs about `signal_size * kernel_size` multiply-adds.
+    Overlap-add costs, per block of `fft_size - kernel_size + 1` samples, a forward
+    and an inverse FFT of `fft_size` samples.
+
+    Args:
+        signal_size (int): Number of samples of the signal (per channel).
+        kernel_size (int): Number of taps of the kernel.
+
+    Returns:
+        str: "direct" or "fft".
+    """
+    if kernel_size <= DIRECT_MAX_KERNEL_SIZE or signal_size == 0:
+        return "direct"
+    fft_size = overlap_add_fft_size(signal_size, kernel_size)
+    blocks = -(-signal_size // (fft_size - kernel_size + 1))
+    fft_cost = FFT_COST_FACTOR * blocks * fft_size * np.log2(fft_size)
+    return "direct" if signal_size * kernel_size <= fft_cost else "fft"
+
+
+class KernelSpectrumCache:
+    """
+    A bounded cache of FIR kernel spectra, keyed by kernel content and FFT size.
+
+    Filtering a stream (or many files) with the same kernel computes its spectrum
+    once. Keys are a digest of the kernel samples, so kernels given as new arrays
+    or lists on every call still hit the cache. The cache is thread-safe.
+
+    Attributes:
+        maxsize (int): Maximum number of spectra kept; the least recently used is
+            evicted first.
+        hits (int): Number of spectra found in the cache.
+        misses (int): Number of spectra computed.
+    """
+
+    def __init__(self, maxsize: int = 16):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize (int): Maximum number of spectra kept. Defaults to 16.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._spectra: OrderedDict[Tuple[Any, ...], np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def spectrum(self, kernel: np.ndarray, fft_size: int) -> np.ndarray:
+        """
+        Return the real FFT of a kernel, zero-padded to `fft_size`, along its last axis.
+
+        Args:
+            kernel (np.ndarray): The kernel, with taps along the last axis.
+            fft_size (int): The FFT size.
+
+        Returns:
+            np.ndarray: The (read-only) spectrum.
+        """
+        kernel = np.ascontiguousarray(kernel)
+        key = (
+            kernel.shape,
+            kernel.dtype.str,
+            fft_size,
+            array_digest(kernel),
+        )
+        with self._lock:
+            spectrum = self._spectra.get(key)
+            if spectrum is not None:
+                self._spectra.move_to_end(key)
+                self.hits += 1
+                return spectrum
+            self.misses += 1
+        spectrum = np.fft.rfft(kernel, fft_size, axis=-1)
+        spectrum.flags.writeable = False
+        with self._lock:
+            self._spectra[key] = spectrum
+            while len(self._spectra) > self.maxsize:
+                self._spectra.popitem(last=False)
+        return spectrum
+
+    def clear(self) -> None:
+        """
+        Drop all cached spectra.
+        """
+        with self._lock:
+            self._spectra.clear()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of cached spectra.
+        """
+        with self._lock:
+            return len(self._spectra)
+
+
+# Cache shared by the FIR filter operations by default
+KERNEL_SPECTRA = KernelSpectrumCache()
+
+
+def _direct_convolution(signal: np.ndarray, kernel: np.ndarray) -> np.ndarray:
+    """
+    Full linear convolution along the last axis, one channel at a time.
+    """
+    channels = signal.shape[:-1]
+    full = np.empty(
+        channels + (signal.shape[-1] + kernel.shape[-1] - 1,), dtype=signal.dtype
+    )
+    kernels = np.broadcast_to(kernel, channels + kernel.shape[-1:])
+    for index in np.ndindex(*channels):
+        full[index] = np.convolve(signal[index], kernels[index])
+    return full
+
+
+def _overlap_add_convolution(
+    signal: np.ndarray,
+    kernel: np.ndarray,
+    cache: Optional[KernelSpectrumCache] = None,
+) -> np.ndarray:
+    """
+    Full linear convolution along the last axis with FFT overlap-add.
+
+    The signal is cut into blocks which are transformed, multiplied by the kernel
+    spectrum and transformed back in batched FFT calls. Each block output only
+    overlaps the next block, so the outputs are added with two slice operations.
+    """
+    signal_size, kernel_size = signal.shape[-1], kernel.shape[-1]
+    fft_size = overlap_add_fft_size(signal_size, kernel_size)
+    block_size = fft_size - kernel_size + 1
+    blocks = -(-signal_size // block_size)
+    channels = signal.shape[:-1]
+
+    padded = np.zeros(channels + (blocks * block_size,), dtype=signal.dtype)
+    padded[..., :signal_size] = signal
+    padded = padded.reshape(channels + (blocks, block_size))
+
+    cache = KERNEL_SPECTRA if cache is None else cache
+    spectrum = cache.spectrum(kernel, fft_size)
+    if spectrum.ndim > 1:
+        # Per-channel kernels: broadcast each spectrum over the blocks
+        spectrum = spectrum[..., np.newaxis, :]
+    block_spectra = np.fft.rfft(padded, fft_size, axis=-1)
+    block_spectra *= spectrum
+    outputs = np.fft.irfft(block_spectra, fft_size, axis=-1)
+
+    # The FFTs compute in float32 at least: add the block outputs in the signal
+    # type, which is the type of the direct convolution result
+    full = np.zeros(channels + (blocks + 1, block_size), dtype=signal.dtype)
+    full[..., :-1, :] = outputs[..., :block_size]
+    full[..., 1:, : kernel_size - 1] += outputs[..., block_size:]
+    full = full.reshape(channels + ((blocks + 1) * block_size,))
+    return full[..., : signal_size + kernel_size - 1]
+
+
+def fir_filter(
+    signal: np.ndarray,
+    kernel: np.ndarray,
+    state: Optional[np.ndarray] = None,
+    method: Optional[str] = None,
+    cache: Optional[KernelSpectrumCache] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Filter a signal with a FIR kernel, along the last axis.
+
+    The output has the length of the signal: `y[n] = sum_k kernel[k] * x[n - k]`.
+    The tail of the convolution (the last `len(kernel) - 1` samples) is returned
+    as the state to pass with the next chunk of a stream, which makes filtering
+    chunk by chunk give the same output as filtering the whole signal.
+
+    Args:
+        signal (np.ndarray): The float samples, with time along the last axis.
+        kernel (np.ndarray): The taps, with a shape broadcastable against the
+            signal (one kernel for all channels, or one per channel).
+        state (Optional[np.ndarray]): The state returned for the previous chunk.
+        method (Optional[str]): "direct", "fft" or None to choose from the sizes.
+        cache (Optional[KernelSpectrumCache]): Cache of kernel spectra. Defaults
+            to `KERNEL_SPECTRA`.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The filtered signal and the new state.
+
+    Raises:
+        ValueError: If the method is unknown or the state does not match the kernel.
+    """
+    signal_size, kernel_size = signal.shape[-1], kernel.shape[-1]
+    method = method or choose_convolution_method(signal_size, kernel_size)
+    if method == "direct":
+        full = _direct_convolution(signal, kernel)
+    elif method == "fft":
+        full = _overlap_add_convolution(signal, kernel, cache)
+    else:
+        raise ValueError(f"Unknown convolution method '{method}'.")
+
+    if state is not None:
+        if state.shape != full[..., : kernel_size - 1].shape:
+            raise ValueError(
+                f"Filter state {state.shape} does not match the kernel and signal."
+            )
+        full[..., : kernel_size - 1] += state
+    return full[..., :signal_size], full[..., signal_size:].copy()
+
+
+class AudioFIRFilterMixin:
+    """
+    Mixin for audio operations filtering each channel with a FIR kernel.
+
+    The kernel is either a single 1-D kernel applied to all channels or, for
+    multi-channel data, a (taps, channels) array with one kernel per channel.
+    Direct convolution or FFT overlap-add is chosen from the signal and kernel
+    sizes, unless `method` is set. While processing a stream, the tail of the
+    convolution is carried in `stream_state` and added to the next chunk.
+
+    Attributes:
+        method (Optional[str]): "direct", "fft" or None to choose automatically.
+        spectrum_cache (KernelSpectrumCache): Cache of kernel spectra.
+    """
+
+    method: Optional[str] = None
+    spectrum_cache: KernelSpectrumCache = KERNEL_SPECTRA
+    stream_state: Any = None
+    is_streaming: bool
+    _output_buffer: Any
+
+    def _fir_filter(self, samples: np.ndarray, kernel) -> np.ndarray:
+        """
+        Filter float samples, shaped (samples,) or (samples, channels).
+
+        Returns:
+            np.ndarray: The filtered samples, with the shape of the input, in the
+            output buffer of the operation if it has one. Multi-channel outputs
+            are planar unless written into an output buffer.
+
+        Raises:
+            ValueError: If the kernel does not match the number of channels.
+        """
+        taps = np.asarray(kernel)
+        if taps.ndim == 0 or taps.ndim > samples.ndim or taps.shape[0] == 0:
+            raise ValueError(f"Invalid FIR kernel of shape {taps.shape}.")
+        if taps.ndim == 2 and taps.shape[1] != samples.shape[1]:
+            raise ValueError(
+                f"Expected one kernel per channel ({samples.shape[1]}), "
+                f"got shape {taps.shape}."
+            )
+        taps = np.moveaxis(taps.astype(samples.dtype, copy=False), 0, -1)
+        state = self.stream_state if self.is_streaming else None
+        filtered, state = fir_filter(
+            np.moveaxis(samples, 0, -1),
+            taps,
+            state=state,
+            method=self.method,
+            cache=self.spectrum_cache,
+        )
+        if self.is_streaming:
+            self.stream_state = state
+        filtered = np.moveaxis(filtered, -1, 0)
+        out = self._output_buffer(samples, filtered.dtype)
+        if out is None:
+            return filtered
+        np.copyto(out, filtered)
+        return out
@@ -0,0 +1,72 @@
+from semantiva_audio.data_types.data_types import (
+    PLANAR,
+    SingleChannelAudioDataType,
+    DualChannelAudioDataType,
+    MultiChannelAudioDataType,
+)
+from semantiva_audio.processing.operations import (
+    SingleChannelAudioOperation,
+    DualChannelAudioOperation,
+    MultiChannelAudioOperation,
+)
+from semantiva_audio.processing.convolution import AudioFIRFilterMixin
+from semantiva_audio.processing.parallel import CHANNEL_SPLIT
+
+
+class SingleChannelAudioFIRFilterOperation(
+    AudioFIRFilterMixin, SingleChannelAudioOperation
+):
+    """
+    Filter single-channel audio data with a FIR kernel (e.g. a room impulse response).
+
+    Short kernels are applied by direct convolution, long ones by FFT overlap-add
+    (see `AudioFIRFilterMixin`). The output has the length of the input, and
+    streams are filtered chunk by chunk with the same result as a whole signal.
+    """
+
+    def _process_logic(self, data, kernel):
+        self.logger.debug("Inside the SingleChannelAudioFIRFilterOperation")
+        samples = data.as_float()
+        filtered = self._fir_filter(samples, kernel)
+        return SingleChannelAudioDataType.from_validated(filtered)
+
+
+class DualChannelAudioFIRFilterOperation(
+    AudioFIRFilterMixin, DualChannelAudioOperation
+):
+    """
+    Filter each channel of dual-channel audio data with a FIR kernel.
+
+    The kernel is shared by both channels or given per channel, as a (taps, 2)
+    array. The operation works on planar data, and its output is planar.
+    """
+
+    preferred_layout = PLANAR
+    parallel_splits = {CHANNEL_SPLIT: {"kernel": 2}}
+
+    def _process_logic(self, data, kernel):
+        self.logger.debug("Inside the DualChannelAudioFIRFilterOperation")
+        samples = self._in_preferred_layout(data).as_float()
+        filtered = self._fir_filter(samples, kernel)
+        return DualChannelAudioDataType.from_validated(filtered)
+
+
+class MultiChannelAudioFIRFilterOperation(
+    AudioFIRFilterMixin, MultiChannelAudioOperation
+):
+    """
+    Filter each channel of multi-channel audio data with a FIR kernel.
+
+    The kernel is shared by all channels or given per channel, as a
+    (taps, channels) array. The operation works on planar data, and its output
+    is planar.
+    """
+
+    preferred_layout = PLANAR
+    parallel_splits = {CHANNEL_SPLIT: {"kernel": 2}}
+
+    def _process_logic(self, data, kernel):
+        self.logger.debug("Inside the MultiChannelAudioFIRFilterOperation")
+        samples = self._in_preferred_layout(data).as_float()
+        filtered = self._fir_filter(samples, kernel)
+        return MultiChannelAudioDataType.from_validated(filtered)
@@ -0,0 +1,278 @@
+from abc import abstractmethod
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+import numpy as np
+from semantiva.component_loader import ComponentLoader
+from semantiva.data_processors import DataOperation
+from semantiva_audio.processing.operations import (
+    AudioOutputBufferMixin,
+    AudioStreamMixin,
+)
+from semantiva_audio.processing.parallel import TIME_SPLIT
+
+# Number of samples along the time axis processed per block by fused kernels.
+# Small enough for a block of a stereo float64 signal to stay in the L2 cache.
+FUSION_BLOCK_SIZE = 16384
+
+
+class ElementwiseStep(NamedTuple):
+    """
+    A single elementwise transformation of audio samples.
+
+    Attributes:
+        kind (str): Either "affine" (`x * a + b`) or "clip" (`clip(x, a, b)`).
+        a (Any): Scale of an affine step, or lower bound of a clip step.
+        b (Any): Offset of an affine step, or upper bound of a clip step.
+    """
+
+    kind: str
+    a: Any
+    b: Any
+
+
+def _as_parameter(value):
+    """
+    Keep scalars as Python scalars, so they do not promote the sample dtype,
+    and convert sequences (e.g. per-channel values) to arrays.
+    """
+    return value if value is None or np.isscalar(value) else np.asarray(value)
+
+
+def affine_step(scale=1.0, offset=0.0) -> ElementwiseStep:
+    """
+    Create an elementwise step computing `x * scale + offset`.
+    """
+    return ElementwiseStep("affine", _as_parameter(scale), _as_parameter(offset))
+
+
+def clip_step(minimum=None, maximum=None) -> ElementwiseStep:
+    """
+    Create an elementwise step limiting samples to [minimum, maximum].
+    """
+    return ElementwiseStep("clip", _as_parameter(minimum), _as_parameter(maximum))
+
+
+def fold_elementwise_steps(steps: Sequence[ElementwiseStep]) -> List[ElementwiseStep]:
+    """
+    Merge consecutive affine steps into a single affine step.
+
+    `(x * a1 + b1) * a2 + b2` is folded into `x * (a1 * a2) + (b1 * a2 + b2)`.
+
+    Args:
+        steps (Sequence[ElementwiseStep]): The steps, in application order.
+
+    Returns:
+        List[ElementwiseStep]: The equivalent, folded steps.
+    """
+    folded: List[ElementwiseStep] = []
+    for step in steps:
+        if step.kind == "affine" and folded and folded[-1].kind == "affine":
+            previous = folded.pop()
+            step = affine_step(previous.a * step.a, previous.b * step.a + step.b)
+        folded.append(step)
+    return folded
+
+
+def elementwise_result_type(samples: np.ndarray, steps: Sequence[ElementwiseStep]):
+    """
+    Return the dtype of the result of applying the steps to the samples.
+
+    Float samples keep their type, as with the unfused audio operations.
+    """
+    if samples.dtype.kind == "f":
+        return samples.dtype
+    return np.result_type(
+        samples.dtype,
+        *(p for step in steps for p in (step.a, step.b) if p is not None),
+    )
+
+
+def apply_elementwise_steps(
+    samples: np.ndarray,
+    steps: Sequence[ElementwiseStep],
+    out: Optional[np.ndarray] = None,
+    block_size: int = FUSION_BLOCK_SIZE,
+) -> np.ndarray:
+    """
+    Apply a chain of elementwise steps with a single pass over memory.
+
+    The signal is processed in blocks along its first (time) axis, and every step
+    is applied to a block before moving on to the next one. Each sample is read
+    from and written to main memory once, whatever the number of steps.
+
+    Args:
+        samples (np.ndarray): The input samples, with time along the first axis.
+        steps (Sequence[ElementwiseStep]): The steps, in application order.
+        out (Optional[np.ndarray]): Output buffer. May be `samples` itself.
+            Defaults to a new array with the memory layout of `samples`.
+        block_size (int): Number of samples along the time axis per block.
+
+    Returns:
+        np.ndarray: The output buffer.
+    """
+    steps = fold_elementwise_steps(steps)
+    if out is None:
+        out = np.empty_like(samples, dtype=elementwise_result_type(samples, steps))
+    if not steps:
+        np.copyto(out, samples)
+        return out
+
+    for start in range(0, max(samples.shape[0], 1), block_size):
+        source = samples[start : start + block_size]
+        target = out[start : start + block_size]
+        for step in steps:
+            if step.kind == "affine":
+                np.multiply(source, step.a, out=target, casting="unsafe")
+                if np.any(step.b != 0):
+                    np.add(target, step.b, out=target, casting="unsafe")
+            elif step.kind == "clip":
+                np.clip(source, step.a, step.b, out=target, casting="unsafe")
+            else:
+                raise ValueError(f"Unknown elementwise step '{step.kind}'.")
+            source = target
+    return out
+
+
+class ElementwiseAudioOperationMixin:
+    """
+    Mixin for audio operations that transform each sample independently.
+
+    Such operations describe themselves as a list of `ElementwiseStep`, which
+    allows consecutive elementwise nodes of a pipeline to be fused by
+    `fuse_elementwise_operations`, and their work to be split into time blocks
+    by `AudioParallelExecutor`.
+    """
+
+    parallel_splits: Dict[str, Dict[str, int]] = {TIME_SPLIT: {}}
+
+    @classmethod
+    @abstractmethod
+    def elementwise_steps(cls, **parameters) -> List[ElementwiseStep]:
+        """
+        Describe the operation as elementwise steps.
+
+        Args:
+            **parameters: The processing parameters of the operation.
+
+        Returns:
+            List[ElementwiseStep]: The steps applied by the operation, in order.
+        """
+
+
+def fused_operation_factory(processors: Sequence[Any], parameters: Sequence[Dict]):
+    """
+    Create an operation class applying a chain of elementwise operations at once.
+
+    Args:
+        processors (Sequence[type]): Elementwise operation classes, in order. They
+            must share the same input and output data type.
+        parameters (Sequence[Dict]): The processing parameters of each operation.
+
+    Returns:
+        Type[DataOperation]: A parameterless operation applying all the steps in one pass.
+    """
+    data_type = processors[0].input_data_type()
+    steps = fold_elementwise_steps(
+        [
+            step
+            for processor, processor_parameters in zip(processors, parameters)
+            for step in processor.elementwise_steps(**processor_parameters)
+        ]
+    )
+
+    def _process_logic(self, data):
+        samples = data.as_float()
+        out = self._output_buffer(samples, elementwise_result_type(samples, steps))
+        return data_type.from_validated(
+            apply_elementwise_steps(samples, steps, out=out)
+        )
+
+    def elementwise_steps(cls, **_) -> List[ElementwiseStep]:
+        return list(steps)
+
+    def checkpoint_key(cls):
+        # The steps only exist in this closure: describe them, with the fused
+        # operations, so differently parameterized fusions are told apart
+        return (tuple(processors), [tuple(step) for step in steps])
+
+    class_name = "Fused_" + "_".join(processor.__name__ for processor in processors)
+    return type(
+        class_name,
+        (
+            ElementwiseAudioOperationMixin,
+            AudioOutputBufferMixin,
+            AudioStreamMixin,
+            DataOperation,
+        ),
+        {
+            "_process_logic": _process_logic,
+            "elementwise_steps": classmethod(elementwise_steps),
+            "checkpoint_key": classmethod(checkpoint_key),
+            "input_data_type": staticmethod(lambda: data_type),
+            "output_data_type": staticmethod(lambda: data_type),
+            "fused_processors": tuple(processors),
+        },
+    )
+
+
+def _fusable(processor: Any, parameters: Dict) -> bool:
+    """
+    Whether a node can be fused: it is elementwise, preserves its data type and
+    all of its parameters are set in the node configuration (not the context).
+    """
+    return (
+        isinstance(processor, type)
+        and issubclass(processor, DataOperation)
+        and issubclass(processor, ElementwiseAudioOperationMixin)
+        and processor.input_data_type() == processor.output_data_type()
+        and set(processor.get_processing_parameter_names()) <= set(parameters)
+    )
+
+
+def fuse_elementwise_operations(node_configurations: List[Dict]) -> List[Dict]:
+    """
+    Replace runs of consecutive elementwise nodes by a single fused node.
+
+    Runs are broken by any other node (including probes), by nodes taking
+    parameters from the context and by a change of data type. The returned
+    configuration can be passed to `Pipeline` in place of the original one.
+
+    Args:
+        node_configurations (List[Dict]): A pipeline configuration.
+
+    Returns:
+        List[Dict]: The pipeline configuration with elementwise runs fused.
+    """
+    fused_configurations: List[Dict] = []
+    run: List[Dict] = []
+
+    def flush_run():
+        if len(run) > 1:
+            fused_configurations.append(
+                {
+                    "processor": fused_operation_factory(
+                        [node["processor"] for node in run],
+                        [node.get("parameters", {}) for node in run],
+                    )
+                }
+            )
+        else:
+            fused_configurations.extend(run)
+        run.clear()
+
+    for node in node_configurations:
+        processor: Any = node.get("processor")
+        if isinstance(processor, str) and ":" not in processor:
+            processor = ComponentLoader.get_class(processor)
+        parameters = node.get("parameters", {})
+        if "context_keyword" not in node and _fusable(processor, parameters):
+            resolved = {**node, "processor": processor}
+            if run and run[0]["processor"].input_data_type() != (
+                processor.input_data_type()
+            ):
+                flush_run()
+            run.append(resolved)
+            continue
+        flush_run()
+        fused_configurations.append(node)
+    flush_run()
+    return fused_configurations
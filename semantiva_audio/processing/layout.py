@@ -0,0 +1,92 @@
+from typing import Any, Dict, List, Optional
+from semantiva.component_loader import ComponentLoader
+from semantiva.data_processors import DataOperation
+from semantiva_audio.data_types.data_types import (
+    INTERLEAVED,
+    PLANAR,
+    DualChannelAudioDataType,
+    MultiChannelAudioDataType,
+)
+from semantiva_audio.processing.processors import (
+    DualChannelToInterleavedOperation,
+    DualChannelToPlanarOperation,
+    MultiChannelToInterleavedOperation,
+    MultiChannelToPlanarOperation,
+)
+
+# Operation converting each multi-channel data type to each layout
+LAYOUT_CONVERSIONS: Dict[type, Dict[str, type]] = {
+    DualChannelAudioDataType: {
+        INTERLEAVED: DualChannelToInterleavedOperation,
+        PLANAR: DualChannelToPlanarOperation,
+    },
+    MultiChannelAudioDataType: {
+        INTERLEAVED: MultiChannelToInterleavedOperation,
+        PLANAR: MultiChannelToPlanarOperation,
+    },
+}
+_CONVERSION_OPERATIONS = {
+    operation
+    for conversions in LAYOUT_CONVERSIONS.values()
+    for operation in conversions.values()
+}
+
+
+def _resolve_processor(processor: Any) -> Any:
+    """
+    Resolve a processor given by class name, leaving other processors unchanged.
+    """
+    if isinstance(processor, str) and ":" not in processor:
+        return ComponentLoader.get_class(processor)
+    return processor
+
+
+def insert_layout_conversions(node_configurations: List[Dict]) -> List[Dict]:
+    """
+    Insert layout conversion nodes before the nodes preferring another layout.
+
+    The layout of the multi-channel data is tracked along the pipeline: nodes
+    without a preference (and probes) keep it, conversion nodes set it, and any
+    node changing the data type makes it unknown. A
+    conversion node is only inserted where the layout preferred by a node differs
+    from the tracked one, so the data is converted once per change of preference
+    rather than once per node. Since conversions return data already in the
+    requested layout unchanged, a conversion inserted where the layout was
+    unknown costs nothing if the data turns out to be in that layout.
+
+    Args:
+        node_configurations (List[Dict]): A pipeline configuration.
+
+    Returns:
+        List[Dict]: The pipeline configuration with conversion nodes inserted.
+    """
+    converted_configurations: List[Dict] = []
+    layout: Optional[str] = None
+    for node in node_configurations:
+        processor = _resolve_processor(node.get("processor"))
+        if not (isinstance(processor, type) and issubclass(processor, DataOperation)):
+            # Probes and context processors leave the data untouched
+            converted_configurations.append(node)
+            continue
+
+        input_type = processor.input_data_type()
+        preferred_layout = getattr(processor, "preferred_layout", None)
+        if (
+            input_type in LAYOUT_CONVERSIONS
+            and preferred_layout is not None
+            and preferred_layout != layout
+            and processor not in _CONVERSION_OPERATIONS
+        ):
+            converted_configurations.append(
+                {"processor": LAYOUT_CONVERSIONS[input_type][preferred_layout]}
+            )
+            layout = preferred_layout
+        converted_configurations.append(node)
+
+        if input_type not in LAYOUT_CONVERSIONS or (
+            processor.output_data_type() != input_type
+        ):
+            layout = None
+        elif preferred_layout is not None:
+            layout = preferred_layout
+    return converted_configurations
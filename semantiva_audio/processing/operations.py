@@ -1,11 +1,226 @@
+from typing import Any, Dict, Iterable, Iterator, Optional
+import numpy as np
 from semantiva.data_processors import DataOperation, DataProbe
+from semantiva.data_types import BaseDataType
+from semantiva_audio.processing.buffer_pool import AudioBufferPool
+from semantiva_audio.processing.cache import AudioResultCacheMixin
+from semantiva_audio.processing.profiling import AudioProfilingMixin
 from semantiva_audio.data_types.data_types import (
+    PLANAR,
+    channel_layout,
     SingleChannelAudioDataType,
     DualChannelAudioDataType,
+    MultiChannelAudioDataType,
+    SpectrogramDataType,
+    SingleChannelAudioBatchDataType,
+    DualChannelAudioBatchDataType,
 )
 
 
-class SingleChannelAudioOperation(DataOperation):
+class AudioStreamMixin:
+    """
+    Mixin adding chunk-by-chunk (streaming) processing to audio operations and probes.
+
+    `process_stream` runs the operation on each chunk of a stream in turn. Stateless
+    operations need no changes. Probes yield their result for each chunk, and may
+    accumulate results over the stream in `stream_state`. Operations whose output depends on previous samples
+    (filters, resamplers, ...) keep that state in `stream_state` while
+    `is_streaming` is true, and may override `_flush_stream` to emit the samples
+    still held in their state once the stream is exhausted. Callers pushing chunks
+    one at a time (e.g. in real time) use `start_stream` and `stop_stream` instead.
+
+    Attributes:
+        stream_state (Any): State carried between chunks. Reset at the start of every stream.
+    """
+
+    stream_state: Any = None
+    _streaming: bool = False
+
+    @property
+    def is_streaming(self) -> bool:
+        """
+        Whether the operation is currently processing a stream of chunks.
+        """
+        return self._streaming
+
+    def _flush_stream(self, *args, **kwargs) -> Optional[BaseDataType]:
+        """
+        Emit the samples held in `stream_state` at the end of a stream.
+
+        Returns:
+            Optional[BaseDataType]: A final chunk, or None if there is nothing to flush.
+        """
+        return None
+
+    def process_stream(
+        self, chunks: Iterable[BaseDataType], *args, **kwargs
+    ) -> Iterator[BaseDataType]:
+        """
+        Process a stream of audio chunks, carrying state from one chunk to the next.
+
+        Args:
+            chunks (Iterable[BaseDataType]): The input chunks, in time order.
+            *args: Positional arguments passed to the operation for every chunk.
+            **kwargs: Keyword arguments passed to the operation for every chunk.
+
+        Yields:
+            BaseDataType: The processed chunks, in time order.
+        """
+        self.start_stream()
+        try:
+            for chunk in chunks:
+                yield self.process(chunk, *args, **kwargs)  # type: ignore[attr-defined]
+            tail = self._flush_stream(*args, **kwargs)
+            if tail is not None:
+                yield tail
+        finally:
+            self.stop_stream()
+
+    def start_stream(self) -> None:
+        """
+        Start a stream driven chunk by chunk by the caller: the state is reset, and
+        the chunks given to `process` (or `process_into`) until `stop_stream` are
+        processed as consecutive parts of one signal.
+        """
+        self.stream_state = None
+        self._streaming = True
+
+    def stop_stream(self) -> None:
+        """
+        End a stream started with `start_stream`, dropping its state.
+        """
+        self._streaming = False
+        self.stream_state = None
+
+
+class AudioOutputBufferMixin:
+    """
+    Mixin letting audio operations write their result into an existing buffer.
+
+    Operations call `_output_buffer` from `_process_logic` to get the array to write
+    their result into (e.g. through the `out=` argument of NumPy functions). The
+    buffer is, in order of precedence:
+
+    - the buffer given to `process_into`;
+    - the input samples themselves, if `in_place` is set and they can hold the result;
+    - a buffer taken from `buffer_pool`, if one is set;
+    - None, in which case the operation allocates a new array.
+
+    Attributes:
+        in_place (bool): Overwrite the input samples when possible. Only enable it
+            when the input payload is not referenced elsewhere.
+        buffer_pool (Optional[AudioBufferPool]): Pool providing output buffers.
+        parallel_splits (Dict[str, Dict[str, int]]): The ways `AudioParallelExecutor`
+            may split the work of the operation ("time", "channel" or "clip"),
+            each mapped to the parameters holding one value per channel (or clip)
+            and the number of dimensions from which they do. Empty for operations
+            that cannot be split.
+    """
+
+    in_place: bool = False
+    buffer_pool: Optional[AudioBufferPool] = None
+    parallel_splits: Dict[str, Dict[str, int]] = {}
+    _out: Optional[np.ndarray] = None
+
+    def process_into(self, data: BaseDataType, out: np.ndarray, *args, **kwargs):
+        """
+        Process the data, writing the result into the provided buffer.
+
+        Args:
+            data (BaseDataType): The input data.
+            out (np.ndarray): The output buffer. May be the input samples themselves.
+            *args: Positional arguments passed to the operation.
+            **kwargs: Keyword arguments passed to the operation.
+
+        Returns:
+            BaseDataType: The output data, backed by `out` if the operation supports it.
+        """
+        self._out = out
+        try:
+            return self.process(data, *args, **kwargs)  # type: ignore[attr-defined]
+        finally:
+            self._out = None
+
+    def _output_buffer(
+        self, source: np.ndarray, dtype, shape: Optional[tuple] = None
+    ) -> Optional[np.ndarray]:
+        """
+        Get the buffer the result of the operation should be written into.
+
+        Args:
+            source (np.ndarray): The input samples.
+            dtype (np.dtype): The type of the result.
+            shape (Optional[tuple]): The shape of the result. Defaults to the input shape.
+
+        Returns:
+            Optional[np.ndarray]: The output buffer, or None to allocate a new array.
+
+        Raises:
+            ValueError: If the buffer given to `process_into` cannot hold the result.
+        """
+        shape = source.shape if shape is None else shape
+        if self._out is not None:
+            if self._out.shape != shape or not np.can_cast(
+                dtype, self._out.dtype, casting="same_kind"
+            ):
+                raise ValueError(
+                    f"Output buffer {self._out.shape} {self._out.dtype} cannot hold "
+                    f"a {shape} {np.dtype(dtype)} result."
+                )
+            return self._out
+        if (
+            self.in_place
+            and source.shape == shape
+            and source.flags.writeable
+            and np.can_cast(dtype, source.dtype)
+        ):
+            return source
+        if self.buffer_pool is not None:
+            if len(shape) >= 2 and channel_layout(source) == PLANAR:
+                # Keep planar inputs planar: a transposed view of a pooled buffer
+                return self.buffer_pool.acquire(shape[::-1], dtype).T
+            return self.buffer_pool.acquire(shape, dtype)
+        return None
+
+
+class AudioChannelLayoutOperationMixin:
+    """
+    Mixin letting multi-channel audio operations declare their preferred layout.
+
+    Operations processing each channel separately (filters, resamplers,
+    transforms) run faster on planar data, where every channel is contiguous.
+    They set `preferred_layout`, and `insert_layout_conversions` converts the data
+    of a pipeline once, before the first node preferring another layout than the
+    current one, instead of each node converting (or reading strided samples).
+    Operations call `_in_preferred_layout` to also handle data received in
+    another layout, e.g. when used outside of a pipeline.
+
+    Operations without a preference must preserve the layout of their input,
+    which NumPy ufuncs and `_output_buffer` do.
+
+    Attributes:
+        preferred_layout (Optional[str]): `INTERLEAVED`, `PLANAR`, or None for
+            operations running equally well on both.
+    """
+
+    preferred_layout: Optional[str] = None
+
+    def _in_preferred_layout(self, data):
+        """
+        Return the data in the preferred layout of the operation, converting it if needed.
+        """
+        if self.preferred_layout is None:
+            return data
+        return data.to_layout(self.preferred_layout)
+
+
+class SingleChannelAudioOperation(
+    AudioProfilingMixin,
+    AudioResultCacheMixin,
+    AudioOutputBufferMixin,
+    AudioStreamMixin,
+    DataOperation,
+):
     """
     An operation specialized for processing single-channel audio data.
 
@@ -15,6 +230,10 @@ class SingleChannelAudioOperation(DataOperation):
     Methods:
         input_data_type: Returns the expected input data type.
         output_data_type: Returns the type of data output by the operation.
+        process: Processes the data, reusing results cached in `result_cache` if set,
+            and reporting the call to `profiler` if set.
+        process_stream: Processes a stream of chunks, carrying state between them.
+        process_into: Processes the data into a provided output buffer.
     """
 
     @staticmethod
@@ -38,16 +257,28 @@ class SingleChannelAudioOperation(DataOperation):
         return SingleChannelAudioDataType
 
 
-class DualChannelAudioOperation(DataOperation):
+class DualChannelAudioOperation(
+    AudioProfilingMixin,
+    AudioResultCacheMixin,
+    AudioChannelLayoutOperationMixin,
+    AudioOutputBufferMixin,
+    AudioStreamMixin,
+    DataOperation,
+):
     """
     An operation specialized for processing dual-channel (stereo) audio data.
 
     This class implements the `DataOperation` abstract base class to define
-    operations that accept and produce `DualChannelAudioDataType`.
+    operations that accept and produce `DualChannelAudioDataType`. Subclasses
+    may set `preferred_layout` (see `AudioChannelLayoutOperationMixin`).
 
     Methods:
         input_data_type: Returns the expected input data type.
         output_data_type: Returns the type of data output by the operation.
+        process: Processes the data, reusing results cached in `result_cache` if set,
+            and reporting the call to `profiler` if set.
+        process_stream: Processes a stream of chunks, carrying state between them.
+        process_into: Processes the data into a provided output buffer.
     """
 
     @staticmethod
@@ -71,7 +302,139 @@ class DualChannelAudioOperation(DataOperation):
         return DualChannelAudioDataType
 
 
-class DualChannelMergerOperation(DataOperation):
+class MultiChannelAudioOperation(
+    AudioProfilingMixin,
+    AudioResultCacheMixin,
+    AudioChannelLayoutOperationMixin,
+    AudioOutputBufferMixin,
+    AudioStreamMixin,
+    DataOperation,
+):
+    """
+    An operation specialized for processing multi-channel audio data.
+
+    This class implements the `DataOperation` abstract base class to define
+    operations that accept and produce `MultiChannelAudioDataType`. The number of
+    channels of the output may differ from the input (e.g. channel mixing).
+    Subclasses may set `preferred_layout` (see `AudioChannelLayoutOperationMixin`).
+
+    Methods:
+        input_data_type: Returns the expected input data type.
+        output_data_type: Returns the type of data output by the operation.
+        process: Processes the data, reusing results cached in `result_cache` if set,
+            and reporting the call to `profiler` if set.
+        process_stream: Processes a stream of chunks, carrying state between them.
+        process_into: Processes the data into a provided output buffer.
+    """
+
+    @staticmethod
+    def input_data_type():
+        """
+        Specify the input data type for the operation.
+
+        Returns:
+            type: `MultiChannelAudioDataType`, representing multi-channel audio.
+        """
+        return MultiChannelAudioDataType
+
+    @staticmethod
+    def output_data_type():
+        """
+        Specify the output data type for the operation.
+
+        Returns:
+            type: `MultiChannelAudioDataType`, representing multi-channel audio.
+        """
+        return MultiChannelAudioDataType
+
+
+class SingleChannelAudioBatchOperation(
+    AudioProfilingMixin, AudioResultCacheMixin, AudioOutputBufferMixin, DataOperation
+):
+    """
+    An operation specialized for processing batches of single-channel audio clips.
+
+    This class implements the `DataOperation` abstract base class to define
+    operations that accept and produce `SingleChannelAudioBatchDataType`. Unlike a
+    `SingleChannelAudioOperation`, which a pipeline applies clip by clip to a batch,
+    a batch operation processes the whole (clips, samples) array at once.
+
+    Methods:
+        input_data_type: Returns the expected input data type.
+        output_data_type: Returns the type of data output by the operation.
+        process: Processes the data, reusing results cached in `result_cache` if set,
+            and reporting the call to `profiler` if set.
+        process_into: Processes the data into a provided output buffer.
+    """
+
+    @staticmethod
+    def input_data_type():
+        """
+        Specify the input data type for the operation.
+
+        Returns:
+            type: `SingleChannelAudioBatchDataType`, representing a batch of single-channel clips.
+        """
+        return SingleChannelAudioBatchDataType
+
+    @staticmethod
+    def output_data_type():
+        """
+        Specify the output data type for the operation.
+
+        Returns:
+            type: `SingleChannelAudioBatchDataType`, representing a batch of single-channel clips.
+        """
+        return SingleChannelAudioBatchDataType
+
+
+class DualChannelAudioBatchOperation(
+    AudioProfilingMixin, AudioResultCacheMixin, AudioOutputBufferMixin, DataOperation
+):
+    """
+    An operation specialized for processing batches of dual-channel audio clips.
+
+    This class implements the `DataOperation` abstract base class to define
+    operations that accept and produce `DualChannelAudioBatchDataType`, processing
+    the whole (clips, samples, channels) array at once.
+
+    Methods:
+        input_data_type: Returns the expected input data type.
+        output_data_type: Returns the type of data output by the operation.
+        process: Processes the data, reusing results cached in `result_cache` if set,
+            and reporting the call to `profiler` if set.
+        process_into: Processes the data into a provided output buffer.
+    """
+
+    @staticmethod
+    def input_data_type():
+        """
+        Specify the input data type for the operation.
+
+        Returns:
+            type: `DualChannelAudioBatchDataType`, representing a batch of dual-channel clips.
+        """
+        return DualChannelAudioBatchDataType
+
+    @staticmethod
+    def output_data_type():
+        """
+        Specify the output data type for the operation.
+
+        Returns:
+            type: `DualChannelAudioBatchDataType`, representing a batch of dual-channel clips.
+        """
+        return DualChannelAudioBatchDataType
+
+
+class DualChannelMergerOperation(
+    AudioProfilingMixin,
+    AudioResultCacheMixin,
+    AudioChannelLayoutOperationMixin,
+    AudioOutputBufferMixin,
+    AudioStreamMixin,
+    DataOperation,
+):
     """
     An operation to merge dual-channel audio data into a single-channel format.
 
@@ -82,6 +445,10 @@ class DualChannelMergerOperation(DataOperation):
     Methods:
         input_data_type: Returns the expected input data type.
         output_data_type: Returns the type of data output by the operation.
+        process: Processes the data, reusing results cached in `result_cache` if set,
+            and reporting the call to `profiler` if set.
+        process_stream: Processes a stream of chunks, carrying state between them.
+        process_into: Processes the data into a provided output buffer.
     """
 
     @staticmethod
@@ -105,7 +472,13 @@ class DualChannelMergerOperation(DataOperation):
         return SingleChannelAudioDataType
 
 
-class SingleChannelExpanderOperation(DataOperation):
+class SingleChannelExpanderOperation(
+    AudioProfilingMixin,
+    AudioResultCacheMixin,
+    AudioOutputBufferMixin,
+    AudioStreamMixin,
+    DataOperation,
+):
     """
     An operation to expand single-channel audio data into dual-channel format.
 
@@ -116,6 +489,10 @@ class SingleChannelExpanderOperation(DataOperation):
     Methods:
         input_data_type: Returns the expected input data type.
         output_data_type: Returns the type of data output by the operation.
+        process: Processes the data, reusing results cached in `result_cache` if set,
+            and reporting the call to `profiler` if set.
+        process_stream: Processes a stream of chunks, carrying state between them.
+        process_into: Processes the data into a provided output buffer.
     """
 
     @staticmethod
@@ -139,7 +516,206 @@ class SingleChannelExpanderOperation(DataOperation):
         return DualChannelAudioDataType
 
 
-class SingleChannelAudioProbe(DataProbe):
+class MultiChannelMergerOperation(
+    AudioProfilingMixin,
+    AudioResultCacheMixin,
+    AudioChannelLayoutOperationMixin,
+    AudioOutputBufferMixin,
+    AudioStreamMixin,
+    DataOperation,
+):
+    """
+    An operation to merge multi-channel audio data into a single-channel format.
+
+    This class defines operations that accept `MultiChannelAudioDataType` as input
+    and produce `SingleChannelAudioDataType` as output, suitable for scenarios
+    where a multi-channel recording needs to be downmixed.
+
+    Methods:
+        input_data_type: Returns the expected input data type.
+        output_data_type: Returns the type of data output by the operation.
+        process: Processes the data, reusing results cached in `result_cache` if set,
+            and reporting the call to `profiler` if set.
+        process_stream: Processes a stream of chunks, carrying state between them.
+        process_into: Processes the data into a provided output buffer.
+    """
+
+    @staticmethod
+    def input_data_type():
+        """
+        Specify the input data type for the operation.
+
+        Returns:
+            type: `MultiChannelAudioDataType`, representing multi-channel audio.
+        """
+        return MultiChannelAudioDataType
+
+    @staticmethod
+    def output_data_type():
+        """
+        Specify the output data type for the operation.
+
+        Returns:
+            type: `SingleChannelAudioDataType`, representing single-channel audio.
+        """
+        return SingleChannelAudioDataType
+
+
+class MultiChannelExpanderOperation(
+    AudioProfilingMixin,
+    AudioResultCacheMixin,
+    AudioOutputBufferMixin,
+    AudioStreamMixin,
+    DataOperation,
+):
+    """
+    An operation to expand single-channel audio data into multi-channel format.
+
+    This class defines operations that accept `SingleChannelAudioDataType` as input
+    and produce `MultiChannelAudioDataType` as output, suitable for scenarios
+    where mono audio needs to be upmixed.
+
+    Methods:
+        input_data_type: Returns the expected input data type.
+        output_data_type: Returns the type of data output by the operation.
+        process: Processes the data, reusing results cached in `result_cache` if set,
+            and reporting the call to `profiler` if set.
+        process_stream: Processes a stream of chunks, carrying state between them.
+        process_into: Processes the data into a provided output buffer.
+    """
+
+    @staticmethod
+    def input_data_type():
+        """
+        Specify the input data type for the operation.
+
+        Returns:
+            type: `SingleChannelAudioDataType`, representing single-channel audio.
+        """
+        return SingleChannelAudioDataType
+
+    @staticmethod
+    def output_data_type():
+        """
+        Specify the output data type for the operation.
+
+        Returns:
+            type: `MultiChannelAudioDataType`, representing multi-channel audio.
+        """
+        return MultiChannelAudioDataType
+
+
+class SingleChannelSpectrogramAnalysisOperation(
+    AudioProfilingMixin, AudioResultCacheMixin, DataOperation
+):
+    """
+    An operation transforming single-channel audio data into a spectrogram.
+
+    This class defines operations that accept `SingleChannelAudioDataType` as input
+    and produce `SpectrogramDataType` as output, such as the STFT.
+
+    Methods:
+        input_data_type: Returns the expected input data type.
+        output_data_type: Returns the type of data output by the operation.
+        process: Processes the data, reusing results cached in `result_cache` if set,
+            and reporting the call to `profiler` if set.
+    """
+
+    @staticmethod
+    def input_data_type():
+        """
+        Specify the input data type for the operation.
+
+        Returns:
+            type: `SingleChannelAudioDataType`, representing single-channel audio.
+        """
+        return SingleChannelAudioDataType
+
+    @staticmethod
+    def output_data_type():
+        """
+        Specify the output data type for the operation.
+
+        Returns:
+            type: `SpectrogramDataType`, representing a spectrogram.
+        """
+        return SpectrogramDataType
+
+
+class SpectrogramOperation(AudioProfilingMixin, AudioResultCacheMixin, DataOperation):
+    """
+    An operation specialized for processing spectrograms.
+
+    This class implements the `DataOperation` abstract base class to define
+    operations that accept and produce `SpectrogramDataType`, working in the
+    time-frequency domain without recomputing the transform.
+
+    Methods:
+        input_data_type: Returns the expected input data type.
+        output_data_type: Returns the type of data output by the operation.
+        process: Processes the data, reusing results cached in `result_cache` if set,
+            and reporting the call to `profiler` if set.
+    """
+
+    @staticmethod
+    def input_data_type():
+        """
+        Specify the input data type for the operation.
+
+        Returns:
+            type: `SpectrogramDataType`, representing a spectrogram.
+        """
+        return SpectrogramDataType
+
+    @staticmethod
+    def output_data_type():
+        """
+        Specify the output data type for the operation.
+
+        Returns:
+            type: `SpectrogramDataType`, representing a spectrogram.
+        """
+        return SpectrogramDataType
+
+
+class SpectrogramSynthesisOperation(
+    AudioProfilingMixin, AudioResultCacheMixin, DataOperation
+):
+    """
+    An operation transforming a spectrogram back into single-channel audio data.
+
+    This class defines operations that accept `SpectrogramDataType` as input and
+    produce `SingleChannelAudioDataType` as output, such as the inverse STFT.
+
+    Methods:
+        input_data_type: Returns the expected input data type.
+        output_data_type: Returns the type of data output by the operation.
+        process: Processes the data, reusing results cached in `result_cache` if set,
+            and reporting the call to `profiler` if set.
+    """
+
+    @staticmethod
+    def input_data_type():
+        """
+        Specify the input data type for the operation.
+
+        Returns:
+            type: `SpectrogramDataType`, representing a spectrogram.
+        """
+        return SpectrogramDataType
+
+    @staticmethod
+    def output_data_type():
+        """
+        Specify the output data type for the operation.
+
+        Returns:
+            type: `SingleChannelAudioDataType`, representing single-channel audio.
+        """
+        return SingleChannelAudioDataType
+
+
+class SingleChannelAudioProbe(AudioProfilingMixin, AudioStreamMixin, DataProbe):
     """
     A probe for inspecting or monitoring single-channel audio data.
 
@@ -150,6 +726,8 @@ class SingleChannelAudioProbe(DataProbe):
 
     Methods:
         input_data_type: Returns the expected input data type for the probe.
+        process: Probes the data, reporting the call to `profiler` if set.
+        process_stream: Probes a stream of chunks, carrying state between them.
     """
 
     @staticmethod
@@ -163,7 +741,7 @@ class SingleChannelAudioProbe(DataProbe):
         return SingleChannelAudioDataType
 
 
-class DualChannelAudioProbe(DataProbe):
+class DualChannelAudioProbe(AudioProfilingMixin, AudioStreamMixin, DataProbe):
     """
     A probe for inspecting or monitoring dual-channel (stereo) audio data.
 
@@ -174,6 +752,8 @@ class DualChannelAudioProbe(DataProbe):
 
     Methods:
         input_data_type: Returns the expected input data type for the probe.
+        process: Probes the data, reporting the call to `profiler` if set.
+        process_stream: Probes a stream of chunks, carrying state between them.
     """
 
     @staticmethod
@@ -185,3 +765,50 @@ class DualChannelAudioProbe(DataProbe):
             type: `DualChannelAudioDataType`, representing dual-channel audio.
         """
         return DualChannelAudioDataType
+
+
+class MultiChannelAudioProbe(AudioProfilingMixin, AudioStreamMixin, DataProbe):
+    """
+    A probe for inspecting or monitoring multi-channel audio data.
+
+    This class implements the `DataProbe` abstract base class to define
+    operations that accept `MultiChannelAudioDataType` as input.
+
+    Methods:
+        input_data_type: Returns the expected input data type for the probe.
+        process: Probes the data, reporting the call to `profiler` if set.
+        process_stream: Probes a stream of chunks, carrying state between them.
+    """
+
+    @staticmethod
+    def input_data_type():
+        """
+        Specify the input data type for the probe.
+
+        Returns:
+            type: `MultiChannelAudioDataType`, representing multi-channel audio.
+        """
+        return MultiChannelAudioDataType
+
+
+class SpectrogramProbe(AudioProfilingMixin, DataProbe):
+    """
+    A probe for inspecting or monitoring spectrograms.
+
+    This class implements the `DataProbe` abstract base class to define
+    operations that accept `SpectrogramDataType` as input.
+
+    Methods:
+        input_data_type: Returns the expected input data type for the probe.
+        process: Probes the data, reporting the call to `profiler` if set.
+    """
+
+    @staticmethod
+    def input_data_type():
+        """
+        Specify the input data type for the probe.
+
+        Returns:
+            type: `SpectrogramDataType`, representing a spectrogram.
+        """
+        return SpectrogramDataType
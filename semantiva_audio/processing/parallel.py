@@ -0,0 +1,198 @@
+import copy
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from semantiva_audio.data_types.data_types import (
+    SingleChannelAudioBatchDataType,
+    DualChannelAudioBatchDataType,
+)
+
+# Ways of splitting the work of an operation between threads
+CHANNEL_SPLIT = "channel"
+TIME_SPLIT = "time"
+CLIP_SPLIT = "clip"
+SPLIT_MODES = (CHANNEL_SPLIT, TIME_SPLIT, CLIP_SPLIT)
+
+# Number of samples along the time axis per task of a time split
+PARALLEL_BLOCK_SIZE = 65536
+
+
+def _split_axis(samples: np.ndarray, data: Any, split: str) -> int:
+    """
+    Return the axis of the samples cut into parts by a split mode.
+
+    Raises:
+        ValueError: If the data cannot be split that way.
+    """
+    batch = isinstance(
+        data, (SingleChannelAudioBatchDataType, DualChannelAudioBatchDataType)
+    )
+    time_axis = 1 if batch else 0
+    if split == TIME_SPLIT:
+        return time_axis
+    if split == CLIP_SPLIT and batch:
+        return 0
+    if split == CHANNEL_SPLIT and samples.ndim > time_axis + 1:
+        return time_axis + 1
+    raise ValueError(f"{type(data).__name__} cannot be split by {split}.")
+
+
+def _bounds(size: int, parts: int) -> List[Tuple[int, int]]:
+    """
+    Cut `size` items into at most `parts` contiguous, non-empty ranges of equal size
+    (within one item).
+    """
+    parts = max(min(parts, size), 1)
+    edges = [size * index // parts for index in range(parts + 1)]
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def _take(samples: np.ndarray, axis: int, start: int, stop: int) -> np.ndarray:
+    """
+    Return a view of the samples from `start` to `stop` along an axis.
+    """
+    index: List[Any] = [slice(None)] * samples.ndim
+    index[axis] = slice(start, stop)
+    return samples[tuple(index)]
+
+
+class AudioParallelExecutor:
+    """
+    Opt-in thread-pool execution of audio operations on a single payload.
+
+    The samples are cut into parts, which threads process concurrently (NumPy
+    releases the GIL in its kernels). Each part is processed with
+    `process_into`, straight into its slice of a single output array allocated
+    beforehand, so the results need no reassembly copy.
+
+    Operations declare in `parallel_splits` (see `AudioOutputBufferMixin`) how they
+    can be split:
+
+    - "time": into blocks of `block_size` samples, for operations transforming
+      each sample independently;
+    - "channel": into groups of channels, for operations processing each channel
+      independently (e.g. FIR filters);
+    - "clip": into groups of clips of a batch.
+
+    Only operations whose output has the shape of their input can be split.
+
+    Example:
+        >>> with AudioParallelExecutor(max_workers=4) as executor:
+        ...     filtered = executor.run(operation, audio, kernel=kernel)
+    """
+
+    def __init__(
+        self, max_workers: Optional[int] = None, block_size: int = PARALLEL_BLOCK_SIZE
+    ):
+        """
+        Initialize the executor and its thread pool.
+
+        Args:
+            max_workers (Optional[int]): Number of threads. Defaults to the number
+                of CPUs.
+            block_size (int): Number of samples along the time axis per task of a
+                time split. Defaults to `PARALLEL_BLOCK_SIZE`.
+
+        Raises:
+            ValueError: If the number of workers or the block size is not positive.
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        if max_workers <= 0 or block_size <= 0:
+            raise ValueError("The number of workers and block size must be positive.")
+        self.max_workers = max_workers
+        self.block_size = block_size
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+
+    def __enter__(self) -> "AudioParallelExecutor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """
+        Stop the threads of the executor once their current tasks are done.
+        """
+        self._pool.shutdown(wait=True)
+
+    def run(self, operation: Any, data: Any, split: Optional[str] = None, **parameters):
+        """
+        Process the data with an operation, splitting the work between threads.
+
+        Args:
+            operation (DataOperation): The operation (or operation class).
+            data (BaseDataType): The input data.
+            split (Optional[str]): The split mode, one of `SPLIT_MODES` declared by
+                the operation. Defaults to the first mode it declares.
+            **parameters: The processing parameters of the operation. Parameters
+                declared per channel (or per clip) are split with the data.
+
+        Returns:
+            BaseDataType: The output data, with the layout of the input.
+
+        Raises:
+            ValueError: If the operation cannot be split that way, or its output
+                does not have the shape of its input.
+        """
+        if isinstance(operation, type):
+            operation = operation()
+        splits: Dict[str, Dict[str, int]] = getattr(operation, "parallel_splits", {})
+        if split is None and splits:
+            split = next(iter(splits))
+        if split is None or split not in splits:
+            raise ValueError(
+                f"{type(operation).__name__} cannot be split by {split}; it declares "
+                f"{tuple(splits)}."
+            )
+
+        samples = data.data
+        axis = _split_axis(samples, data, split)
+        if samples.shape[axis] == 0:
+            return operation.process(data, **parameters)
+        if split == TIME_SPLIT:
+            blocks = -(-samples.shape[axis] // self.block_size)
+            bounds = _bounds(samples.shape[axis], blocks)
+        else:
+            bounds = _bounds(samples.shape[axis], self.max_workers)
+
+        def part(start: int, stop: int):
+            part_parameters = dict(parameters)
+            for name, ndim in splits[split].items():
+                value = np.asarray(parameters[name])
+                if value.ndim >= ndim:
+                    parameter_axis = 0 if split == CLIP_SPLIT else value.ndim - 1
+                    part_parameters[name] = _take(value, parameter_axis, start, stop)
+            part_data = type(data).from_validated(
+                _take(samples, axis, start, stop), data.recorded_sample_format
+            )
+            return part_data, part_parameters
+
+        # Find the type of the output from a single sample of the first part
+        probe_data, probe_parameters = part(*bounds[0])
+        time_axis = _split_axis(samples, data, TIME_SPLIT)
+        probe_samples = _take(probe_data.data, time_axis, 0, 1)
+        probe = copy.copy(operation).process(
+            type(data).from_validated(probe_samples, data.recorded_sample_format),
+            **probe_parameters,
+        )
+        if probe.data.shape != probe_samples.shape:
+            raise ValueError(
+                f"{type(operation).__name__} does not preserve the shape of its "
+                "input and cannot be split."
+            )
+        out = np.empty_like(samples, dtype=probe.data.dtype)
+
+        def process(start: int, stop: int) -> None:
+            part_data, part_parameters = part(start, stop)
+            part_out = _take(out, axis, start, stop)
+            result = copy.copy(operation).process_into(
+                part_data, part_out, **part_parameters
+            )
+            if not np.may_share_memory(result.data, part_out):
+                np.copyto(part_out, result.data)
+
+        futures = [self._pool.submit(process, *bound) for bound in bounds]
+        for future in futures:
+            future.result()
+        return type(probe).from_validated(out, probe.recorded_sample_format)
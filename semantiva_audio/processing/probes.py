@@ -0,0 +1,56 @@
+from typing import Any
+from semantiva_audio.processing.operations import (
+    SingleChannelAudioProbe,
+    DualChannelAudioProbe,
+    MultiChannelAudioProbe,
+)
+from semantiva_audio.processing.statistics import AudioStatistics
+
+
+class AudioStatisticsProbeMixin:
+    """
+    Mixin computing the `AudioStatistics` of audio data in a single pass.
+
+    Outside of a stream, the probe returns the statistics of the data it is given.
+    While processing a stream, it merges the statistics of each chunk into
+    `stream_state` and returns the statistics of the stream so far, so the result
+    for the last chunk covers the whole stream.
+    """
+
+    stream_state: Any = None
+    is_streaming: bool
+
+    def _process_logic(self, data):
+        statistics = AudioStatistics.from_samples(
+            data.data, data.recorded_sample_format
+        )
+        if self.is_streaming:
+            if self.stream_state is not None:
+                statistics = self.stream_state.merge(statistics)
+            self.stream_state = statistics
+        return statistics
+
+
+class SingleChannelAudioStatisticsProbe(
+    AudioStatisticsProbeMixin, SingleChannelAudioProbe
+):
+    """
+    Compute the peak, RMS, DC offset, clipped samples and zero crossings of
+    single-channel audio data in a single pass.
+    """
+
+
+class DualChannelAudioStatisticsProbe(AudioStatisticsProbeMixin, DualChannelAudioProbe):
+    """
+    Compute the peak, RMS, DC offset, clipped samples and zero crossings of each
+    channel of dual-channel audio data in a single pass.
+    """
+
+
+class MultiChannelAudioStatisticsProbe(
+    AudioStatisticsProbeMixin, MultiChannelAudioProbe
+):
+    """
+    Compute the peak, RMS, DC offset, clipped samples and zero crossings of each
+    channel of multi-channel audio data in a single pass.
+    """
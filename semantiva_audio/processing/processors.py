@@ -1,40 +1,465 @@
+from importlib import import_module
+from typing import Any
 import numpy as np
 from semantiva_audio.data_types.data_types import (
+    INTERLEAVED,
+    PLANAR,
     SingleChannelAudioDataType,
     DualChannelAudioDataType,
+    MultiChannelAudioDataType,
+    SingleChannelAudioBatchDataType,
+    DualChannelAudioBatchDataType,
 )
 from semantiva_audio.processing.operations import (
     SingleChannelAudioOperation,
     DualChannelAudioOperation,
+    MultiChannelAudioOperation,
+    SingleChannelAudioBatchOperation,
+    DualChannelAudioBatchOperation,
+    DualChannelMergerOperation,
+    MultiChannelMergerOperation,
+    SingleChannelExpanderOperation,
+    MultiChannelExpanderOperation,
 )
+from semantiva_audio.processing.parallel import (
+    CHANNEL_SPLIT,
+    CLIP_SPLIT,
+    TIME_SPLIT,
+)
+from semantiva_audio.processing.fusion import (
+    ElementwiseAudioOperationMixin,
+    affine_step,
+    clip_step,
+)
+from semantiva_audio.manifest import PROCESSOR_MANIFEST
 
 
-class SingleChannelAudioMultiplyOperation(SingleChannelAudioOperation):
+def _channel_factors(data: np.ndarray, factor):
+    """
+    Convert a scalar or per-channel factor to a value broadcastable against
+    data whose last axis holds the channels.
+
+    Raises:
+        ValueError: If the number of factors does not match the number of channels.
+    """
+    factors = np.asarray(factor)
+    channels = data.shape[-1]
+    if factors.ndim > 1 or (factors.ndim == 1 and factors.shape[0] != channels):
+        raise ValueError(
+            f"Expected a scalar factor or {channels} per-channel factors, "
+            f"got shape {factors.shape}."
+        )
+    return _weak_parameter(data, factors)
+
+
+def _weak_parameter(data: np.ndarray, parameter: np.ndarray):
+    """
+    Keep a parameter from promoting float samples to a wider type (e.g. float32
+    samples multiplied by a float64 factor), like Python scalars do.
+    """
+    if parameter.ndim == 0:
+        return parameter.item()
+    if data.dtype.kind == "f":
+        return parameter.astype(data.dtype, copy=False)
+    return parameter
+
+
+def _mixing_matrix(data: np.ndarray, mixing_matrix, ndim: int) -> np.ndarray:
+    """
+    Convert a mixing matrix (output channels, input channels), or a vector of
+    weights when `ndim` is 1, to the float type of the samples.
+
+    Raises:
+        ValueError: If the matrix does not match the number of input channels.
+    """
+    matrix = np.asarray(mixing_matrix)
+    channels = data.shape[-1]
+    if matrix.ndim != ndim or matrix.shape[-1] != channels:
+        expected = f"{channels} weights" if ndim == 1 else f"a (N, {channels}) matrix"
+        raise ValueError(f"Expected {expected}, got shape {matrix.shape}.")
+    return matrix.astype(data.dtype, copy=False)
+
+
+def _clip_result_type(data: np.ndarray, minimum, maximum) -> np.dtype:
+    """
+    Return the dtype of `np.clip(data, minimum, maximum)`, where a bound may be None,
+    a scalar or a sequence (e.g. per-channel bounds).
+    """
+    bounds = (
+        _weak_parameter(data, np.asarray(bound))
+        for bound in (minimum, maximum)
+        if bound is not None
+    )
+    return np.result_type(data, *bounds)
+
+
+class SingleChannelAudioMultiplyOperation(
+    ElementwiseAudioOperationMixin, SingleChannelAudioOperation
+):
     """
     A specialized operation to multiply single-channel audio data by a given factor.
     """
 
+    @classmethod
+    def elementwise_steps(cls, factor):
+        return [affine_step(scale=factor)]
+
     def _process_logic(self, data, factor):
         self.logger.debug("Inside the SingleChannelAudioMultiplyOperation")
-        multiplied_data = data.data * factor
-        return SingleChannelAudioDataType(multiplied_data)
+        samples = data.as_float()
+        out = self._output_buffer(samples, np.result_type(samples, factor))
+        multiplied_data = np.multiply(samples, factor, out=out)
+        return SingleChannelAudioDataType.from_validated(multiplied_data)
 
 
-class DualChannelAudioMultiplyOperation(DualChannelAudioOperation):
+class DualChannelAudioMultiplyOperation(
+    ElementwiseAudioOperationMixin, DualChannelAudioOperation
+):
     """
-    A specialized operation to multiply each channel of dual-channel audio data
-    by a given factor, reusing SingleChannelAudioMultiplyOperation.
+    A specialized operation to multiply each channel of dual-channel (or
+    multichannel) audio data by a given factor.
+
+    The factor is either a scalar applied to all channels or a sequence with one
+    factor per channel. All channels are processed in a single broadcasted pass.
     """
 
+    parallel_splits = {TIME_SPLIT: {}, CHANNEL_SPLIT: {"factor": 1}}
+
+    @classmethod
+    def elementwise_steps(cls, factor):
+        return [affine_step(scale=factor)]
+
     def _process_logic(self, data, factor):
-        self.logger.debug("Inside the SingleChannelAudioMultiplyOperation")
-        left_channel = SingleChannelAudioDataType(data.data[:, 0])
-        right_channel = SingleChannelAudioDataType(data.data[:, 1])
+        self.logger.debug("Inside the DualChannelAudioMultiplyOperation")
+        samples = data.as_float()
+        factors = _channel_factors(samples, factor)
+        out = self._output_buffer(samples, np.result_type(samples, factors))
+        return DualChannelAudioDataType.from_validated(
+            np.multiply(samples, factors, out=out)
+        )
+
+
+class DualChannelAudioMultiplyInPlaceOperation(DualChannelAudioMultiplyOperation):
+    """
+    Variant of `DualChannelAudioMultiplyOperation` that overwrites the input samples.
+
+    The input buffer is reused when it is writeable and its dtype can hold the
+    result; otherwise a new array is allocated. Only use it when the input payload
+    is not referenced elsewhere.
+    """
+
+    in_place = True
+
+
+class SingleChannelAudioOffsetOperation(
+    ElementwiseAudioOperationMixin, SingleChannelAudioOperation
+):
+    """
+    A specialized operation to add a constant offset to single-channel audio data.
+    """
+
+    @classmethod
+    def elementwise_steps(cls, offset):
+        return [affine_step(offset=offset)]
+
+    def _process_logic(self, data, offset):
+        self.logger.debug("Inside the SingleChannelAudioOffsetOperation")
+        samples = data.as_float()
+        out = self._output_buffer(samples, np.result_type(samples, offset))
+        return SingleChannelAudioDataType.from_validated(
+            np.add(samples, offset, out=out)
+        )
+
+
+class DualChannelAudioOffsetOperation(
+    ElementwiseAudioOperationMixin, DualChannelAudioOperation
+):
+    """
+    A specialized operation to add a constant offset to dual-channel audio data.
+
+    The offset is either a scalar added to all channels or a sequence with one
+    offset per channel.
+    """
+
+    parallel_splits = {TIME_SPLIT: {}, CHANNEL_SPLIT: {"offset": 1}}
+
+    @classmethod
+    def elementwise_steps(cls, offset):
+        return [affine_step(offset=offset)]
+
+    def _process_logic(self, data, offset):
+        self.logger.debug("Inside the DualChannelAudioOffsetOperation")
+        samples = data.as_float()
+        offsets = _channel_factors(samples, offset)
+        out = self._output_buffer(samples, np.result_type(samples, offsets))
+        return DualChannelAudioDataType.from_validated(
+            np.add(samples, offsets, out=out)
+        )
+
+
+class SingleChannelAudioClipOperation(
+    ElementwiseAudioOperationMixin, SingleChannelAudioOperation
+):
+    """
+    A specialized operation to limit single-channel audio samples to a range.
+    """
+
+    @classmethod
+    def elementwise_steps(cls, minimum, maximum):
+        return [clip_step(minimum, maximum)]
+
+    def _process_logic(self, data, minimum, maximum):
+        self.logger.debug("Inside the SingleChannelAudioClipOperation")
+        samples = data.as_float()
+        out = self._output_buffer(samples, _clip_result_type(samples, minimum, maximum))
+        return SingleChannelAudioDataType.from_validated(
+            np.clip(samples, minimum, maximum, out=out)
+        )
+
+
+class DualChannelAudioClipOperation(
+    ElementwiseAudioOperationMixin, DualChannelAudioOperation
+):
+    """
+    A specialized operation to limit dual-channel audio samples to a range.
+    """
+
+    parallel_splits = {
+        TIME_SPLIT: {},
+        CHANNEL_SPLIT: {"minimum": 1, "maximum": 1},
+    }
+
+    @classmethod
+    def elementwise_steps(cls, minimum, maximum):
+        return [clip_step(minimum, maximum)]
+
+    def _process_logic(self, data, minimum, maximum):
+        self.logger.debug("Inside the DualChannelAudioClipOperation")
+        samples = data.as_float()
+        out = self._output_buffer(samples, _clip_result_type(samples, minimum, maximum))
+        return DualChannelAudioDataType.from_validated(
+            np.clip(samples, minimum, maximum, out=out)
+        )
+
+
+class SingleChannelAudioBatchMultiplyOperation(SingleChannelAudioBatchOperation):
+    """
+    A specialized operation to multiply a batch of single-channel clips by a factor.
+
+    The factor is either a scalar applied to every clip or a sequence with one
+    factor per clip. The whole batch is processed in a single NumPy call.
+    """
+
+    parallel_splits = {CLIP_SPLIT: {"factor": 1}, TIME_SPLIT: {}}
+
+    def _process_logic(self, data, factor):
+        self.logger.debug("Inside the SingleChannelAudioBatchMultiplyOperation")
+        samples = data.as_float()
+        factors = np.asarray(factor)
+        if factors.ndim > 1 or (factors.ndim == 1 and factors.shape[0] != len(data)):
+            raise ValueError(
+                f"Expected a scalar factor or {len(data)} per-clip factors, "
+                f"got shape {factors.shape}."
+            )
+        if factors.ndim == 1:
+            factors = factors[:, np.newaxis]
+        factors = _weak_parameter(samples, factors)
+        out = self._output_buffer(samples, np.result_type(samples, factors))
+        return SingleChannelAudioBatchDataType.from_validated(
+            np.multiply(samples, factors, out=out)
+        )
+
+
+class DualChannelAudioBatchMultiplyOperation(DualChannelAudioBatchOperation):
+    """
+    A specialized operation to multiply a batch of dual-channel clips by a factor.
+
+    The factor is either a scalar or a sequence with one factor per channel,
+    applied to every clip. The whole batch is processed in a single NumPy call.
+    """
+
+    parallel_splits = {
+        CLIP_SPLIT: {},
+        TIME_SPLIT: {},
+        CHANNEL_SPLIT: {"factor": 1},
+    }
+
+    def _process_logic(self, data, factor):
+        self.logger.debug("Inside the DualChannelAudioBatchMultiplyOperation")
+        samples = data.as_float()
+        factors = _channel_factors(samples, factor)
+        out = self._output_buffer(samples, np.result_type(samples, factors))
+        return DualChannelAudioBatchDataType.from_validated(
+            np.multiply(samples, factors, out=out)
+        )
+
+
+class DualChannelToPlanarOperation(DualChannelAudioOperation):
+    """
+    Store dual-channel audio data planar, with each channel contiguous in memory.
+
+    The samples are copied once, unless they already are planar.
+    """
+
+    preferred_layout = PLANAR
+
+    def _process_logic(self, data):
+        self.logger.debug("Inside the DualChannelToPlanarOperation")
+        return data.to_layout(PLANAR)
+
+
+class DualChannelToInterleavedOperation(DualChannelAudioOperation):
+    """
+    Store dual-channel audio data interleaved, as in most audio files.
+
+    The samples are copied once, unless they already are interleaved.
+    """
+
+    preferred_layout = INTERLEAVED
+
+    def _process_logic(self, data):
+        self.logger.debug("Inside the DualChannelToInterleavedOperation")
+        return data.to_layout(INTERLEAVED)
+
+
+class MultiChannelToPlanarOperation(MultiChannelAudioOperation):
+    """
+    Store multi-channel audio data planar, with each channel contiguous in memory.
+
+    The samples are copied once, unless they already are planar.
+    """
+
+    preferred_layout = PLANAR
+
+    def _process_logic(self, data):
+        self.logger.debug("Inside the MultiChannelToPlanarOperation")
+        return data.to_layout(PLANAR)
+
+
+class MultiChannelToInterleavedOperation(MultiChannelAudioOperation):
+    """
+    Store multi-channel audio data interleaved, as in most audio files.
+
+    The samples are copied once, unless they already are interleaved.
+    """
+
+    preferred_layout = INTERLEAVED
+
+    def _process_logic(self, data):
+        self.logger.debug("Inside the MultiChannelToInterleavedOperation")
+        return data.to_layout(INTERLEAVED)
+
+
+class MultiChannelAudioMixOperation(MultiChannelAudioOperation):
+    """
+    Mix multi-channel audio data into another set of channels with a mixing matrix.
+
+    Output channel `i` is `sum_j mixing_matrix[i, j] * input[:, j]`. The whole mix
+    runs as a single matrix multiply, so downmixing 64 channels to 2 (or upmixing
+    to more channels) reads the samples once.
+    """
+
+    def _process_logic(self, data, mixing_matrix):
+        self.logger.debug("Inside the MultiChannelAudioMixOperation")
+        samples = data.as_float()
+        matrix = _mixing_matrix(samples, mixing_matrix, ndim=2)
+        out = self._output_buffer(
+            samples, samples.dtype, shape=(samples.shape[0], matrix.shape[0])
+        )
+        return MultiChannelAudioDataType.from_validated(
+            np.matmul(samples, matrix.T, out=out)
+        )
+
+
+class MultiChannelAudioDownmixOperation(MultiChannelMergerOperation):
+    """
+    Downmix multi-channel audio data to a single channel with per-channel weights.
+
+    The output is `input @ weights`, computed as a single matrix-vector product.
+    """
+
+    def _process_logic(self, data, weights):
+        self.logger.debug("Inside the MultiChannelAudioDownmixOperation")
+        samples = data.as_float()
+        vector = _mixing_matrix(samples, weights, ndim=1)
+        out = self._output_buffer(samples, samples.dtype, shape=samples.shape[:1])
+        return SingleChannelAudioDataType.from_validated(
+            np.matmul(samples, vector, out=out)
+        )
+
+
+class DualChannelAudioDownmixOperation(DualChannelMergerOperation):
+    """
+    Downmix dual-channel audio data to a single channel with per-channel weights.
+
+    Use weights `[0.5, 0.5]` for the usual mono mix. The output is computed as a
+    single matrix-vector product.
+    """
+
+    def _process_logic(self, data, weights):
+        self.logger.debug("Inside the DualChannelAudioDownmixOperation")
+        samples = data.as_float()
+        vector = _mixing_matrix(samples, weights, ndim=1)
+        out = self._output_buffer(samples, samples.dtype, shape=samples.shape[:1])
+        return SingleChannelAudioDataType.from_validated(
+            np.matmul(samples, vector, out=out)
+        )
+
+
+class SingleChannelAudioDuplicateOperation(SingleChannelExpanderOperation):
+    """
+    Expand single-channel audio data to two identical channels.
+
+    The output is a read-only broadcast view of the input samples, in their
+    storage format: the expansion allocates nothing. Operations writing to the
+    output allocate their own buffer, even when running in place.
+    """
+
+    def _process_logic(self, data):
+        self.logger.debug("Inside the SingleChannelAudioDuplicateOperation")
+        samples = data.data
+        return DualChannelAudioDataType.from_validated(
+            np.broadcast_to(samples[:, np.newaxis], (samples.shape[0], 2)),
+            data.recorded_sample_format,
+        )
+
+
+class SingleChannelAudioUpmixOperation(MultiChannelExpanderOperation):
+    """
+    Expand single-channel audio data to several channels with per-channel gains.
+
+    The gains are the column of a (channels, 1) mixing matrix. When they are all
+    1, the output is a read-only broadcast view of the input samples and the
+    expansion allocates nothing. Otherwise, all channels are computed in a single
+    broadcasted multiply.
+    """
 
-        single_channel_multiplier = SingleChannelAudioMultiplyOperation()
+    def _process_logic(self, data, gains):
+        self.logger.debug("Inside the SingleChannelAudioUpmixOperation")
+        gains = np.asarray(gains)
+        if gains.ndim != 1:
+            raise ValueError(f"Expected one gain per channel, got shape {gains.shape}.")
+        if np.all(gains == 1):
+            return MultiChannelAudioDataType.from_validated(
+                np.broadcast_to(
+                    data.data[:, np.newaxis], (data.data.shape[0], gains.shape[0])
+                ),
+                data.recorded_sample_format,
+            )
+        samples = data.as_float()
+        gains = _weak_parameter(samples, gains)
+        out = self._output_buffer(
+            samples, samples.dtype, shape=(samples.shape[0], gains.shape[0])
+        )
+        return MultiChannelAudioDataType.from_validated(
+            np.multiply(samples[:, np.newaxis], gains, out=out)
+        )
 
-        left_result = single_channel_multiplier(left_channel, factor)
-        right_result = single_channel_multiplier(right_channel, factor)
 
-        multiplied_data = np.column_stack((left_result.data, right_result.data))
-        return DualChannelAudioDataType(multiplied_data)
+def __getattr__(name: str) -> Any:
+    # The statistics, filter, resampler and spectrogram processors are defined in
+    # their own modules, imported when one of their processors is first accessed
+    module = PROCESSOR_MANIFEST.get(name)
+    if module is None or module == __name__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module), name)
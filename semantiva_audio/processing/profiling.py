@@ -0,0 +1,353 @@
+import json
+import threading
+import time
+import tracemalloc
+from typing import Any, Dict, List, NamedTuple, Optional
+import numpy as np
+from semantiva.component_loader import ComponentLoader
+from semantiva_audio.data_types.data_types import (
+    DualChannelAudioBatchDataType,
+    DualChannelAudioDataType,
+    MultiChannelAudioDataType,
+    SingleChannelAudioBatchDataType,
+    SingleChannelAudioDataType,
+)
+
+# Audio data types, whose samples are counted as frames of `_audio_channels` channels
+_AUDIO_DATA_TYPES = (
+    SingleChannelAudioDataType,
+    DualChannelAudioDataType,
+    MultiChannelAudioDataType,
+    SingleChannelAudioBatchDataType,
+    DualChannelAudioBatchDataType,
+)
+
+
+def _nbytes(value: Any) -> int:
+    """
+    Size of the samples of a data instance, or 0 if it is not backed by an array.
+    """
+    samples = getattr(value, "data", None)
+    return samples.nbytes if isinstance(samples, np.ndarray) else 0
+
+
+def _audio_channels(data: Any) -> int:
+    """
+    Number of channels of audio data (batches count the channels of one clip).
+    """
+    if isinstance(data, (SingleChannelAudioDataType, SingleChannelAudioBatchDataType)):
+        return 1
+    return data.data.shape[-1]
+
+
+class NodeProfile(NamedTuple):
+    """
+    The measurements of one call of an audio operation or probe.
+
+    Attributes:
+        node (str): Label of the node (the processor class name by default).
+        wall_time (float): Elapsed wall-clock time, in seconds.
+        cpu_time (float): CPU time of the process during the call, in seconds.
+        input_bytes (int): Size of the input samples.
+        output_bytes (int): Size of the output samples (0 for probes).
+        peak_bytes (Optional[int]): Peak memory allocated during the call, or None
+            if memory tracing is disabled.
+        frames (Optional[int]): Number of input frames (samples per channel, over
+            all clips of a batch), or None if the input is not audio.
+        channels (Optional[int]): Number of input channels, or None if the input
+            is not audio.
+        samples_per_second (Optional[float]): Input samples (frames times
+            channels) processed per second of wall-clock time.
+        realtime_factor (Optional[float]): Seconds of audio processed per second
+            of wall-clock time, or None if the sample rate is unknown.
+    """
+
+    node: str
+    wall_time: float
+    cpu_time: float
+    input_bytes: int
+    output_bytes: int
+    peak_bytes: Optional[int]
+    frames: Optional[int]
+    channels: Optional[int]
+    samples_per_second: Optional[float]
+    realtime_factor: Optional[float]
+
+
+class AudioProfiler:
+    """
+    Collects a `NodeProfile` per call of the audio operations and probes using it.
+
+    Operations report to a profiler once it is set as their `profiler` (see
+    `AudioProfilingMixin`, `with_profiler` and `profile_pipeline`). Peak memory is
+    measured with `tracemalloc`, started by the profiler when it records its first
+    call and stopped by `close`; tracing slows allocations down, so it can be
+    disabled with `trace_memory=False`. The profiler is thread-safe, but the CPU
+    time and peak memory of calls running concurrently include each other's.
+
+    Attributes:
+        sample_rate (Optional[float]): Sampling frequency of the profiled audio in
+            Hz, used for the real-time factor when the call does not receive a
+            `sample_rate` parameter.
+        trace_memory (bool): Whether to measure peak memory.
+        records (List[NodeProfile]): The measurements, in call order.
+    """
+
+    def __init__(self, sample_rate: Optional[float] = None, trace_memory: bool = True):
+        """
+        Initialize an empty profiler.
+
+        Args:
+            sample_rate (Optional[float]): Sampling frequency of the profiled audio
+                in Hz. Defaults to None (real-time factors are then only computed
+                for calls receiving a `sample_rate` parameter).
+            trace_memory (bool): Whether to measure peak memory. Defaults to True.
+        """
+        self.sample_rate = sample_rate
+        self.trace_memory = trace_memory
+        self.records: List[NodeProfile] = []
+        self._lock = threading.Lock()
+        self._started_tracing = False
+
+    def profile(self, node: str, call, data: Any, sample_rate=None) -> Any:
+        """
+        Run a call and record its measurements.
+
+        Args:
+            node (str): Label of the node.
+            call (Callable[[], Any]): The call, processing `data`.
+            data (BaseDataType): The input data of the call.
+            sample_rate (Optional[float]): Sampling frequency of the data, if known
+                from the call. Defaults to `sample_rate`.
+
+        Returns:
+            Any: The result of the call.
+        """
+        tracing = self.trace_memory
+        if tracing and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        if tracing:
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        result = call()
+        wall_time = time.perf_counter() - wall_start
+        cpu_time = time.process_time() - cpu_start
+        peak_bytes = None
+        if tracing:
+            peak_bytes = max(tracemalloc.get_traced_memory()[1] - baseline, 0)
+
+        frames = channels = None
+        samples_per_second = realtime_factor = None
+        if isinstance(data, _AUDIO_DATA_TYPES):
+            channels = _audio_channels(data)
+            frames = data.data.size // channels
+            sample_rate = sample_rate or self.sample_rate
+            if wall_time > 0:
+                samples_per_second = frames * channels / wall_time
+                if sample_rate:
+                    realtime_factor = frames / sample_rate / wall_time
+
+        record = NodeProfile(
+            node,
+            wall_time,
+            cpu_time,
+            _nbytes(data),
+            _nbytes(result),
+            peak_bytes,
+            frames,
+            channels,
+            samples_per_second,
+            realtime_factor,
+        )
+        with self._lock:
+            self.records.append(record)
+        return result
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """
+        Return the measurements as dictionaries, e.g. to build a data frame.
+
+        Returns:
+            List[Dict[str, Any]]: One dictionary per call, in call order.
+        """
+        with self._lock:
+            return [record._asdict() for record in self.records]
+
+    def write_jsonl(self, path: str) -> None:
+        """
+        Write the measurements to a JSON Lines file, one call per line.
+
+        Args:
+            path (str): Path of the file.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            for record in self.to_records():
+                file.write(json.dumps(record) + "\n")
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Return the measurements aggregated per node, hottest first.
+
+        Returns:
+            List[Dict[str, Any]]: Per node: the number of calls, the total wall and
+            CPU times, the total input and output bytes, the largest peak memory
+            and the overall samples/s, sorted by decreasing total wall time.
+        """
+        nodes: Dict[str, Dict[str, Any]] = {}
+        samples: Dict[str, int] = {}
+        for record in self.to_records():
+            node = record["node"]
+            totals = nodes.setdefault(
+                node,
+                {
+                    "node": node,
+                    "calls": 0,
+                    "wall_time": 0.0,
+                    "cpu_time": 0.0,
+                    "input_bytes": 0,
+                    "output_bytes": 0,
+                    "peak_bytes": None,
+                    "samples_per_second": None,
+                },
+            )
+            totals["calls"] += 1
+            for name in ("wall_time", "cpu_time", "input_bytes", "output_bytes"):
+                totals[name] += record[name]
+            if record["peak_bytes"] is not None:
+                totals["peak_bytes"] = max(
+                    totals["peak_bytes"] or 0, record["peak_bytes"]
+                )
+            if record["frames"] is not None:
+                samples[node] = (
+                    samples.get(node, 0) + record["frames"] * record["channels"]
+                )
+        for node, totals in nodes.items():
+            if node in samples and totals["wall_time"] > 0:
+                totals["samples_per_second"] = samples[node] / totals["wall_time"]
+        return sorted(nodes.values(), key=lambda totals: -totals["wall_time"])
+
+    def clear(self) -> None:
+        """
+        Drop all measurements.
+        """
+        with self._lock:
+            self.records.clear()
+
+    def close(self) -> None:
+        """
+        Stop memory tracing if the profiler started it. Measurements are kept.
+        """
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def __enter__(self) -> "AudioProfiler":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class AudioProfilingMixin:
+    """
+    Mixin letting audio operations and probes report their calls to an
+    `AudioProfiler`.
+
+    Profiling is opt-in: it is enabled by setting `profiler`, on an instance or a
+    class (see `with_profiler` and `profile_pipeline`). Without a profiler, a call
+    costs a single attribute lookup more than the unprofiled processor.
+
+    Attributes:
+        profiler (Optional[AudioProfiler]): The profiler, or None to disable
+            profiling.
+        profile_label (Optional[str]): Label of the node in the measurements.
+            Defaults to the class name.
+    """
+
+    profiler: Optional[AudioProfiler] = None
+    profile_label: Optional[str] = None
+
+    def process(self, data, *args, **kwargs):
+        """
+        Process the data, recording the call in `profiler` if set.
+
+        Args:
+            data (BaseDataType): The input data.
+            *args: Positional arguments passed to the processor.
+            **kwargs: Keyword arguments passed to the processor.
+
+        Returns:
+            Any: The result of the processor.
+        """
+        profiler = self.profiler
+        if profiler is None:
+            return super().process(data, *args, **kwargs)  # type: ignore[misc]
+        return profiler.profile(
+            self.profile_label or type(self).__name__,
+            lambda: super(AudioProfilingMixin, self).process(  # type: ignore[misc]
+                data, *args, **kwargs
+            ),
+            data,
+            kwargs.get("sample_rate"),
+        )
+
+
+def with_profiler(
+    processor: type, profiler: AudioProfiler, label: Optional[str] = None
+) -> type:
+    """
+    Create a subclass of an operation or probe reporting its calls to a profiler,
+    e.g. to use in a pipeline configuration in place of the processor.
+
+    Args:
+        processor (type): The processor class, with `AudioProfilingMixin`.
+        profiler (AudioProfiler): The profiler.
+        label (Optional[str]): Label of the node in the measurements. Defaults to
+            the class name.
+
+    Returns:
+        type: The profiled processor class, with the name of the processor.
+
+    Raises:
+        ValueError: If the processor does not support profiling.
+    """
+    if not issubclass(processor, AudioProfilingMixin):
+        raise ValueError(f"{processor.__name__} does not support profiling.")
+    return type(
+        processor.__name__,
+        (processor,),
+        {"profiler": profiler, "profile_label": label or processor.__name__},
+    )
+
+
+def profile_pipeline(
+    node_configurations: List[Dict], profiler: AudioProfiler
+) -> List[Dict]:
+    """
+    Make the audio nodes of a pipeline configuration report to a profiler.
+
+    Each node is labelled with its position and processor name (e.g.
+    "2:DualChannelAudioFIRFilterOperation"), so that repeated processors are
+    measured separately. Nodes whose processor does not support profiling (e.g.
+    context processors) are left unchanged.
+
+    Args:
+        node_configurations (List[Dict]): A pipeline configuration.
+        profiler (AudioProfiler): The profiler.
+
+    Returns:
+        List[Dict]: The pipeline configuration with profiled processors.
+    """
+    profiled_configurations = []
+    for index, node in enumerate(node_configurations):
+        processor = node.get("processor")
+        if isinstance(processor, str) and ":" not in processor:
+            processor = ComponentLoader.get_class(processor)
+        if isinstance(processor, type) and issubclass(processor, AudioProfilingMixin):
+            label = f"{index}:{processor.__name__}"
+            node = {**node, "processor": with_profiler(processor, profiler, label)}
+        profiled_configurations.append(node)
+    return profiled_configurations
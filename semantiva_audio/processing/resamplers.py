@@ -0,0 +1,97 @@
+import numpy as np
+from semantiva_audio.data_types.data_types import (
+    PLANAR,
+    SingleChannelAudioBatchDataType,
+    DualChannelAudioBatchDataType,
+)
+from semantiva_audio.processing.operations import (
+    SingleChannelAudioOperation,
+    DualChannelAudioOperation,
+    MultiChannelAudioOperation,
+    SingleChannelAudioBatchOperation,
+    DualChannelAudioBatchOperation,
+)
+from semantiva_audio.processing.resampling import (
+    AudioResampleMixin,
+    resample,
+    resampling_ratio,
+)
+
+
+class SingleChannelAudioResampleOperation(
+    AudioResampleMixin, SingleChannelAudioOperation
+):
+    """
+    Convert single-channel audio data to another sample rate with a polyphase
+    resampler (see `PolyphaseResampler`).
+    """
+
+    def _process_logic(self, data, sample_rate, target_sample_rate):
+        self.logger.debug("Inside the SingleChannelAudioResampleOperation")
+        return self._resample(data.as_float(), sample_rate, target_sample_rate)
+
+
+class DualChannelAudioResampleOperation(AudioResampleMixin, DualChannelAudioOperation):
+    """
+    Convert dual-channel audio data to another sample rate, resampling both
+    channels at once. The operation works on planar data, and its output is planar.
+    """
+
+    preferred_layout = PLANAR
+
+    def _process_logic(self, data, sample_rate, target_sample_rate):
+        self.logger.debug("Inside the DualChannelAudioResampleOperation")
+        samples = self._in_preferred_layout(data).as_float()
+        return self._resample(samples, sample_rate, target_sample_rate)
+
+
+class MultiChannelAudioResampleOperation(
+    AudioResampleMixin, MultiChannelAudioOperation
+):
+    """
+    Convert multi-channel audio data to another sample rate, resampling all
+    channels at once. The operation works on planar data, and its output is planar.
+    """
+
+    preferred_layout = PLANAR
+
+    def _process_logic(self, data, sample_rate, target_sample_rate):
+        self.logger.debug("Inside the MultiChannelAudioResampleOperation")
+        samples = self._in_preferred_layout(data).as_float()
+        return self._resample(samples, sample_rate, target_sample_rate)
+
+
+class SingleChannelAudioBatchResampleOperation(SingleChannelAudioBatchOperation):
+    """
+    Convert a batch of single-channel audio clips to another sample rate,
+    resampling all clips at once.
+    """
+
+    def context_keys(self):
+        return ["sample_rate"]
+
+    def _process_logic(self, data, sample_rate, target_sample_rate):
+        self.logger.debug("Inside the SingleChannelAudioBatchResampleOperation")
+        up, down = resampling_ratio(sample_rate, target_sample_rate)
+        resampled = resample(data.as_float(), up, down)
+        self._notify_context_update("sample_rate", target_sample_rate)
+        return SingleChannelAudioBatchDataType.from_validated(resampled)
+
+
+class DualChannelAudioBatchResampleOperation(DualChannelAudioBatchOperation):
+    """
+    Convert a batch of dual-channel audio clips to another sample rate,
+    resampling all clips and channels at once.
+    """
+
+    def context_keys(self):
+        return ["sample_rate"]
+
+    def _process_logic(self, data, sample_rate, target_sample_rate):
+        self.logger.debug("Inside the DualChannelAudioBatchResampleOperation")
+        up, down = resampling_ratio(sample_rate, target_sample_rate)
+        resampled = resample(np.moveaxis(data.as_float(), 1, -1), up, down)
+        self._notify_context_update("sample_rate", target_sample_rate)
+        return DualChannelAudioBatchDataType.from_validated(
+            np.moveaxis(resampled, -1, 1)
+        )
@@ -0,0 +1,255 @@
+from functools import lru_cache
+from math import gcd
+from typing import Any, Tuple
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Half length of the anti-aliasing filter, in input (or output) periods, and the
+# beta of its Kaiser window. These are the defaults of scipy.signal.resample_poly.
+RESAMPLING_HALF_LENGTH = 10
+RESAMPLING_KAISER_BETA = 5.0
+
+
+def resampling_ratio(sample_rate: int, target_sample_rate: int) -> Tuple[int, int]:
+    """
+    Return the reduced (up, down) factors converting between two sample rates.
+
+    Raises:
+        ValueError: If a sample rate is not a positive integer.
+    """
+    if int(sample_rate) != sample_rate or int(target_sample_rate) != target_sample_rate:
+        raise ValueError("Sample rates must be integers.")
+    if sample_rate <= 0 or target_sample_rate <= 0:
+        raise ValueError("Sample rates must be positive.")
+    divisor = gcd(int(sample_rate), int(target_sample_rate))
+    return int(target_sample_rate) // divisor, int(sample_rate) // divisor
+
+
+@lru_cache(maxsize=32)
+def design_polyphase_filter(up: int, down: int) -> Tuple[np.ndarray, int]:
+    """
+    Design the anti-aliasing filter of an up/down resampler, split into phases.
+
+    The filter is a Kaiser-windowed sinc, low-pass at the lower of the two
+    Nyquist frequencies, with a gain of `up`. Designs are cached per ratio.
+
+    Args:
+        up (int): Upsampling factor.
+        down (int): Downsampling factor.
+
+    Returns:
+        Tuple[np.ndarray, int]: The (up, taps per phase) read-only filter phases,
+        where phase `p` holds taps `p, p + up, p + 2 * up, ...`, and the delay of
+        the filter in upsampled samples.
+    """
+    factor = max(up, down)
+    half_length = RESAMPLING_HALF_LENGTH * factor
+    length = 2 * half_length + 1
+    cutoff = 1.0 / factor
+    positions = np.arange(length) - half_length
+    taps = (
+        cutoff * np.sinc(cutoff * positions) * np.kaiser(length, RESAMPLING_KAISER_BETA)
+    )
+    taps *= up
+
+    taps_per_phase = -(-length // up)
+    padded = np.zeros(taps_per_phase * up)
+    padded[:length] = taps
+    phases = padded.reshape(taps_per_phase, up).T.copy()
+    phases.flags.writeable = False
+    return phases, half_length
+
+
+class PolyphaseResampler:
+    """
+    Rational-ratio resampler filtering only the samples that are kept.
+
+    Conceptually, the input is upsampled by `up` (zeros inserted), low-pass
+    filtered and decimated by `down`. The polyphase form computes each output
+    sample directly from `taps per phase` input samples, for all outputs and
+    channels at once. The filter delay is compensated: output
+    `m` is aligned with input time `m * down / up`.
+
+    The resampler keeps the samples it still needs between calls, so a signal
+    resampled chunk by chunk gives the same output as the whole signal.
+
+    Attributes:
+        up (int): Upsampling factor.
+        down (int): Downsampling factor.
+        consumed (int): Number of input samples received so far.
+        produced (int): Number of output samples emitted so far.
+    """
+
+    def __init__(self, up: int, down: int):
+        """
+        Initialize a resampler, with an empty history.
+
+        Args:
+            up (int): Upsampling factor.
+            down (int): Downsampling factor.
+        """
+        self.up = up
+        self.down = down
+        self.consumed = 0
+        self.produced = 0
+        self._phases, self._delay = design_polyphase_filter(up, down)
+        # Input samples still needed, starting at input index `_history_start`;
+        # the history before the signal is zeros
+        self._history: Any = None
+        self._history_start = 1 - self._phases.shape[1]
+
+    def _input_index(self, outputs: np.ndarray) -> np.ndarray:
+        """
+        Index of the most recent input sample contributing to each output.
+        """
+        return (outputs * self.down + self._delay) // self.up
+
+    def process(self, samples: np.ndarray, final: bool = False) -> np.ndarray:
+        """
+        Resample a chunk of samples, with time along the last axis.
+
+        Args:
+            samples (np.ndarray): The float samples of the chunk.
+            final (bool): Whether this is the last chunk. The samples after it are
+                then taken as zeros, and all remaining outputs are emitted, for a
+                total of `ceil(consumed * up / down)` samples.
+
+        Returns:
+            np.ndarray: The resampled samples available so far, with time along
+            the last axis.
+        """
+        taps = self._phases.shape[1]
+        if self._history is None:
+            self._history = np.zeros(
+                samples.shape[:-1] + (taps - 1,), dtype=samples.dtype
+            )
+        buffer = np.concatenate([self._history, samples], axis=-1)
+        self.consumed += samples.shape[-1]
+        buffer_end = self._history_start + buffer.shape[-1]
+
+        if final:
+            total = -(-self.consumed * self.up // self.down)
+            last_needed = int(self._input_index(np.array(max(total - 1, 0))))
+            if last_needed >= buffer_end:
+                padding = np.zeros(
+                    buffer.shape[:-1] + (last_needed + 1 - buffer_end,),
+                    dtype=buffer.dtype,
+                )
+                buffer = np.concatenate([buffer, padding], axis=-1)
+        else:
+            # Outputs whose most recent input sample is in the buffer
+            total = max((buffer_end * self.up - self._delay - 1) // self.down + 1, 0)
+        count = max(total - self.produced, 0)
+
+        # Outputs are laid out (rows, up): every column has a fixed filter phase,
+        # and consecutive rows step `down` input samples. Each column is computed
+        # by one matrix-vector product over strided windows of the buffer.
+        rows = -(-count // self.up)
+        resampled = np.empty(buffer.shape[:-1] + (rows, self.up), dtype=buffer.dtype)
+        if count:
+            windows = sliding_window_view(buffer, taps, axis=-1)
+            coefficients = self._phases[:, ::-1].astype(buffer.dtype)
+        for column in range(min(self.up, count)):
+            output = self.produced + column
+            start = int(self._input_index(np.array(output))) - self._history_start
+            phase = (output * self.down + self._delay) % self.up
+            column_windows = windows[..., start - (taps - 1) :: self.down, :]
+            column_windows = column_windows[..., :rows, :]
+            np.matmul(
+                column_windows,
+                coefficients[phase],
+                out=resampled[..., : column_windows.shape[-2], column],
+            )
+        resampled = resampled.reshape(buffer.shape[:-1] + (rows * self.up,))
+        resampled = resampled[..., :count]
+
+        self.produced += count
+        keep_from = int(self._input_index(np.array(self.produced))) - (taps - 1)
+        keep_from = min(keep_from, buffer_end)
+        self._history = buffer[..., keep_from - self._history_start :].copy()
+        self._history_start = keep_from
+        return resampled
+
+    def flush(self) -> np.ndarray:
+        """
+        Emit the remaining outputs of a signal given chunk by chunk, as if its
+        last chunk had been passed with `final` set.
+
+        Returns:
+            np.ndarray: The last resampled samples, with time along the last axis.
+        """
+        if self._history is None:
+            return np.empty((0,))
+        history = self._history
+        return self.process(
+            np.empty(history.shape[:-1] + (0,), dtype=history.dtype), final=True
+        )
+
+
+def resample(samples: np.ndarray, up: int, down: int) -> np.ndarray:
+    """
+    Resample a whole signal, with time along the last axis.
+
+    Args:
+        samples (np.ndarray): The float samples.
+        up (int): Upsampling factor.
+        down (int): Downsampling factor.
+
+    Returns:
+        np.ndarray: The `ceil(len * up / down)` resampled samples.
+    """
+    return PolyphaseResampler(up, down).process(samples, final=True)
+
+
+class AudioResampleMixin:
+    """
+    Mixin for audio operations converting data to another sample rate.
+
+    The operations take the `sample_rate` of the data (e.g. from the context set
+    by a WAV payload loader) and a `target_sample_rate`, and update the
+    `sample_rate` of the context. While processing a stream, the
+    `PolyphaseResampler` is kept in `stream_state`, and the samples it still holds
+    are emitted as a last chunk when the stream ends.
+    """
+
+    stream_state: Any = None
+    is_streaming: bool
+    _notify_context_update: Any
+    output_data_type: Any
+
+    def context_keys(self):
+        """
+        Returns the context keys updated by the operation: `sample_rate`.
+        """
+        return ["sample_rate"]
+
+    def _resample(self, samples: np.ndarray, sample_rate, target_sample_rate):
+        """
+        Resample float samples shaped (samples,) or (samples, channels), and
+        return them wrapped in the output data type of the operation.
+
+        Raises:
+            ValueError: If the sample rates are invalid or change during a stream.
+        """
+        up, down = resampling_ratio(sample_rate, target_sample_rate)
+        signal = np.moveaxis(samples, 0, -1)
+        if self.is_streaming:
+            if self.stream_state is None:
+                self.stream_state = PolyphaseResampler(up, down)
+            elif (self.stream_state.up, self.stream_state.down) != (up, down):
+                raise ValueError("The sample rates cannot change during a stream.")
+            resampled = self.stream_state.process(signal)
+        else:
+            resampled = resample(signal, up, down)
+        self._notify_context_update("sample_rate", target_sample_rate)
+        return self.output_data_type().from_validated(np.moveaxis(resampled, -1, 0))
+
+    def _flush_stream(self, *args, **kwargs):
+        """
+        Emit the last resampled samples of a stream.
+        """
+        resampler = self.stream_state
+        if resampler is None:
+            return None
+        resampled = resampler.flush()
+        return self.output_data_type().from_validated(np.moveaxis(resampled, -1, 0))
@@ -0,0 +1,146 @@
+from functools import lru_cache
+from typing import Optional
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Window types supported by `get_window`
+WINDOW_TYPES = ("hann", "hamming", "blackman", "rectangular")
+
+
+@lru_cache(maxsize=32)
+def get_window(window: str, size: int) -> np.ndarray:
+    """
+    Return a periodic analysis window, cached per (type, size).
+
+    Periodic windows (the symmetric window of `size + 1` samples without its last
+    sample) overlap-add to a constant at the usual hop sizes.
+
+    Args:
+        window (str): The window type, one of `WINDOW_TYPES`.
+        size (int): Number of samples of the window.
+
+    Returns:
+        np.ndarray: The read-only float64 window.
+
+    Raises:
+        ValueError: If the window type is unknown.
+    """
+    if window == "hann":
+        values = np.hanning(size + 1)[:-1]
+    elif window == "hamming":
+        values = np.hamming(size + 1)[:-1]
+    elif window == "blackman":
+        values = np.blackman(size + 1)[:-1]
+    elif window == "rectangular":
+        values = np.ones(size)
+    else:
+        raise ValueError(f"Unknown window '{window}', expected one of {WINDOW_TYPES}.")
+    values.flags.writeable = False
+    return values
+
+
+def _overlap_add(frames: np.ndarray, hop_size: int) -> np.ndarray:
+    """
+    Overlap-add (frames, frame_size) frames spaced by `hop_size` samples.
+
+    Frames are cut into hop-sized segments: segment `r` of every frame lands in
+    a contiguous, non-overlapping run of the output, so the whole overlap-add
+    takes one vectorized addition per segment.
+    """
+    frame_count, frame_size = frames.shape
+    segments = -(-frame_size // hop_size)
+    padded = np.zeros((frame_count, segments * hop_size), dtype=frames.dtype)
+    padded[:, :frame_size] = frames
+    padded = padded.reshape(frame_count, segments, hop_size)
+
+    output = np.zeros((frame_count + segments - 1) * hop_size, dtype=frames.dtype)
+    for segment in range(segments):
+        start = segment * hop_size
+        output[start : start + frame_count * hop_size] += padded[:, segment].reshape(-1)
+    return output[: (frame_count - 1) * hop_size + frame_size]
+
+
+def _window_envelope(
+    window: str, frame_size: int, hop_size: int, frame_count: int
+) -> np.ndarray:
+    """
+    Overlap-added squared window, by which inverse STFT outputs are normalized.
+    """
+    squared = get_window(window, frame_size) ** 2
+    return _overlap_add(np.broadcast_to(squared, (frame_count, frame_size)), hop_size)
+
+
+def stft(
+    samples: np.ndarray, frame_size: int, hop_size: int, window: str = "hann"
+) -> np.ndarray:
+    """
+    Compute the short-time Fourier transform of a signal.
+
+    The signal is padded with `frame_size // 2` zeros on both sides, so that frame
+    `i` is centered on sample `i * hop_size`. The frames are strided views of the
+    padded signal (no copy), and a single `rfft` call transforms all of them.
+
+    Args:
+        samples (np.ndarray): The 1-D float samples.
+        frame_size (int): Number of samples per frame (FFT size).
+        hop_size (int): Number of samples between consecutive frames.
+        window (str): The analysis window type. Defaults to "hann".
+
+    Returns:
+        np.ndarray: The complex (frames, frame_size // 2 + 1) spectrogram, with
+        `1 + len(samples) // hop_size` frames.
+
+    Raises:
+        ValueError: If the frame or hop size is invalid.
+    """
+    if frame_size <= 0 or not 0 < hop_size <= frame_size:
+        raise ValueError(
+            f"Invalid frame size {frame_size} and hop size {hop_size}: expected "
+            "0 < hop_size <= frame_size."
+        )
+    padding = frame_size // 2
+    padded = np.zeros(samples.shape[0] + 2 * padding, dtype=samples.dtype)
+    padded[padding : padding + samples.shape[0]] = samples
+    frames = sliding_window_view(padded, frame_size)[::hop_size]
+    frames = frames[: 1 + samples.shape[0] // hop_size]
+    analysis_window = get_window(window, frame_size).astype(samples.dtype, copy=False)
+    return np.fft.rfft(frames * analysis_window, axis=-1)
+
+
+def istft(
+    spectrogram: np.ndarray,
+    frame_size: int,
+    hop_size: int,
+    window: str = "hann",
+    length: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Invert a short-time Fourier transform computed by `stft`.
+
+    All frames are transformed back by a single `irfft` call, windowed again and
+    overlap-added. The result is normalized by the overlap-added squared window,
+    which makes `istft(stft(x))` reconstruct `x` wherever that envelope is not zero.
+
+    Args:
+        spectrogram (np.ndarray): The complex (frames, frame_size // 2 + 1) spectrogram.
+        frame_size (int): Number of samples per frame (FFT size).
+        hop_size (int): Number of samples between consecutive frames.
+        window (str): The window type used by the analysis. Defaults to "hann".
+        length (Optional[int]): Number of samples of the signal. Defaults to the
+            length covered by the frames.
+
+    Returns:
+        np.ndarray: The reconstructed signal.
+    """
+    frames = np.fft.irfft(spectrogram, n=frame_size, axis=-1)
+    frames *= get_window(window, frame_size).astype(frames.dtype, copy=False)
+    signal = _overlap_add(frames, hop_size)
+    envelope = _window_envelope(window, frame_size, hop_size, spectrogram.shape[0])
+
+    padding = frame_size // 2
+    if length is None:
+        length = signal.shape[0] - 2 * padding
+    signal = signal[padding : padding + length]
+    envelope = envelope[padding : padding + length]
+    np.divide(signal, envelope, out=signal, where=envelope > 1e-10)
+    return signal
@@ -0,0 +1,48 @@
+from semantiva_audio.data_types.data_types import (
+    SingleChannelAudioDataType,
+    SpectrogramDataType,
+)
+from semantiva_audio.processing.operations import (
+    SingleChannelSpectrogramAnalysisOperation,
+    SpectrogramSynthesisOperation,
+)
+from semantiva_audio.processing.spectral import istft, stft
+
+
+class SingleChannelAudioSTFTOperation(SingleChannelSpectrogramAnalysisOperation):
+    """
+    Compute the short-time Fourier transform of single-channel audio data.
+
+    Frames are centered on multiples of `hop_size`, taken as strided views of the
+    signal and transformed by a single batched `rfft`. The analysis window type
+    is set by the `window` class attribute; windows are cached per type and size.
+
+    Attributes:
+        window (str): The analysis window type (see `WINDOW_TYPES`).
+    """
+
+    window = "hann"
+
+    def _process_logic(self, data, frame_size, hop_size):
+        self.logger.debug("Inside the SingleChannelAudioSTFTOperation")
+        samples = data.as_float()
+        return SpectrogramDataType(
+            stft(samples, frame_size, hop_size, self.window),
+            frame_size=frame_size,
+            hop_size=hop_size,
+            window=self.window,
+            length=samples.shape[0],
+        )
+
+
+class SpectrogramISTFTOperation(SpectrogramSynthesisOperation):
+    """
+    Reconstruct single-channel audio data from a spectrogram, using the framing
+    parameters stored with it.
+    """
+
+    def _process_logic(self, data):
+        self.logger.debug("Inside the SpectrogramISTFTOperation")
+        return SingleChannelAudioDataType.from_validated(
+            istft(data.data, data.frame_size, data.hop_size, data.window, data.length)
+        )
@@ -0,0 +1,201 @@
+from typing import Any, Dict, Optional
+import numpy as np
+from semantiva_audio.data_types.data_types import SAMPLE_FORMATS
+
+# Number of samples along the time axis reduced per block. A block is converted
+# to planar float64 once and stays in the L2 cache while every statistic is computed.
+STATISTICS_BLOCK_SIZE = 16384
+
+
+def _value(value: np.ndarray) -> Any:
+    """
+    Return single-channel statistics as Python scalars and multi-channel ones as arrays.
+    """
+    return value.item() if value.ndim == 0 else value
+
+
+class AudioStatistics:
+    """
+    Mergeable summary statistics of audio samples, per channel.
+
+    The statistics are accumulated Welford-style (count, mean and sum of squared
+    deviations), which is numerically stable and allows partial statistics of
+    consecutive chunks, or of blocks processed by parallel workers, to be merged
+    exactly with `merge`. Values are expressed in float units (full scale is 1.0),
+    whatever the sample format.
+
+    Attributes:
+        count (int): Number of samples per channel.
+        mean (np.ndarray): Mean of the samples (DC offset).
+        m2 (np.ndarray): Sum of the squared deviations from the mean.
+        minimum (np.ndarray): Smallest sample.
+        maximum (np.ndarray): Largest sample.
+        clipped (np.ndarray): Number of samples at or beyond full scale.
+        zero_crossings (np.ndarray): Number of sign changes between consecutive samples.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize empty statistics.
+        """
+        self.count = 0
+        self.mean: np.ndarray = np.zeros(())
+        self.m2: np.ndarray = np.zeros(())
+        self.minimum: np.ndarray = np.full((), np.inf)
+        self.maximum: np.ndarray = np.full((), -np.inf)
+        self.clipped: np.ndarray = np.zeros((), dtype=np.int64)
+        self.zero_crossings: np.ndarray = np.zeros((), dtype=np.int64)
+        # Signs of the first and last samples, to count crossings between chunks
+        self._first_sign: Optional[np.ndarray] = None
+        self._last_sign: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_samples(
+        cls,
+        samples: np.ndarray,
+        sample_format: Optional[str] = None,
+        block_size: int = STATISTICS_BLOCK_SIZE,
+    ) -> "AudioStatistics":
+        """
+        Compute the statistics of samples in a single pass over memory.
+
+        Samples are processed in blocks along their first (time) axis. Each block
+        is converted once to float, with every channel contiguous whatever the
+        layout of the samples, and all statistics are computed on it while it is
+        in cache.
+
+        Args:
+            samples (np.ndarray): The samples, with time along the first axis.
+            sample_format (Optional[str]): The storage format of the samples (see
+                `SAMPLE_FORMATS`). Defaults to float samples.
+            block_size (int): Number of samples along the time axis per block.
+
+        Returns:
+            AudioStatistics: The statistics of the samples.
+        """
+        scale, offset, full_scale = 1.0, 0, 1.0
+        if sample_format is not None:
+            info = SAMPLE_FORMATS[sample_format]
+            scale, offset = info.scale, info.offset
+            if info.dtype.kind != "f":
+                # The largest PCM value is one step below full scale
+                full_scale = 1.0 - scale
+
+        statistics = cls()
+        planar = np.moveaxis(samples, 0, -1)
+        for start in range(0, samples.shape[0], block_size):
+            source = planar[..., start : start + block_size]
+            block = np.empty(source.shape, dtype=np.float64)
+            np.subtract(source, offset, out=block)
+            if scale != 1.0:
+                block *= scale
+            statistics = statistics.merge(cls._from_block(block, full_scale))
+        return statistics
+
+    @classmethod
+    def _from_block(cls, block: np.ndarray, full_scale: float) -> "AudioStatistics":
+        """
+        Compute the statistics of a non-empty block of float samples, with time
+        along the last axis.
+        """
+        statistics = cls()
+        statistics.count = block.shape[-1]
+        statistics.mean = block.mean(axis=-1)
+        deviations = block - statistics.mean[..., np.newaxis]
+        statistics.m2 = np.einsum("...i,...i->...", deviations, deviations)
+        statistics.minimum = block.min(axis=-1)
+        statistics.maximum = block.max(axis=-1)
+        statistics.clipped = np.count_nonzero(
+            (block >= full_scale) | (block <= -1.0), axis=-1
+        )
+        signs = np.signbit(block)
+        statistics.zero_crossings = np.count_nonzero(
+            signs[..., 1:] != signs[..., :-1], axis=-1
+        )
+        statistics._first_sign = signs[..., 0]
+        statistics._last_sign = signs[..., -1]
+        return statistics
+
+    def merge(self, other: "AudioStatistics") -> "AudioStatistics":
+        """
+        Combine these statistics with those of the samples following them.
+
+        Merging is exact: the statistics of two consecutive chunks merge into the
+        statistics of their concatenation. Zero crossings between the last sample
+        of this chunk and the first sample of the other one are counted, so the
+        order of the operands matters for them.
+
+        Args:
+            other (AudioStatistics): The statistics of the following samples.
+
+        Returns:
+            AudioStatistics: The combined statistics.
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            return other
+
+        merged = type(self)()
+        merged.count = self.count + other.count
+        delta = other.mean - self.mean
+        merged.mean = self.mean + delta * (other.count / merged.count)
+        merged.m2 = (
+            self.m2 + other.m2 + delta**2 * (self.count * other.count / merged.count)
+        )
+        merged.minimum = np.minimum(self.minimum, other.minimum)
+        merged.maximum = np.maximum(self.maximum, other.maximum)
+        merged.clipped = self.clipped + other.clipped
+        merged.zero_crossings = (
+            self.zero_crossings
+            + other.zero_crossings
+            + (self._last_sign != other._first_sign)
+        )
+        merged._first_sign = self._first_sign
+        merged._last_sign = other._last_sign
+        return merged
+
+    @property
+    def peak(self) -> Any:
+        """
+        Largest absolute sample value.
+        """
+        return _value(np.maximum(self.maximum, -self.minimum))
+
+    @property
+    def dc_offset(self) -> Any:
+        """
+        Mean of the samples.
+        """
+        return _value(self.mean)
+
+    @property
+    def variance(self) -> Any:
+        """
+        Population variance of the samples.
+        """
+        return _value(self.m2 / self.count if self.count else np.zeros_like(self.m2))
+
+    @property
+    def rms(self) -> Any:
+        """
+        Root mean square of the samples, including their DC offset.
+        """
+        return _value(np.sqrt(np.asarray(self.variance) + self.mean**2))
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Return the statistics as a dictionary, e.g. to store them in a context.
+
+        Returns:
+            Dict[str, Any]: The sample count, peak, RMS, DC offset, clipped sample
+            count and zero crossing count.
+        """
+        return {
+            "samples": self.count,
+            "peak": self.peak,
+            "rms": self.rms,
+            "dc_offset": self.dc_offset,
+            "clipped": _value(np.asarray(self.clipped)),
+            "zero_crossings": _value(np.asarray(self.zero_crossings)),
+        }
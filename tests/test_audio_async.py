@@ -0,0 +1,147 @@
+import asyncio
+import numpy as np
+import pytest
+
+from semantiva.context_processors.context_types import ContextType
+from semantiva_audio.data_io.io import (
+    AsyncSingleChannelPayloadSink,
+    AsyncSingleChannelPayloadSource,
+)
+from semantiva_audio.data_types.data_types import SingleChannelAudioDataType
+from semantiva_audio.processing.async_runner import AsyncPipelineDriver
+from semantiva_audio.processing.operations import SingleChannelAudioOperation
+
+EVENTS: list = []
+
+
+class RecordingOperation(SingleChannelAudioOperation):
+    """
+    Doubles the samples, recording the payload it computes.
+    """
+
+    def _process_logic(self, data):
+        EVENTS.append(("compute", int(data.data[0])))
+        return SingleChannelAudioDataType(data.data * 2)
+
+
+class MemoryPayloadSource(AsyncSingleChannelPayloadSource):
+    """
+    Serves constant signals after a simulated I/O delay.
+    """
+
+    async def _get_payload(self, index: int):
+        EVENTS.append(("fetch", index))
+        await asyncio.sleep(0.01)
+        if index < 0:
+            raise IOError("Object not found")
+        return SingleChannelAudioDataType(np.full(100, float(index))), ContextType(
+            {"index": index}
+        )
+
+
+class MemoryPayloadSink(AsyncSingleChannelPayloadSink):
+    """
+    Collects payloads after a simulated I/O delay, tracking concurrent flushes.
+    """
+
+    def __init__(self, failing: int = -1):
+        self.payloads: dict = {}
+        self.failing = failing
+        self.active = 0
+        self.max_active = 0
+
+    async def _send_payload(self, data, context, *args, **kwargs):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.03)
+            index = context.get_value("index")
+            if index == self.failing:
+                raise IOError("Upload failed")
+            self.payloads[index] = data.data
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture(autouse=True)
+def clear_events():
+    EVENTS.clear()
+
+
+def test_driver_overlaps_fetch_compute_and_flush():
+    """
+    Test that payloads are prefetched and flushed while others are computed.
+    """
+    sink = MemoryPayloadSink()
+    driver = AsyncPipelineDriver(
+        [{"processor": RecordingOperation}],
+        MemoryPayloadSource(),
+        sink,
+        prefetch=1,
+        max_flushes=2,
+    )
+
+    assert asyncio.run(driver.run(range(6))) == 6
+
+    assert sorted(sink.payloads) == list(range(6))
+    for index, samples in sink.payloads.items():
+        np.testing.assert_array_equal(samples, np.full(100, 2.0 * index))
+    # The next payload is fetched before the current one is computed
+    assert EVENTS.index(("fetch", 1)) < EVENTS.index(("compute", 0))
+    assert [event for event in EVENTS if event[0] == "compute"] == [
+        ("compute", index) for index in range(6)
+    ]
+    assert sink.max_active == 2
+
+
+def test_driver_accepts_async_inputs():
+    """
+    Test that inputs may come from an asynchronous iterable.
+    """
+
+    async def inputs():
+        for index in range(3):
+            await asyncio.sleep(0)
+            yield index
+
+    sink = MemoryPayloadSink()
+    driver = AsyncPipelineDriver(
+        [{"processor": RecordingOperation}], MemoryPayloadSource(), sink, prefetch=2
+    )
+
+    assert asyncio.run(driver.run(inputs())) == 3
+    assert sorted(sink.payloads) == [0, 1, 2]
+
+
+@pytest.mark.parametrize(
+    "inputs, failing, message",
+    [([0, 1, -1, 3], -2, "Object not found"), (range(5), 1, "Upload failed")],
+)
+def test_driver_raises_first_failure(inputs, failing, message):
+    """
+    Test that a failing fetch or flush stops the run with its error.
+    """
+    driver = AsyncPipelineDriver(
+        [{"processor": RecordingOperation}],
+        MemoryPayloadSource(),
+        MemoryPayloadSink(failing=failing),
+    )
+
+    with pytest.raises(IOError, match=message):
+        asyncio.run(driver.run(inputs))
+
+
+def test_async_sink_sends_streams():
+    """
+    Test that an asynchronous sink consumes synchronous and asynchronous streams.
+    """
+    sink = MemoryPayloadSink()
+    chunks = [SingleChannelAudioDataType(np.ones(10))]
+
+    async def async_chunks():
+        for chunk in chunks:
+            yield chunk
+
+    asyncio.run(sink.send_stream(chunks, ContextType({"index": 0})))
+    asyncio.run(sink.send_stream(async_chunks(), ContextType({"index": 1})))
+    assert sorted(sink.payloads) == [0, 1]
@@ -0,0 +1,97 @@
+import pytest
+import numpy as np
+
+from semantiva.payload_operations import Pipeline
+from semantiva_audio.data_types import (
+    SingleChannelAudioDataType,
+    DualChannelAudioDataType,
+    SingleChannelAudioBatchDataType,
+    DualChannelAudioBatchDataType,
+)
+from semantiva_audio.processing.processors import (
+    SingleChannelAudioMultiplyOperation,
+    SingleChannelAudioBatchMultiplyOperation,
+    DualChannelAudioBatchMultiplyOperation,
+)
+
+
+@pytest.fixture
+def single_channel_batch():
+    """
+    Pytest fixture providing a batch of 8 single-channel clips.
+    """
+    return SingleChannelAudioBatchDataType(np.random.rand(8, 500))
+
+
+def test_batch_iteration_yields_clip_views(single_channel_batch):
+    """
+    Test that iterating a batch yields single-channel views of its rows.
+    """
+    clips = list(single_channel_batch)
+
+    assert len(clips) == len(single_channel_batch) == 8
+    assert all(isinstance(clip, SingleChannelAudioDataType) for clip in clips)
+    assert all(np.shares_memory(clip.data, single_channel_batch.data) for clip in clips)
+
+
+def test_batch_from_list_and_append():
+    """
+    Test building batches from clips and rejecting clips of another length.
+    """
+    clips = [SingleChannelAudioDataType(np.random.rand(100)) for _ in range(3)]
+
+    batch = SingleChannelAudioBatchDataType.from_list(clips)
+    assert batch.data.shape == (3, 100)
+
+    empty = SingleChannelAudioBatchDataType()
+    assert len(empty) == 0
+    empty.append(clips[0])
+    assert empty.data.shape == (1, 100)
+
+    with pytest.raises(ValueError):
+        batch.append(SingleChannelAudioDataType(np.random.rand(50)))
+
+    stereo = DualChannelAudioBatchDataType.from_list(
+        [DualChannelAudioDataType(np.random.rand(100, 2)) for _ in range(4)]
+    )
+    assert stereo.data.shape == (4, 100, 2)
+
+
+def test_batch_multiply_operations(single_channel_batch):
+    """
+    Test whole-batch multiplication with scalar, per-clip and per-channel factors.
+    """
+    operation = SingleChannelAudioBatchMultiplyOperation()
+
+    scaled = operation(single_channel_batch, 2.0)
+    np.testing.assert_allclose(scaled.data, single_channel_batch.data * 2.0)
+
+    per_clip = operation(single_channel_batch, np.arange(8))
+    np.testing.assert_allclose(per_clip.data[3], single_channel_batch.data[3] * 3)
+
+    stereo = DualChannelAudioBatchDataType(np.random.rand(4, 100, 2))
+    stereo_scaled = DualChannelAudioBatchMultiplyOperation()(stereo, [0.5, 2.0])
+    np.testing.assert_allclose(stereo_scaled.data[..., 1], stereo.data[..., 1] * 2.0)
+
+
+def test_batch_pipeline(single_channel_batch):
+    """
+    Test a pipeline mixing a batch operation and a per-clip operation.
+    """
+    pipeline = Pipeline(
+        [
+            {
+                "processor": SingleChannelAudioBatchMultiplyOperation,
+                "parameters": {"factor": 2.0},
+            },
+            {
+                "processor": SingleChannelAudioMultiplyOperation,
+                "parameters": {"factor": 0.25},
+            },
+        ]
+    )
+
+    output, _ = pipeline.process(single_channel_batch)
+
+    assert isinstance(output, SingleChannelAudioBatchDataType)
+    np.testing.assert_allclose(output.data, single_channel_batch.data * 0.5)
@@ -0,0 +1,99 @@
+import numpy as np
+
+from semantiva.context_processors.context_types import ContextType
+from semantiva_audio.data_types.data_types import SingleChannelAudioDataType
+from semantiva_audio.processing.batch_runner import (
+    AudioBatchRunner,
+    run_pipeline_batch,
+)
+from semantiva_audio.data_io.io import SingleChannelPayloadSource
+from .test_audio_io import write_wav
+
+NODE_CONFIGURATIONS = [
+    {
+        "processor": "SingleChannelAudioMultiplyOperation",
+        "parameters": {"factor": 2.0},
+    },
+    {
+        "processor": "SingleChannelAudioStatisticsProbe",
+        "context_keyword": "statistics",
+    },
+]
+
+
+class ConstantPayloadSource(SingleChannelPayloadSource):
+    """
+    Provides constant signals of the requested length.
+    """
+
+    def _get_payload(self, length: int, value: float = 0.0):
+        return SingleChannelAudioDataType(np.full(length, value)), ContextType()
+
+
+def test_batch_runner_keeps_input_order(tmp_path):
+    """
+    Test that results come back in input order, with per-file failures reported.
+    """
+    paths = []
+    for index in range(6):
+        path = tmp_path / f"clip_{index}.wav"
+        write_wav(path, np.full(1600 * (index + 1), 1000 * index), sample_rate=16000)
+        paths.append(str(path))
+    paths.insert(3, str(tmp_path / "missing.wav"))
+
+    report = run_pipeline_batch(
+        NODE_CONFIGURATIONS, paths, max_workers=2, max_in_flight=3
+    )
+
+    assert [result.input for result in report.results] == paths
+    assert [result.input for result in report.failures] == [paths[3]]
+    assert "FileNotFoundError" in report.failures[0].error
+
+    fifth = report.results[5]
+    assert isinstance(fifth.data, SingleChannelAudioDataType)
+    assert fifth.position == 5
+    assert fifth.data.data.shape == (8000,)
+    assert fifth.audio_seconds == 0.5
+    assert np.isclose(fifth.context["statistics"].peak, 8000 / 32768)
+
+    assert report.audio_seconds == sum(0.1 * (index + 1) for index in range(6))
+    summary = report.summary()
+    assert summary["files"] == 7 and summary["failures"] == 1
+    assert summary["files_per_second"] > 0 and summary["audio_seconds_per_second"] > 0
+
+
+def test_batch_runner_without_outputs(tmp_path):
+    """
+    Test that outputs can be dropped in the workers, keeping context values.
+    """
+    path = tmp_path / "clip.wav"
+    write_wav(path, np.zeros(100))
+
+    with AudioBatchRunner(
+        NODE_CONFIGURATIONS, max_workers=1, keep_outputs=False
+    ) as runner:
+        (result,) = runner.iter_results([str(path)])
+
+    assert result.ok and result.data is None
+    assert result.context["statistics"].count == 100
+
+
+def test_batch_runner_returns_probe_collector_results():
+    """
+    Test that collector probe results are returned per input and not accumulated
+    by the worker pipeline, and that source parameters reach the source.
+    """
+    report = run_pipeline_batch(
+        [{"processor": "SingleChannelAudioStatisticsProbe"}],
+        [10, 20, 30],
+        source_parameters={"value": 0.5},
+        source=ConstantPayloadSource,
+        max_workers=1,
+    )
+
+    assert not report.failures
+    for length, result in zip([10, 20, 30], report.results):
+        ((name, collected),) = result.probe_results.items()
+        assert name == "Node 1/SingleChannelAudioStatisticsProbe"
+        assert [statistics.count for statistics in collected] == [length]
+        assert collected[0].peak == 0.5
@@ -0,0 +1,80 @@
+import pytest
+import numpy as np
+
+from semantiva_audio.data_types.data_types import (
+    SingleChannelAudioDataType,
+    DualChannelAudioDataType,
+)
+from semantiva_audio.processing.buffer_pool import AudioBufferPool
+from semantiva_audio.processing.processors import (
+    SingleChannelAudioMultiplyOperation,
+    SingleChannelAudioClipOperation,
+    DualChannelAudioOffsetOperation,
+)
+
+
+def test_pool_reuses_released_buffers():
+    """
+    Test that released buffers are handed out again for the same shape and dtype.
+    """
+    pool = AudioBufferPool(max_buffers_per_key=1)
+
+    buffer = pool.acquire((100, 2), np.float32)
+    assert pool.release(buffer)
+    assert not pool.release(buffer)  # Already pooled
+    assert not pool.release(buffer[:10])  # Views are not pooled
+
+    assert pool.acquire((100, 2), np.float32) is buffer
+    assert pool.acquire((100, 2), np.float64) is not buffer
+    assert (pool.allocations, pool.reuses) == (2, 1)
+
+
+def test_process_into_provided_buffer():
+    """
+    Test that operations write their result into the buffer given to process_into.
+    """
+    audio = SingleChannelAudioDataType(np.random.rand(1000))
+    out = np.empty(1000)
+
+    output = SingleChannelAudioMultiplyOperation().process_into(audio, out, factor=2.0)
+
+    assert output.data is out
+    np.testing.assert_allclose(out, audio.data * 2.0)
+
+    with pytest.raises(ValueError):
+        SingleChannelAudioMultiplyOperation().process_into(audio, np.empty(10), 2.0)
+
+
+def test_in_place_operation():
+    """
+    Test that in-place operations overwrite the input samples.
+    """
+    samples = np.random.rand(1000, 2)
+    expected = samples + [1.0, -1.0]
+    operation = DualChannelAudioOffsetOperation()
+    operation.in_place = True
+
+    output = operation(DualChannelAudioDataType(samples), [1.0, -1.0])
+
+    assert output.data is samples
+    np.testing.assert_allclose(samples, expected)
+
+
+def test_steady_state_processing_allocates_from_pool():
+    """
+    Test that a processing loop releasing its payloads stops allocating.
+    """
+    pool = AudioBufferPool()
+    multiply = SingleChannelAudioMultiplyOperation()
+    clip = SingleChannelAudioClipOperation()
+    multiply.buffer_pool = pool
+    clip.in_place = True
+
+    for _ in range(10):
+        audio = SingleChannelAudioDataType(np.random.rand(1000))
+        output = clip(multiply(audio, 2.0), 0.0, 1.0)
+        np.testing.assert_allclose(output.data, np.clip(audio.data * 2.0, 0.0, 1.0))
+        pool.release(output.data)
+
+    assert pool.allocations == 1
+    assert pool.reuses == 9
@@ -0,0 +1,150 @@
+import numpy as np
+import pytest
+
+from semantiva.payload_operations import Pipeline
+from semantiva_audio.data_types.data_types import (
+    DualChannelAudioDataType,
+    SingleChannelAudioDataType,
+)
+from semantiva_audio.processing.cache import (
+    OperationResultCache,
+    array_digest,
+    with_result_cache,
+)
+from semantiva_audio.processing.processors import (
+    DualChannelAudioFIRFilterOperation,
+    DualChannelAudioMultiplyInPlaceOperation,
+    SingleChannelAudioResampleOperation,
+    SingleChannelAudioSTFTOperation,
+)
+
+
+def test_array_digest_depends_on_content_only():
+    """
+    Test that digests depend on the values, and planar arrays are hashed in place.
+    """
+    samples = np.random.randn(1000, 2)
+
+    assert array_digest(samples) == array_digest(samples.copy())
+    assert array_digest(np.asfortranarray(samples)) == array_digest(samples.T.copy())
+    assert array_digest(samples) != array_digest(samples + 1e-12)
+
+
+def test_cached_operation_reuses_results():
+    """
+    Test that results are reused for equal inputs and parameters, read-only.
+    """
+    cache = OperationResultCache()
+    operation = with_result_cache(DualChannelAudioFIRFilterOperation, cache)()
+    audio = DualChannelAudioDataType(np.random.randn(4000, 2))
+    kernel = np.random.randn(100)
+
+    first = operation(audio, kernel)
+    second = operation(DualChannelAudioDataType(audio.data.copy()), list(kernel))
+    operation(audio, kernel * 2)
+
+    assert (cache.hits, cache.misses) == (1, 2)
+    np.testing.assert_array_equal(first.data, second.data)
+    assert not second.data.flags.writeable
+
+    # A later in-place operation does not modify the cached samples
+    DualChannelAudioMultiplyInPlaceOperation()(second, 0.0)
+    assert np.array_equal(operation(audio, kernel).data, first.data)
+
+
+def test_cache_keys_include_instance_settings():
+    """
+    Test that instances configured differently do not share results.
+    """
+    cache = OperationResultCache()
+    operation_class = with_result_cache(SingleChannelAudioSTFTOperation, cache)
+    audio = SingleChannelAudioDataType(np.random.randn(4096))
+    hann, rectangular = operation_class(), operation_class()
+    rectangular.window = "rectangular"
+
+    first = hann(audio, 256, 128)
+    second = rectangular(audio, 256, 128)
+    assert cache.hits == 0
+    assert second.window == "rectangular"
+    assert not np.allclose(first.data, second.data)
+
+    # Runtime attributes do not change the key
+    hann.profile_label = "stft"
+    hann(audio, 256, 128)
+    assert cache.hits == 1
+
+
+def test_cache_keys_are_exact():
+    """
+    Test that nested and ragged parameters are keyed by their whole content, and
+    calls with parameters without an exact key are not cached.
+    """
+    cache = OperationResultCache()
+    operation = with_result_cache(DualChannelAudioFIRFilterOperation, cache)()
+    audio = DualChannelAudioDataType(np.random.randn(100, 2))
+    large = np.zeros(10_000)
+    changed = large.copy()
+    changed[5000] = 1.0
+    assert repr({"taps": large}) == repr({"taps": changed})
+
+    def key(*args):
+        return cache.key(operation, audio, args, {})
+
+    assert key({"taps": large}) != key({"taps": changed})
+    assert key({"a": 1, "b": 2}) == key({"b": 2, "a": 1})
+    assert key([np.zeros(3), np.zeros(5)]) != key([np.zeros(3), np.ones(5)])
+    assert key([1, 2]) != key([1.0, 2.0]) and key(1) != key(True)
+    with pytest.raises(ValueError):
+        key({1, 2})
+
+    operation.taps = {1, 2}
+    first = operation(audio, [1.0, 0.5])
+    second = operation(audio, [1.0, 0.5])
+    assert len(cache) == 0 and (cache.hits, cache.misses) == (0, 0)
+    np.testing.assert_array_equal(first.data, second.data)
+
+
+def test_cache_is_bounded_by_bytes():
+    """
+    Test that the least recently used results are evicted beyond the byte bound.
+    """
+    cache = OperationResultCache(max_bytes=3 * 8000)
+    operation = with_result_cache(DualChannelAudioFIRFilterOperation, cache)()
+    inputs = [DualChannelAudioDataType(np.random.randn(500, 2)) for _ in range(4)]
+
+    for audio in inputs:
+        operation(audio, [1.0, 0.5])
+
+    assert len(cache) == 3 and cache.nbytes == 3 * 8000
+    operation(inputs[0], [1.0, 0.5])
+    assert cache.misses == 5
+
+
+def test_cached_context_updates_are_replayed():
+    """
+    Test that a reused result updates the context like the operation does.
+    """
+    cache = OperationResultCache()
+    node_configurations = [
+        {
+            "processor": with_result_cache(SingleChannelAudioResampleOperation, cache),
+            "parameters": {"target_sample_rate": 8000},
+        }
+    ]
+    audio = SingleChannelAudioDataType(np.random.randn(1600))
+
+    for _ in range(2):
+        output, context = Pipeline(node_configurations).process(
+            audio, {"sample_rate": 16000}
+        )
+        assert context.get_value("sample_rate") == 8000
+        assert output.data.shape == (800,)
+    assert cache.hits == 1
+
+
+def test_with_result_cache_requires_support():
+    """
+    Test that only operations with the cache mixin can be wrapped.
+    """
+    with pytest.raises(ValueError):
+        with_result_cache(int, OperationResultCache())
@@ -0,0 +1,158 @@
+import numpy as np
+import pytest
+
+from semantiva.specializations import load_specializations
+from semantiva_audio.data_types.data_types import (
+    DualChannelAudioDataType,
+    PLANAR,
+)
+from semantiva_audio.processing.checkpoint import PipelineCheckpointer
+from semantiva_audio.processing.fusion import fused_operation_factory
+from semantiva_audio.processing.operations import DualChannelAudioOperation
+from semantiva_audio.processing.processors import DualChannelAudioMultiplyOperation
+
+
+class DualChannelCountingOperation(DualChannelAudioOperation):
+    """
+    Pass the data through, counting the calls.
+    """
+
+    calls = 0
+
+    def _process_logic(self, data):
+        DualChannelCountingOperation.calls += 1
+        return data
+
+
+def node_configurations(factor, offset):
+    return [
+        {"processor": DualChannelCountingOperation},
+        {
+            "processor": "DualChannelAudioMultiplyOperation",
+            "parameters": {"factor": factor},
+        },
+        {"processor": "DualChannelToPlanarOperation", "checkpoint": True},
+        {
+            "processor": "DualChannelAudioOffsetOperation",
+            "parameters": {"offset": offset},
+        },
+    ]
+
+
+def test_checkpoint_resumes_run(tmp_path):
+    """
+    Test that a run resumes from a checkpoint, unless an upstream node changed.
+    """
+    load_specializations("audio")
+    checkpointer = PipelineCheckpointer(tmp_path)
+    audio = DualChannelAudioDataType(np.random.randn(1000, 2))
+    DualChannelCountingOperation.calls = 0
+
+    first, context = checkpointer.run(
+        node_configurations([2.0, 3.0], 0.0), audio, {"name": "clip"}
+    )
+    assert checkpointer.resumed_from is None
+
+    # Only a downstream parameter changed: the checkpoint is reused
+    second, context = checkpointer.run(
+        node_configurations([2.0, 3.0], 1.0), audio, {"name": "clip"}
+    )
+    assert checkpointer.resumed_from == 2
+    assert DualChannelCountingOperation.calls == 1
+    assert context.get_value("name") == "clip"
+    np.testing.assert_allclose(second.data, first.data + 1.0)
+    assert second.layout == PLANAR
+
+    # An upstream parameter changed: the pipeline runs from the start
+    checkpointer.run(node_configurations(2.0, 1.0), audio, {"name": "clip"})
+    assert checkpointer.resumed_from is None
+    assert DualChannelCountingOperation.calls == 2
+
+
+def test_checkpoint_is_memory_mapped(tmp_path):
+    """
+    Test that a payload loaded from a checkpoint maps the saved samples.
+    """
+    load_specializations("audio")
+    checkpointer = PipelineCheckpointer(tmp_path)
+    audio = DualChannelAudioDataType(np.random.randn(1000, 2))
+    nodes = node_configurations(0.5, 0.0)[:3]
+
+    expected, _ = checkpointer.run(nodes, audio)
+    resumed, _ = checkpointer.run(nodes, audio)
+
+    assert isinstance(resumed.data, np.memmap) and not resumed.data.flags.writeable
+    assert resumed.layout == PLANAR
+    np.testing.assert_array_equal(resumed.data, expected.data)
+
+    (tmp_path / "notes").mkdir()
+    checkpointer.clear()
+    checkpointer.run(nodes, audio)
+    assert checkpointer.resumed_from is None
+    assert (tmp_path / "notes").is_dir()
+
+
+def test_checkpoint_keeps_probe_collector_results(tmp_path):
+    """
+    Test that probe collector results are returned, including those of the nodes
+    before a resumed checkpoint.
+    """
+    load_specializations("audio")
+    checkpointer = PipelineCheckpointer(tmp_path)
+    audio = DualChannelAudioDataType(np.random.randn(1000, 2))
+    nodes = node_configurations(2.0, 0.0)
+    nodes.insert(2, {"processor": "DualChannelAudioStatisticsProbe"})
+    nodes.append({"processor": "DualChannelAudioStatisticsProbe"})
+
+    checkpointer.run(nodes, audio)
+    first = checkpointer.probe_results
+    checkpointer.run(nodes, audio)
+
+    assert checkpointer.resumed_from == 3
+    assert sorted(checkpointer.probe_results) == [
+        "Node 3/DualChannelAudioStatisticsProbe",
+        "Node 6/DualChannelAudioStatisticsProbe",
+    ]
+    for name, results in checkpointer.probe_results.items():
+        assert len(results) == 1
+        np.testing.assert_allclose(results[0].peak, first[name][0].peak)
+
+
+def test_checkpoint_keys_reject_unstable_values(tmp_path):
+    """
+    Test that values represented with their memory address are rejected.
+    """
+    checkpointer = PipelineCheckpointer(tmp_path)
+    audio = DualChannelAudioDataType(np.zeros((10, 2)))
+
+    with pytest.raises(ValueError, match="object"):
+        checkpointer.checkpoint_keys(
+            node_configurations(1.0, 0.0), audio, {"token": object()}
+        )
+
+
+def test_checkpoint_keys_tell_fused_operations_apart(tmp_path):
+    """
+    Test that fused operations differing only in their parameters have different
+    keys, and that classes not importable from their module are rejected.
+    """
+    checkpointer = PipelineCheckpointer(tmp_path)
+    audio = DualChannelAudioDataType(np.ones((4, 2)))
+    fused = [
+        fused_operation_factory(
+            [DualChannelAudioMultiplyOperation] * 2,
+            [{"factor": first}, {"factor": second}],
+        )
+        for first, second in [(2.0, 3.0), (5.0, 7.0)]
+    ]
+
+    outputs = [
+        checkpointer.run([{"processor": processor, "checkpoint": True}], audio)[0]
+        for processor in fused
+    ]
+    assert checkpointer.resumed_from is None
+    np.testing.assert_array_equal(outputs[1].data, 35.0)
+
+    local_operation = type("Local", (DualChannelCountingOperation,), {})
+    with pytest.raises(ValueError, match="not importable"):
+        checkpointer.checkpoint_keys([{"processor": local_operation}], audio)
@@ -0,0 +1,135 @@
+import numpy as np
+import pytest
+
+from semantiva_audio.data_types.data_types import (
+    SingleChannelAudioDataType,
+    DualChannelAudioDataType,
+    PLANAR,
+)
+from semantiva_audio.processing.convolution import (
+    KernelSpectrumCache,
+    choose_convolution_method,
+    fir_filter,
+)
+from semantiva_audio.processing.filters import (
+    SingleChannelAudioFIRFilterOperation,
+    DualChannelAudioFIRFilterOperation,
+)
+
+
+def reference_filter(samples: np.ndarray, kernel: np.ndarray) -> np.ndarray:
+    """
+    Filter (samples, channels) data with np.convolve, truncated to the input length.
+    """
+    return np.stack(
+        [np.convolve(samples[:, c], kernel)[: len(samples)] for c in range(2)], axis=1
+    )
+
+
+@pytest.mark.parametrize("method", ["direct", "fft"])
+@pytest.mark.parametrize("signal_size, kernel_size", [(5000, 300), (10, 1000)])
+def test_fir_filter_methods(method, signal_size, kernel_size):
+    """
+    Test that both methods match np.convolve, including kernels longer than the signal.
+    """
+    signal = np.random.randn(2, signal_size)
+    kernel = np.random.randn(kernel_size)
+
+    filtered, state = fir_filter(signal, kernel, method=method)
+
+    expected = np.stack([np.convolve(channel, kernel) for channel in signal])
+    np.testing.assert_allclose(filtered, expected[:, :signal_size], atol=1e-9)
+    np.testing.assert_allclose(state, expected[:, signal_size:], atol=1e-9)
+
+
+@pytest.mark.parametrize("dtype", [np.float16, np.float32, np.float64])
+@pytest.mark.parametrize("kernel_dtype", [np.float32, np.float64])
+def test_fir_filter_methods_keep_the_result_type(dtype, kernel_dtype):
+    """
+    Test that FFT overlap-add returns the type of the direct convolution result.
+    """
+    signal = np.random.randn(2, 5000).astype(dtype)
+    kernel = np.random.randn(300).astype(kernel_dtype)
+
+    direct = fir_filter(signal, kernel, method="direct")
+    fft = fir_filter(signal, kernel, method="fft")
+
+    assert [array.dtype for array in fft] == [array.dtype for array in direct]
+    # The operations filter float32 samples in float32 with both methods
+    audio = SingleChannelAudioDataType(signal[0].astype(np.float32))
+    for method in "direct", "fft":
+        operation = SingleChannelAudioFIRFilterOperation()
+        operation.method = method
+        assert operation(audio, kernel).data.dtype == np.float32
+
+
+def test_convolution_method_selection():
+    """
+    Test that short kernels are applied directly and long ones with FFT.
+    """
+    assert choose_convolution_method(48000, 16) == "direct"
+    assert choose_convolution_method(48000, 4800) == "fft"
+
+
+def test_kernel_spectra_are_cached():
+    """
+    Test that filtering with the same kernel computes its spectrum once.
+    """
+    cache = KernelSpectrumCache(maxsize=1)
+    signal = np.random.randn(4096)
+    kernel = np.random.randn(512)
+
+    fir_filter(signal, kernel, method="fft", cache=cache)
+    fir_filter(signal, kernel.copy(), method="fft", cache=cache)
+    assert (cache.misses, cache.hits) == (1, 1)
+
+    fir_filter(signal, kernel * 2, method="fft", cache=cache)
+    assert cache.misses == 2 and len(cache) == 1
+
+
+def test_fir_filter_operations():
+    """
+    Test the FIR filter operations, with shared and per-channel kernels.
+    """
+    kernel = np.random.randn(200)
+    mono = SingleChannelAudioDataType(np.random.randn(3000))
+    output = SingleChannelAudioFIRFilterOperation()(mono, kernel)
+    np.testing.assert_allclose(
+        output.data, np.convolve(mono.data, kernel)[:3000], atol=1e-9
+    )
+
+    stereo = DualChannelAudioDataType(np.random.randn(3000, 2))
+    output = DualChannelAudioFIRFilterOperation()(stereo, kernel)
+    assert output.layout == PLANAR
+    np.testing.assert_allclose(
+        output.data, reference_filter(stereo.data, kernel), atol=1e-9
+    )
+
+    kernels = np.stack([kernel, -kernel], axis=1)
+    output = DualChannelAudioFIRFilterOperation()(stereo, kernels)
+    np.testing.assert_allclose(
+        output.data[:, 1], -reference_filter(stereo.data, kernel)[:, 1], atol=1e-9
+    )
+    with pytest.raises(ValueError):
+        DualChannelAudioFIRFilterOperation()(stereo, np.ones((10, 3)))
+
+
+def test_fir_filter_streaming():
+    """
+    Test that filtering a stream chunk by chunk matches filtering the whole signal.
+    """
+    samples = np.random.randn(10_000, 2).astype(np.float32)
+    kernel = np.random.randn(2048).astype(np.float32)
+    chunks = [
+        DualChannelAudioDataType.from_validated(samples[start : start + 1500])
+        for start in range(0, len(samples), 1500)
+    ]
+    operation = DualChannelAudioFIRFilterOperation()
+
+    outputs = list(operation.process_stream(chunks, kernel))
+
+    streamed = np.concatenate([output.data for output in outputs])
+    assert streamed.dtype == np.float32
+    np.testing.assert_allclose(
+        streamed, reference_filter(samples, kernel), rtol=1e-3, atol=1e-3
+    )
@@ -0,0 +1,111 @@
+import numpy as np
+
+from semantiva.payload_operations import Pipeline
+from semantiva.specializations import load_specializations
+from semantiva_audio.data_types.data_types import (
+    SingleChannelAudioDataType,
+    DualChannelAudioDataType,
+)
+from semantiva_audio.processing.fusion import (
+    affine_step,
+    clip_step,
+    fold_elementwise_steps,
+    apply_elementwise_steps,
+    fuse_elementwise_operations,
+)
+from semantiva_audio.processing.processors import (
+    SingleChannelAudioOffsetOperation,
+    SingleChannelAudioClipOperation,
+    DualChannelAudioMultiplyOperation,
+    DualChannelAudioOffsetOperation,
+)
+from .test_audio_operation import SingleChannelMockDataProbe
+
+
+def test_fold_affine_steps():
+    """
+    Test that consecutive gains and offsets are folded into one affine step.
+    """
+    steps = fold_elementwise_steps(
+        [affine_step(2.0), affine_step(offset=1.0), affine_step(0.5), clip_step(0, 1)]
+    )
+
+    assert [step.kind for step in steps] == ["affine", "clip"]
+    assert steps[0].a == 1.0 and steps[0].b == 0.5
+
+
+def test_apply_steps_blockwise_matches_numpy():
+    """
+    Test that blockwise application gives the same result as chained NumPy calls.
+    """
+    samples = np.random.randn(10_000, 2)
+    steps = [affine_step([2.0, 3.0]), affine_step(offset=0.1), clip_step(-1.0, 1.0)]
+
+    output = apply_elementwise_steps(samples, steps, block_size=999)
+
+    np.testing.assert_allclose(output, np.clip(samples * [2.0, 3.0] + 0.1, -1.0, 1.0))
+
+    apply_elementwise_steps(samples, steps, out=samples)
+    np.testing.assert_allclose(samples, output)
+
+
+def test_fuse_pipeline_configuration():
+    """
+    Test that runs of elementwise nodes are fused and give the same result.
+    """
+    load_specializations("audio")
+    audio = SingleChannelAudioDataType(np.random.randn(5000))
+    node_configurations = [
+        {
+            "processor": "SingleChannelAudioMultiplyOperation",
+            "parameters": {"factor": 2.0},
+        },
+        {
+            "processor": SingleChannelAudioOffsetOperation,
+            "parameters": {"offset": 0.5},
+        },
+        {"processor": SingleChannelMockDataProbe, "context_keyword": "length"},
+        {
+            "processor": "SingleChannelAudioMultiplyOperation",
+            "parameters": {"factor": 0.5},
+        },
+        {
+            "processor": SingleChannelAudioClipOperation,
+            "parameters": {"minimum": -1.0, "maximum": 1.0},
+        },
+        # The factor comes from the context: this node is not fused
+        {"processor": "SingleChannelAudioMultiplyOperation"},
+    ]
+
+    fused_configurations = fuse_elementwise_operations(node_configurations)
+
+    assert len(fused_configurations) == 4
+    fused_output, fused_context = Pipeline(fused_configurations).process(
+        audio, {"factor": 3.0}
+    )
+    output, _ = Pipeline(node_configurations).process(audio, {"factor": 3.0})
+    np.testing.assert_allclose(fused_output.data, output.data)
+    assert fused_context.get_value("length") == 5000
+
+
+def test_fuse_dual_channel_operations():
+    """
+    Test fusing dual-channel operations with per-channel parameters.
+    """
+    audio = DualChannelAudioDataType(np.random.randn(1000, 2))
+    fused_configurations = fuse_elementwise_operations(
+        [
+            {
+                "processor": DualChannelAudioMultiplyOperation,
+                "parameters": {"factor": [1.0, 2.0]},
+            },
+            {
+                "processor": DualChannelAudioOffsetOperation,
+                "parameters": {"offset": [0.0, -1.0]},
+            },
+        ]
+    )
+
+    assert len(fused_configurations) == 1
+    fused = fused_configurations[0]["processor"]()
+    np.testing.assert_allclose(fused(audio).data, audio.data * [1.0, 2.0] + [0.0, -1.0])
@@ -0,0 +1,340 @@
+import struct
+import wave
+import pytest
+import numpy as np
+
+from semantiva_audio.data_types.data_types import (
+    SingleChannelAudioDataType,
+    DualChannelAudioDataType,
+)
+from semantiva.context_processors.context_types import ContextType
+from semantiva_audio.data_io import io
+from semantiva_audio.data_io.io import (
+    read_wav_header,
+    WavSingleChannelAudioLoader,
+    WavDualChannelAudioLoader,
+    WavSingleChannelPayloadLoader,
+    RawSingleChannelAudioLoader,
+    RawDualChannelAudioLoader,
+    WavSingleChannelPayloadSink,
+    WavDualChannelPayloadSink,
+    RawDualChannelPayloadSink,
+)
+
+
+def write_wav(path, samples: np.ndarray, sample_rate=16000):
+    """
+    Write int16 samples, shaped (frames,) or (frames, channels), to a WAV file.
+    """
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(1 if samples.ndim == 1 else samples.shape[1])
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(samples.astype("<i2").tobytes())
+
+
+@pytest.fixture
+def mono_samples():
+    """
+    Pytest fixture providing random int16 mono samples.
+    """
+    return np.random.randint(-32768, 32767, size=1000).astype(np.int16)
+
+
+@pytest.fixture
+def stereo_samples():
+    """
+    Pytest fixture providing random int16 stereo samples.
+    """
+    return np.random.randint(-32768, 32767, size=(1000, 2)).astype(np.int16)
+
+
+def test_read_wav_header(tmp_path, stereo_samples):
+    """
+    Test that the WAV header is parsed without reading the samples.
+    """
+    path = tmp_path / "stereo.wav"
+    write_wav(path, stereo_samples, sample_rate=44100)
+
+    header = read_wav_header(str(path))
+
+    assert header.sample_rate == 44100
+    assert header.channels == 2
+    assert header.dtype == np.dtype("<i2")
+    assert header.frames == len(stereo_samples)
+
+
+def test_wav_single_channel_loader_is_memory_mapped(tmp_path, mono_samples):
+    """
+    Test that mono WAV files are loaded as memory-mapped single-channel data.
+    """
+    path = tmp_path / "mono.wav"
+    write_wav(path, mono_samples)
+
+    audio = WavSingleChannelAudioLoader().get_data(str(path))
+
+    assert isinstance(audio, SingleChannelAudioDataType)
+    assert isinstance(audio.data, np.memmap)
+    np.testing.assert_array_equal(audio.data, mono_samples)
+
+
+def test_wav_dual_channel_loader_is_memory_mapped(tmp_path, stereo_samples):
+    """
+    Test that stereo WAV files are loaded as memory-mapped dual-channel data.
+    """
+    path = tmp_path / "stereo.wav"
+    write_wav(path, stereo_samples)
+
+    audio = WavDualChannelAudioLoader().get_data(str(path))
+
+    assert isinstance(audio, DualChannelAudioDataType)
+    assert isinstance(audio.data, np.memmap)
+    np.testing.assert_array_equal(audio.data, stereo_samples)
+
+
+def test_wav_loader_rejects_channel_mismatch(tmp_path, stereo_samples):
+    """
+    Test that a stereo file cannot be loaded as single-channel audio.
+    """
+    path = tmp_path / "stereo.wav"
+    write_wav(path, stereo_samples)
+
+    with pytest.raises(ValueError):
+        WavSingleChannelAudioLoader().get_data(str(path))
+
+
+def test_wav_payload_loader_sets_sample_rate(tmp_path, mono_samples):
+    """
+    Test that the payload loader stores the sample rate in the context.
+    """
+    path = tmp_path / "mono.wav"
+    write_wav(path, mono_samples, sample_rate=48000)
+
+    audio, context = WavSingleChannelPayloadLoader().get_payload(str(path))
+
+    np.testing.assert_array_equal(audio.data, mono_samples)
+    assert context.get_value("sample_rate") == 48000
+
+
+def test_raw_loaders(tmp_path, mono_samples, stereo_samples):
+    """
+    Test memory-mapped loading of headerless PCM files, with and without offset.
+    """
+    mono_path = tmp_path / "mono.raw"
+    mono_path.write_bytes(b"\x00" * 4 + mono_samples.astype("<i2").tobytes())
+    stereo_path = tmp_path / "stereo.raw"
+    stereo_path.write_bytes(stereo_samples.astype("<i2").tobytes())
+
+    mono = RawSingleChannelAudioLoader().get_data(str(mono_path), offset=4)
+    stereo = RawDualChannelAudioLoader().get_data(str(stereo_path))
+
+    assert isinstance(mono.data, np.memmap)
+    np.testing.assert_array_equal(mono.data, mono_samples)
+    assert stereo.data.shape == (1000, 2)
+    np.testing.assert_array_equal(stereo.data, stereo_samples)
+
+
+def test_wav_24_bit_loader(tmp_path):
+    """
+    Test that 24-bit WAV samples are sign-extended into int32 containers.
+    """
+    samples = np.array([-(2**23), -1, 0, 1, 2**23 - 1], dtype=np.int32)
+    packed = samples.astype("<i4").view(np.uint8).reshape(-1, 4)[:, :3]
+    path = tmp_path / "mono24.wav"
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(3)
+        wav_file.setframerate(16000)
+        wav_file.writeframes(packed.tobytes())
+
+    assert read_wav_header(str(path)).sample_format == "int24"
+    audio = WavSingleChannelAudioLoader().get_data(str(path))
+
+    assert audio.data.dtype == np.int32
+    np.testing.assert_array_equal(audio.data, samples)
+    assert audio.sample_format == "int24"
+    np.testing.assert_allclose(audio.as_float()[-1], 1 - 2**-23)
+
+
+def test_wav_float64_round_trip(tmp_path, stereo_samples):
+    """
+    Test that float64 samples, which start 44 bytes into the file, are read back.
+    """
+    samples = stereo_samples / 32768.0
+    path = tmp_path / "stereo64.wav"
+    WavDualChannelPayloadSink("float64", sample_rate=8000).send_payload(
+        DualChannelAudioDataType(samples), ContextType(), str(path)
+    )
+
+    audio = WavDualChannelAudioLoader().get_data(str(path))
+    assert audio.data.flags.aligned
+    np.testing.assert_array_equal(audio.data, samples)
+
+
+def test_wav_loader_reads_unaligned_samples(tmp_path):
+    """
+    Test that float32 samples after an 18-byte fmt chunk (at byte 46) are read.
+    """
+    samples = np.linspace(-1, 1, 11, dtype="<f4")
+    fmt = struct.pack("<HHIIHHH", 3, 1, 16000, 64000, 4, 32, 0)
+    chunks = (
+        b"WAVE"
+        + b"fmt "
+        + struct.pack("<I", len(fmt))
+        + fmt
+        + b"data"
+        + struct.pack("<I", samples.nbytes)
+        + samples.tobytes()
+    )
+    path = tmp_path / "float32.wav"
+    path.write_bytes(b"RIFF" + struct.pack("<I", len(chunks)) + chunks)
+
+    assert read_wav_header(str(path)).data_offset == 46
+    audio = WavSingleChannelAudioLoader().get_data(str(path))
+    np.testing.assert_array_equal(audio.data, samples)
+
+
+@pytest.mark.parametrize(
+    "sample_format, tolerance",
+    [("uint8", 2**-7), ("int16", 2**-15), ("int24", 2**-23), ("float32", 1e-7)],
+)
+def test_wav_sink_converts_to_sample_format(tmp_path, sample_format, tolerance):
+    """
+    Test that float samples are written in the target format and read back.
+    """
+    samples = np.random.uniform(-1, 1, 5000)
+    path = tmp_path / "mono.wav"
+
+    WavSingleChannelPayloadSink(sample_format).send_payload(
+        SingleChannelAudioDataType(samples),
+        ContextType({"sample_rate": 22050}),
+        str(path),
+    )
+
+    header = read_wav_header(str(path))
+    assert (header.sample_format, header.sample_rate) == (sample_format, 22050)
+    audio = WavSingleChannelAudioLoader().get_data(str(path))
+    np.testing.assert_allclose(audio.as_float(np.float64), samples, atol=tolerance)
+
+
+def test_wav_sink_writes_planar_data_interleaved(tmp_path, stereo_samples):
+    """
+    Test that stereo files are standard interleaved WAV files, without conversion
+    of samples already in the target format.
+    """
+    path = tmp_path / "stereo.wav"
+    planar = DualChannelAudioDataType(
+        np.asfortranarray(stereo_samples), sample_format="int16"
+    )
+
+    WavDualChannelPayloadSink(sample_rate=8000).send_payload(
+        planar, ContextType(), str(path)
+    )
+
+    with wave.open(str(path), "rb") as wav_file:
+        assert (wav_file.getnchannels(), wav_file.getframerate()) == (2, 8000)
+        frames = wav_file.readframes(wav_file.getnframes())
+    np.testing.assert_array_equal(
+        np.frombuffer(frames, "<i2").reshape(-1, 2), stereo_samples
+    )
+
+
+def test_sink_converts_integers_without_sample_format_as_numbers(tmp_path):
+    """
+    Test that integer samples without a recorded sample format are written like
+    float values, as `to_sample_format` converts them.
+    """
+    path = tmp_path / "numbers.wav"
+    audio = SingleChannelAudioDataType(np.array([-2, -1, 0, 1, 3], dtype=np.int16))
+
+    WavSingleChannelPayloadSink(sample_rate=8000).send_payload(
+        audio, ContextType(), str(path)
+    )
+
+    with wave.open(str(path), "rb") as wav_file:
+        frames = wav_file.readframes(wav_file.getnframes())
+    np.testing.assert_array_equal(
+        np.frombuffer(frames, "<i2"), audio.to_sample_format("int16").data
+    )
+
+
+def test_background_sink_appends_streamed_chunks(tmp_path, monkeypatch):
+    """
+    Test that a stream written by the writer thread is appended chunk by chunk.
+    """
+    monkeypatch.setattr(io, "WRITE_BLOCK_FRAMES", 64)
+    samples = np.random.uniform(-1, 1, (1000, 2)).astype(np.float32)
+    chunks = [
+        DualChannelAudioDataType(samples[start : start + 300])
+        for start in range(0, 1000, 300)
+    ]
+    path = tmp_path / "stream.wav"
+
+    with WavDualChannelPayloadSink("float32", background=True, max_queue=2) as sink:
+        sink.send_stream(chunks, ContextType({"sample_rate": 16000}), str(path))
+        sink.flush()
+        audio = WavDualChannelAudioLoader().get_data(str(path))
+
+    assert read_wav_header(str(path)).frames == 1000
+    np.testing.assert_array_equal(audio.data, samples)
+
+
+@pytest.mark.parametrize("chunks_after", [0, 1])
+def test_background_sink_completes_failed_streams(tmp_path, chunks_after):
+    """
+    Test that the file of a stream whose chunk fails in the writer thread (last
+    or not) is completed, and that the next stream can be written.
+    """
+    good = DualChannelAudioDataType(np.zeros((300, 2), dtype=np.float32))
+    # A mono chunk cannot be written to a stereo file
+    bad = SingleChannelAudioDataType(np.zeros(300))
+    path = tmp_path / "failed.wav"
+    context = ContextType({"sample_rate": 16000})
+
+    with WavDualChannelPayloadSink("float32", background=True) as sink:
+        with pytest.raises(ValueError):
+            sink.send_stream([good, bad] + [good] * chunks_after, context, str(path))
+            sink.flush()
+        sink.flush()
+        assert read_wav_header(str(path)).frames == 300
+
+        sink.send_stream([good], context, str(tmp_path / "next.wav"))
+        sink.flush()
+    assert read_wav_header(str(tmp_path / "next.wav")).frames == 300
+
+
+def test_raw_sink(tmp_path):
+    """
+    Test that raw files hold the interleaved little-endian samples only.
+    """
+    samples = np.random.uniform(-1, 1, (500, 2))
+    path = tmp_path / "stereo.raw"
+
+    RawDualChannelPayloadSink("float32").send_payload(
+        DualChannelAudioDataType(samples), ContextType(), str(path)
+    )
+
+    assert path.stat().st_size == samples.size * 4
+    stereo = RawDualChannelAudioLoader().get_data(str(path), dtype="<f4")
+    np.testing.assert_allclose(stereo.data, samples, rtol=1e-6)
+
+
+def test_sink_errors(tmp_path, mono_samples):
+    """
+    Test that missing sample rates and writer thread failures are raised.
+    """
+    audio = SingleChannelAudioDataType(mono_samples)
+    with pytest.raises(ValueError):
+        WavSingleChannelPayloadSink().send_payload(
+            audio, ContextType(), str(tmp_path / "mono.wav")
+        )
+    with pytest.raises(ValueError):
+        WavSingleChannelPayloadSink("int12")
+
+    sink = WavSingleChannelPayloadSink(sample_rate=8000, background=True)
+    sink.send_payload(audio, ContextType(), str(tmp_path / "missing" / "mono.wav"))
+    with pytest.raises(FileNotFoundError):
+        sink.flush()
+    sink.send_payload(audio, ContextType(), str(tmp_path / "mono.wav"))
+    sink.close()
+    assert read_wav_header(str(tmp_path / "mono.wav")).frames == len(mono_samples)
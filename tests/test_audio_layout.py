@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+
+from semantiva.payload_operations import Pipeline
+from semantiva_audio.data_types.data_types import (
+    DualChannelAudioDataType,
+    INTERLEAVED,
+    PLANAR,
+)
+from semantiva_audio.processing.buffer_pool import AudioBufferPool
+from semantiva_audio.processing.layout import insert_layout_conversions
+from semantiva_audio.processing.operations import DualChannelAudioOperation
+from semantiva_audio.processing.processors import (
+    DualChannelAudioMultiplyOperation,
+    DualChannelAudioOffsetOperation,
+    DualChannelToPlanarOperation,
+)
+from semantiva_audio.processing.fusion import fuse_elementwise_operations
+
+
+class DualChannelMockPlanarOperation(DualChannelAudioOperation):
+    """
+    A mock operation preferring planar data, recording the layout it receives.
+    """
+
+    preferred_layout = PLANAR
+    received_layouts: list = []
+
+    def _process_logic(self, data):
+        self.received_layouts.append(data.layout)
+        return self._in_preferred_layout(data)
+
+
+def test_layout_conversion_round_trip():
+    """
+    Test conversions between interleaved and planar storage.
+    """
+    samples = np.random.randn(1000, 2)
+    audio = DualChannelAudioDataType(samples)
+    assert audio.layout == INTERLEAVED
+    assert audio.to_layout(INTERLEAVED) is audio
+
+    planar = audio.to_layout(PLANAR)
+    assert planar.layout == PLANAR
+    assert planar.data.shape == (1000, 2)
+    assert planar.channel(1).flags.c_contiguous
+    np.testing.assert_array_equal(planar.data, samples)
+
+    interleaved = planar.to_layout(INTERLEAVED)
+    assert interleaved.data.flags.c_contiguous
+    np.testing.assert_array_equal(interleaved.data, samples)
+
+    from_planar = DualChannelAudioDataType.from_planar(np.ascontiguousarray(samples.T))
+    assert from_planar.layout == PLANAR
+    np.testing.assert_array_equal(from_planar.data, samples)
+
+    with pytest.raises(ValueError):
+        audio.to_layout("diagonal")
+
+
+def test_operations_preserve_planar_layout():
+    """
+    Test that elementwise operations, fused or not, keep planar data planar.
+    """
+    planar = DualChannelAudioDataType.from_planar(np.random.randn(2, 1000))
+    expected = planar.data * [2.0, 3.0]
+
+    multiply = DualChannelAudioMultiplyOperation()
+    output = multiply(planar, [2.0, 3.0])
+    assert output.layout == PLANAR
+    np.testing.assert_allclose(output.data, expected)
+
+    pool = AudioBufferPool()
+    multiply.buffer_pool = pool
+    output = multiply(planar, [2.0, 3.0])
+    assert output.layout == PLANAR
+    np.testing.assert_allclose(output.data, expected)
+    assert pool.release(output.data)
+    assert multiply(planar, [2.0, 3.0]).layout == PLANAR
+    assert pool.reuses == 1
+
+    fused = fuse_elementwise_operations(
+        [
+            {
+                "processor": DualChannelAudioMultiplyOperation,
+                "parameters": {"factor": [2.0, 3.0]},
+            },
+            {"processor": DualChannelAudioOffsetOperation, "parameters": {"offset": 1}},
+        ]
+    )[0]["processor"]()
+    output = fused(planar)
+    assert output.layout == PLANAR
+    np.testing.assert_allclose(output.data, expected + 1)
+
+
+def test_insert_layout_conversions():
+    """
+    Test that the data is converted once, before the first node preferring planar data.
+    """
+    node_configurations = [
+        {"processor": DualChannelMockPlanarOperation},
+        {
+            "processor": "DualChannelAudioMultiplyOperation",
+            "parameters": {"factor": 2.0},
+        },
+        {"processor": DualChannelMockPlanarOperation},
+    ]
+
+    converted_configurations = insert_layout_conversions(node_configurations)
+
+    assert [node["processor"] for node in converted_configurations] == [
+        DualChannelToPlanarOperation,
+        *[node["processor"] for node in node_configurations],
+    ]
+
+    audio = DualChannelAudioDataType(np.random.randn(1000, 2))
+    DualChannelMockPlanarOperation.received_layouts = []
+    output, _ = Pipeline(converted_configurations).process(audio, {})
+    assert DualChannelMockPlanarOperation.received_layouts == [PLANAR, PLANAR]
+    np.testing.assert_allclose(output.data, audio.data * 2.0)
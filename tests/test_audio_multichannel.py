@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from semantiva_audio.data_types.data_types import (
+    SingleChannelAudioDataType,
+    DualChannelAudioDataType,
+    MultiChannelAudioDataType,
+    PLANAR,
+)
+from semantiva_audio.data_io.io import RawMultiChannelAudioLoader
+from semantiva_audio.processing.processors import (
+    MultiChannelAudioMixOperation,
+    MultiChannelAudioDownmixOperation,
+    DualChannelAudioDownmixOperation,
+    SingleChannelAudioDuplicateOperation,
+    SingleChannelAudioUpmixOperation,
+    DualChannelAudioMultiplyInPlaceOperation,
+)
+
+
+@pytest.fixture
+def multi_channel_audio_data():
+    """
+    Pytest fixture providing random 8-channel audio data.
+    """
+    return MultiChannelAudioDataType(np.random.randn(1000, 8))
+
+
+def test_multi_channel_data_initialization(multi_channel_audio_data):
+    """
+    Test the initialization of MultiChannelAudioDataType.
+    """
+    assert multi_channel_audio_data.channels == 8
+    with pytest.raises(AssertionError):
+        MultiChannelAudioDataType(np.random.randn(1000))
+
+
+def test_multi_channel_mix_operation(multi_channel_audio_data):
+    """
+    Test mixing 8 channels down to 2 with a mixing matrix, for both layouts.
+    """
+    mixing_matrix = np.random.rand(2, 8)
+    expected = multi_channel_audio_data.data @ mixing_matrix.T
+
+    output = MultiChannelAudioMixOperation()(multi_channel_audio_data, mixing_matrix)
+    planar_output = MultiChannelAudioMixOperation()(
+        multi_channel_audio_data.to_layout(PLANAR), mixing_matrix
+    )
+
+    assert isinstance(output, MultiChannelAudioDataType)
+    np.testing.assert_allclose(output.data, expected)
+    np.testing.assert_allclose(planar_output.data, expected)
+    with pytest.raises(ValueError):
+        MultiChannelAudioMixOperation()(multi_channel_audio_data, np.ones((2, 4)))
+
+
+def test_downmix_operations(multi_channel_audio_data):
+    """
+    Test downmixing multi-channel and dual-channel data to a single channel.
+    """
+    weights = np.full(8, 1 / 8)
+    output = MultiChannelAudioDownmixOperation()(multi_channel_audio_data, weights)
+    assert isinstance(output, SingleChannelAudioDataType)
+    np.testing.assert_allclose(output.data, multi_channel_audio_data.data.mean(axis=1))
+
+    stereo = DualChannelAudioDataType(
+        np.array([[16384, 0], [0, -16384]], np.int16), sample_format="int16"
+    )
+    output = DualChannelAudioDownmixOperation()(stereo, [0.5, 0.5])
+    assert output.data.dtype == np.float32
+    np.testing.assert_allclose(output.data, [0.25, -0.25])
+
+
+def test_expanders_return_broadcast_views():
+    """
+    Test that mono audio is expanded without copying its samples.
+    """
+    mono = SingleChannelAudioDataType(np.arange(1000, dtype=np.int16), "int16")
+
+    stereo = SingleChannelAudioDuplicateOperation()(mono)
+    assert isinstance(stereo, DualChannelAudioDataType)
+    assert np.shares_memory(stereo.data, mono.data)
+    assert not stereo.data.flags.writeable
+    assert stereo.sample_format == "int16"
+    np.testing.assert_array_equal(stereo.data[:, 1], mono.data)
+
+    # Writing operations allocate their own buffer
+    doubled = DualChannelAudioMultiplyInPlaceOperation()(stereo, 2.0)
+    assert not np.shares_memory(doubled.data, mono.data)
+
+    multi = SingleChannelAudioUpmixOperation()(mono, np.ones(16))
+    assert multi.data.shape == (1000, 16)
+    assert np.shares_memory(multi.data, mono.data)
+
+    scaled = SingleChannelAudioUpmixOperation()(mono, [1.0, 0.5])
+    np.testing.assert_allclose(scaled.data[:, 1], mono.as_float() * 0.5)
+
+
+def test_raw_multi_channel_loader(tmp_path):
+    """
+    Test memory-mapped loading of a headerless 8-channel file.
+    """
+    samples = np.random.randint(-32768, 32767, size=(100, 8)).astype("<i2")
+    path = tmp_path / "multi.raw"
+    path.write_bytes(samples.tobytes())
+
+    audio = RawMultiChannelAudioLoader().get_data(str(path), channels=8)
+
+    assert isinstance(audio.data, np.memmap)
+    np.testing.assert_array_equal(audio.data, samples)
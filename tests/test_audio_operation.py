@@ -14,6 +14,8 @@ from semantiva_audio.processing.operations import (
 from semantiva_audio.processing.processors import (
     SingleChannelAudioMultiplyOperation,
     DualChannelAudioMultiplyOperation,
+    DualChannelAudioMultiplyInPlaceOperation,
+    DualChannelAudioClipOperation,
 )
 
 
@@ -87,6 +89,101 @@ def test_dual_channel_data_initialization(dual_channel_audio_data):
     assert dual_channel_audio_data.data.shape[1] == 2
 
 
+def test_data_validation_rejects_invalid_samples():
+    """
+    Test that non-numeric and non-contiguous arrays are rejected.
+    """
+    with pytest.raises(AssertionError):
+        SingleChannelAudioDataType(np.array([1.0, None, 2.0], dtype=object))
+
+    strided = np.random.rand(1000, 2)[:, 0]
+    assert SingleChannelAudioDataType(strided).data is strided
+    with pytest.raises(AssertionError):
+        SingleChannelAudioDataType.from_external(strided)
+
+
+def test_trusted_construction_skips_validation(single_channel_audio_data, monkeypatch):
+    """
+    Test that operation outputs are built without re-validation.
+    """
+    trusted = SingleChannelAudioDataType.from_validated(single_channel_audio_data.data)
+    assert isinstance(trusted, SingleChannelAudioDataType)
+    assert trusted.data is single_channel_audio_data.data
+
+    calls = []
+    monkeypatch.setattr(
+        SingleChannelAudioDataType, "validate", lambda self, data: calls.append(data)
+    )
+    SingleChannelAudioMultiplyOperation()(single_channel_audio_data, 2.0)
+    assert calls == []
+
+
+def test_sample_format_conversion():
+    """
+    Test that integer PCM is kept compact and converted to float on demand.
+    """
+    pcm = np.array([-32768, 0, 16384, 32767], dtype=np.int16)
+    audio = SingleChannelAudioDataType(pcm, sample_format="int16")
+
+    assert audio.sample_format == "int16"
+    floats = audio.as_float()
+    assert floats.dtype == np.float32
+    np.testing.assert_allclose(floats, [-1.0, 0.0, 0.5, 32767 / 32768])
+
+    float_audio = SingleChannelAudioDataType(floats)
+    assert float_audio.as_float() is floats
+    round_trip = float_audio.to_sample_format("int16")
+    np.testing.assert_array_equal(round_trip.data, pcm)
+
+    clipped = SingleChannelAudioDataType(np.array([2.0, -2.0])).to_sample_format(
+        "int16"
+    )
+    np.testing.assert_array_equal(clipped.data, [32767, -32768])
+
+    with pytest.raises(AssertionError):
+        SingleChannelAudioDataType(pcm, sample_format="int32")
+
+
+def test_integers_without_sample_format_are_plain_numbers():
+    """
+    Test that integer samples without a recorded sample format are never
+    scaled, and are saturated like float values when converted to PCM.
+    """
+    numbers = np.array([-2, -1, 0, 1, 3], dtype=np.int16)
+    audio = SingleChannelAudioDataType(numbers)
+
+    assert audio.sample_format is None
+    floats = audio.as_float()
+    assert floats.dtype == np.float64
+    np.testing.assert_array_equal(floats, numbers)
+
+    pcm = audio.to_sample_format("int16")
+    assert pcm is not audio and pcm.recorded_sample_format == "int16"
+    np.testing.assert_array_equal(pcm.data, [-32768, -32768, 0, 32767, 32767])
+    assert pcm.to_sample_format("int16") is pcm
+
+
+def test_operations_normalize_recorded_pcm_only():
+    """
+    Test that integer samples are normalized only when their sample format is
+    recorded, and are otherwise computed on as float64 numbers.
+    """
+    operation = SingleChannelAudioMultiplyOperation()
+    samples = np.arange(5, dtype=np.int16)
+
+    plain = operation(SingleChannelAudioDataType(samples), 2)
+    assert plain.data.dtype == np.float64
+    np.testing.assert_array_equal(plain.data, [0, 2, 4, 6, 8])
+
+    # Beyond the 24-bit mantissa of float32
+    large = np.array([2**30 + 1], dtype=np.int64)
+    assert operation(SingleChannelAudioDataType(large), 1).data[0] == 2**30 + 1
+
+    pcm = operation(SingleChannelAudioDataType(samples, "int16"), 2)
+    assert pcm.data.dtype == np.float32
+    np.testing.assert_allclose(pcm.data, samples * 2 / 32768)
+
+
 def test_single_channel_multiply_operation(single_channel_audio_data):
     """
     Test SingleChannelAudioMultiplyOperation with single-channel audio data.
@@ -153,6 +250,64 @@ def test_dual_channel_multiply_operation(dual_channel_audio_data):
     )
 
 
+def test_dual_channel_multiply_per_channel_factors(dual_channel_audio_data):
+    """
+    Test DualChannelAudioMultiplyOperation with one factor per channel.
+    """
+    factors = [0.5, 2.0]
+    operation = DualChannelAudioMultiplyOperation()
+
+    output = operation(dual_channel_audio_data, factors)
+
+    np.testing.assert_array_almost_equal(
+        output.data[:, 0], dual_channel_audio_data.data[:, 0] * 0.5
+    )
+    np.testing.assert_array_almost_equal(
+        output.data[:, 1], dual_channel_audio_data.data[:, 1] * 2.0
+    )
+
+    with pytest.raises(ValueError):
+        operation(dual_channel_audio_data, [1.0, 2.0, 3.0])
+
+
+def test_dual_channel_clip_per_channel_bounds(dual_channel_audio_data):
+    """
+    Test DualChannelAudioClipOperation with one pair of bounds per channel.
+    """
+    output = DualChannelAudioClipOperation()(
+        dual_channel_audio_data, [0.1, 0.2], [0.5, 0.6]
+    )
+
+    assert output.data.dtype == dual_channel_audio_data.data.dtype
+    np.testing.assert_array_equal(
+        output.data,
+        np.clip(dual_channel_audio_data.data, [0.1, 0.2], [0.5, 0.6]),
+    )
+
+
+def test_dual_channel_multiply_in_place(dual_channel_audio_data):
+    """
+    Test that the in-place variant reuses the input buffer when possible.
+    """
+    expected = dual_channel_audio_data.data * 2.5
+    input_buffer = dual_channel_audio_data.data
+
+    output = DualChannelAudioMultiplyInPlaceOperation()(dual_channel_audio_data, 2.5)
+
+    assert output.data is input_buffer
+    np.testing.assert_array_almost_equal(output.data, expected)
+
+    # Integer PCM is converted to float32 first: the input is left untouched
+    int_data = DualChannelAudioDataType(
+        np.full((10, 2), 16384, dtype=np.int16), sample_format="int16"
+    )
+    int_output = DualChannelAudioMultiplyInPlaceOperation()(int_data, 0.5)
+    assert int_output.data is not int_data.data
+    assert int_output.data.dtype == np.float32
+    np.testing.assert_array_almost_equal(int_output.data, 0.25)
+    np.testing.assert_array_equal(int_data.data, 16384)
+
+
 def test_single_channel_data_probe_duration(single_channel_audio_data):
     """
     Test SingleChannelDataProbe to verify it returns the duration of the audio.
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from semantiva_audio.data_types.data_types import (
+    DualChannelAudioDataType,
+    MultiChannelAudioDataType,
+    SingleChannelAudioBatchDataType,
+    SingleChannelAudioDataType,
+    PLANAR,
+)
+from semantiva_audio.processing.parallel import AudioParallelExecutor
+from semantiva_audio.processing.processors import (
+    DualChannelAudioMultiplyOperation,
+    MultiChannelAudioFIRFilterOperation,
+    MultiChannelAudioMixOperation,
+    SingleChannelAudioBatchMultiplyOperation,
+    SingleChannelAudioClipOperation,
+)
+
+
+@pytest.fixture
+def executor():
+    with AudioParallelExecutor(max_workers=3, block_size=1000) as executor:
+        yield executor
+
+
+def test_parallel_time_split(executor):
+    """
+    Test that elementwise operations split into time blocks match a serial run.
+    """
+    audio = SingleChannelAudioDataType(np.random.randn(10_500))
+
+    output = executor.run(
+        SingleChannelAudioClipOperation, audio, minimum=-0.5, maximum=0.5
+    )
+
+    np.testing.assert_array_equal(output.data, np.clip(audio.data, -0.5, 0.5))
+
+
+def test_parallel_channel_split(executor):
+    """
+    Test that per-channel parameters are split with the channels, and that the
+    layout of the input is kept.
+    """
+    samples = (np.random.randn(2000, 2) * 8000).astype(np.int16)
+    audio = DualChannelAudioDataType(samples, sample_format="int16")
+
+    output = executor.run(
+        DualChannelAudioMultiplyOperation(), audio, split="channel", factor=[2.0, 3.0]
+    )
+    np.testing.assert_allclose(output.data, audio.as_float() * [2.0, 3.0])
+
+    kernels = np.random.randn(64, 5)
+    audio = MultiChannelAudioDataType.from_planar(np.random.randn(5, 3000))
+    output = executor.run(MultiChannelAudioFIRFilterOperation, audio, kernel=kernels)
+    expected = MultiChannelAudioFIRFilterOperation()(audio, kernels)
+
+    assert output.layout == PLANAR
+    np.testing.assert_allclose(output.data, expected.data, atol=1e-12)
+
+
+def test_parallel_clip_split(executor):
+    """
+    Test that batches are split into groups of clips with per-clip factors.
+    """
+    batch = SingleChannelAudioBatchDataType(np.random.randn(7, 100))
+    factors = np.arange(7.0)
+
+    output = executor.run(
+        SingleChannelAudioBatchMultiplyOperation, batch, factor=factors
+    )
+
+    np.testing.assert_allclose(output.data, batch.data * factors[:, np.newaxis])
+
+
+def test_parallel_unsupported_split(executor):
+    """
+    Test that operations are only split in the ways they declare.
+    """
+    audio = MultiChannelAudioDataType(np.random.randn(100, 3))
+    with pytest.raises(ValueError):
+        executor.run(MultiChannelAudioMixOperation, audio, mixing_matrix=np.eye(3))
+    with pytest.raises(ValueError):
+        executor.run(
+            SingleChannelAudioClipOperation,
+            SingleChannelAudioDataType(np.zeros(10)),
+            split="channel",
+            minimum=0,
+            maximum=1,
+        )
@@ -0,0 +1,128 @@
+import json
+import numpy as np
+import pytest
+
+from semantiva.payload_operations import Pipeline
+from semantiva.specializations import load_specializations
+from semantiva_audio.data_types.data_types import (
+    DualChannelAudioDataType,
+    SingleChannelAudioDataType,
+)
+from semantiva_audio.processing.profiling import (
+    AudioProfiler,
+    profile_pipeline,
+    with_profiler,
+)
+from semantiva_audio.processing.processors import (
+    DualChannelAudioDownmixOperation,
+    DualChannelAudioFIRFilterOperation,
+    SingleChannelAudioMultiplyOperation,
+    SingleChannelAudioStatisticsProbe,
+)
+
+
+def test_operations_are_not_profiled_by_default():
+    """
+    Test that operations record nothing, and are unchanged, without a profiler.
+    """
+    audio = SingleChannelAudioDataType(np.ones(100))
+
+    assert SingleChannelAudioMultiplyOperation.profiler is None
+    np.testing.assert_array_equal(
+        SingleChannelAudioMultiplyOperation()(audio, 2.0).data, np.full(100, 2.0)
+    )
+
+
+def test_profiled_operation_records_measurements():
+    """
+    Test that a profiled call records its time, sizes, memory and throughput.
+    """
+    with AudioProfiler(sample_rate=8000) as profiler:
+        operation = with_profiler(DualChannelAudioDownmixOperation, profiler)()
+        audio = DualChannelAudioDataType(np.random.randn(16000, 2))
+        output = operation(audio, [0.5, 0.5])
+
+    (record,) = profiler.records
+    assert record.node == "DualChannelAudioDownmixOperation"
+    assert record.wall_time > 0 and record.cpu_time >= 0
+    assert (record.input_bytes, record.output_bytes) == (256000, 128000)
+    assert record.peak_bytes is not None and record.peak_bytes >= 128000
+    assert (record.frames, record.channels) == (16000, 2)
+    assert record.samples_per_second == pytest.approx(32000 / record.wall_time)
+    assert record.realtime_factor == pytest.approx(2.0 / record.wall_time)
+    np.testing.assert_allclose(output.data, audio.data.mean(axis=1))
+
+
+def test_profile_pipeline_labels_nodes_and_exports_records(tmp_path):
+    """
+    Test that pipeline nodes are profiled separately and exported as JSON Lines.
+    """
+    load_specializations("audio")
+    profiler = AudioProfiler(sample_rate=16000, trace_memory=False)
+    node_configurations = profile_pipeline(
+        [
+            {
+                "processor": "SingleChannelAudioMultiplyOperation",
+                "parameters": {"factor": 2.0},
+            },
+            {"processor": SingleChannelAudioStatisticsProbe, "context_keyword": "s"},
+            {
+                "processor": SingleChannelAudioMultiplyOperation,
+                "parameters": {"factor": 0.5},
+            },
+        ],
+        profiler,
+    )
+    audio = SingleChannelAudioDataType(np.random.randn(16000))
+
+    output, _ = Pipeline(node_configurations).process(audio, {})
+
+    np.testing.assert_allclose(output.data, audio.data)
+    assert [record.node for record in profiler.records] == [
+        "0:SingleChannelAudioMultiplyOperation",
+        "1:SingleChannelAudioStatisticsProbe",
+        "2:SingleChannelAudioMultiplyOperation",
+    ]
+    assert profiler.records[1].output_bytes == 0
+    assert all(record.peak_bytes is None for record in profiler.records)
+
+    path = tmp_path / "profile.jsonl"
+    profiler.write_jsonl(str(path))
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert lines == profiler.to_records()
+    assert lines[0]["frames"] == 16000
+
+    summary = profiler.summary()
+    assert len(summary) == 3
+    assert summary[0]["wall_time"] >= summary[-1]["wall_time"]
+    assert all(totals["calls"] == 1 for totals in summary)
+
+
+def test_summary_aggregates_calls_per_node():
+    """
+    Test that repeated calls of a node are aggregated in the summary.
+    """
+    profiler = AudioProfiler(trace_memory=False)
+    operation = with_profiler(DualChannelAudioFIRFilterOperation, profiler)()
+    audio = DualChannelAudioDataType(np.random.randn(1000, 2))
+    for _ in range(3):
+        operation(audio, np.ones(8) / 8)
+
+    (totals,) = profiler.summary()
+    assert totals["calls"] == 3
+    assert totals["input_bytes"] == 3 * audio.data.nbytes
+    assert totals["wall_time"] == pytest.approx(
+        sum(record.wall_time for record in profiler.records)
+    )
+    assert profiler.records[0].realtime_factor is None
+
+    profiler.clear()
+    assert profiler.records == []
+
+
+def test_with_profiler_rejects_unsupported_processors():
+    """
+    Test that only processors with the profiling mixin can be profiled.
+    """
+    with pytest.raises(ValueError):
+        with_profiler(int, AudioProfiler())
@@ -0,0 +1,299 @@
+import tracemalloc
+import numpy as np
+import pytest
+
+from semantiva.logger import Logger
+from semantiva.specializations import load_specializations
+from semantiva_audio.data_io.realtime import AudioRingBuffer, RealtimeAudioProcessor
+from semantiva_audio.data_types.data_types import SingleChannelAudioDataType
+from semantiva_audio.processing.processors import (
+    DualChannelAudioDownmixOperation,
+    SingleChannelAudioClipOperation,
+    SingleChannelAudioFIRFilterOperation,
+    SingleChannelAudioMultiplyOperation,
+)
+
+
+class SyntheticClock:
+    """
+    A clock advancing by the given steps, one per reading.
+    """
+
+    def __init__(self, steps):
+        self.now = 0.0
+        self.steps = iter(steps)
+
+    def __call__(self) -> float:
+        self.now += next(self.steps, 0.0)
+        return self.now
+
+
+def test_ring_buffer_wraps_around_and_counts_overruns():
+    """
+    Test that frames come out in order across the end of the buffer.
+    """
+    ring = AudioRingBuffer(8, channels=2)
+    out = np.zeros((5, 2))
+    frames = np.arange(24.0).reshape(12, 2)
+
+    assert ring.write(frames[:6]) == 6
+    assert ring.read_into(out) == 5
+    assert ring.write(frames[6:]) == 6
+    assert (ring.available, ring.free, ring.overruns) == (7, 1, 0)
+    assert ring.read_into(out) == 5
+    np.testing.assert_array_equal(out, frames[5:10])
+
+    assert ring.write(np.zeros((10, 2))) == 6
+    assert ring.overruns == 4
+    with pytest.raises(ValueError):
+        ring.write(np.zeros(4))
+
+
+def test_ring_buffer_counts_underruns():
+    """
+    Test that short reads leave the rest of the array unchanged.
+    """
+    ring = AudioRingBuffer(4)
+    ring.write(np.array([1.0, 2.0]))
+    out = np.full(3, -1.0)
+
+    assert ring.read_into(out) == 2
+    np.testing.assert_array_equal(out, [1.0, 2.0, -1.0])
+    assert ring.underruns == 1
+
+
+def test_processor_runs_blocks_between_ring_buffers():
+    """
+    Test that complete blocks are processed as they arrive, in order.
+    """
+    load_specializations("audio")
+    signal = np.random.randn(1000)
+    source, sink = AudioRingBuffer(256), AudioRingBuffer(2048)
+    processor = RealtimeAudioProcessor(
+        [
+            {
+                "processor": SingleChannelAudioMultiplyOperation,
+                "parameters": {"factor": 2.0},
+            },
+            {
+                "processor": "SingleChannelAudioClipOperation",
+                "parameters": {"minimum": -1.0, "maximum": 1.0},
+            },
+        ],
+        source,
+        sink,
+        block_size=64,
+        sample_rate=16000,
+    )
+    processed = 0
+    for start in range(0, 1000, 100):
+        source.write(signal[start : start + 100])
+        processed += processor.process_available()
+
+    assert processed == 1000 // 64 == processor.blocks
+    out = np.zeros(processed * 64)
+    assert sink.read_into(out) == len(out)
+    np.testing.assert_allclose(out, np.clip(2 * signal[: len(out)], -1.0, 1.0))
+
+
+def test_stateful_operations_carry_state_between_blocks():
+    """
+    Test that a filter run block by block matches the whole-signal filter.
+    """
+    signal = np.random.randn(512)
+    kernel = np.hanning(31)
+    source, sink = AudioRingBuffer(512), AudioRingBuffer(512)
+    with RealtimeAudioProcessor(
+        [
+            {
+                "processor": SingleChannelAudioFIRFilterOperation,
+                "parameters": {"kernel": kernel},
+            }
+        ],
+        source,
+        sink,
+        block_size=128,
+        sample_rate=48000,
+    ) as processor:
+        source.write(signal)
+        assert processor.process_available() == 4
+
+    out = np.zeros(512)
+    sink.read_into(out)
+    expected = SingleChannelAudioFIRFilterOperation()(
+        SingleChannelAudioDataType(signal), kernel
+    )
+    np.testing.assert_allclose(out, expected.data, atol=1e-5)
+
+
+def test_processor_measures_latency_against_synthetic_clock():
+    """
+    Test that block latencies and deadline misses follow the clock.
+    """
+    # Readings at the start and end of each block: 1 ms, 5 ms, 1 ms, 1.5 ms
+    clock = SyntheticClock([0, 0.001, 0, 0.005, 0, 0.001, 0, 0.0015])
+    source, sink = AudioRingBuffer(256, channels=2), AudioRingBuffer(256)
+    processor = RealtimeAudioProcessor(
+        [
+            {
+                "processor": DualChannelAudioDownmixOperation,
+                "parameters": {"weights": [0.5, 0.5]},
+            }
+        ],
+        source,
+        sink,
+        block_size=64,
+        sample_rate=32000,
+        clock=clock,
+    )
+    source.write(np.random.randn(256, 2))
+
+    assert processor.process_available() == 4
+    stats = processor.stats()
+    assert stats.deadline == pytest.approx(0.002)
+    assert stats.deadline_misses == 1
+    assert stats.max_latency == pytest.approx(0.005)
+    assert stats.mean_latency == pytest.approx(0.002125)
+
+    processor.reset_stats()
+    assert processor.stats().blocks == 0
+
+
+def test_processor_does_not_allocate_samples_per_block():
+    """
+    Test that steady-state blocks allocate no sample memory.
+    """
+    # Debug logging formats messages for every operation call
+    Logger().set_verbose_level("WARNING")
+    block_size = 1024
+    source, sink = AudioRingBuffer(4 * block_size), AudioRingBuffer(4 * block_size)
+    processor = RealtimeAudioProcessor(
+        [
+            {
+                "processor": SingleChannelAudioMultiplyOperation,
+                "parameters": {"factor": 0.5},
+            },
+            {
+                "processor": SingleChannelAudioClipOperation,
+                "parameters": {"minimum": -0.5, "maximum": 0.5},
+            },
+        ],
+        source,
+        sink,
+        block_size=block_size,
+        sample_rate=48000,
+    )
+    block, out = np.random.randn(block_size), np.zeros(block_size)
+    source.write(block)
+    processor.process_available()
+    sink.read_into(out)
+
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        for _ in range(50):
+            source.write(block)
+            processor.process_available()
+            sink.read_into(out)
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+    assert peak < block.nbytes
+
+
+def test_processor_converts_pcm_ring_buffers():
+    """
+    Test that integer ring buffers with a sample format are processed as PCM,
+    without allocating conversion buffers per block.
+    """
+    Logger().set_verbose_level("WARNING")
+    block_size = 1024
+    samples = np.random.randint(-32768, 32768, 4 * block_size).astype(np.int16)
+    source = AudioRingBuffer(block_size, sample_format="int16")
+    sink = AudioRingBuffer(4 * block_size, sample_format="int16")
+    processor = RealtimeAudioProcessor(
+        [
+            {
+                "processor": SingleChannelAudioMultiplyOperation,
+                "parameters": {"factor": 3.0},
+            }
+        ],
+        source,
+        sink,
+        block_size=block_size,
+        sample_rate=48000,
+    )
+    source.write(samples[:block_size])
+    processor.process_available()
+
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        for start in range(block_size, len(samples), block_size):
+            source.write(samples[start : start + block_size])
+            processor.process_available()
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+    # Smaller than a float32 block
+    assert peak < block_size * 4
+
+    out = np.zeros(len(samples), dtype=np.int16)
+    assert sink.read_into(out) == len(samples)
+    np.testing.assert_array_equal(
+        out, np.clip(samples.astype(np.int64) * 3, -32768, 32767)
+    )
+
+
+@pytest.mark.parametrize("sample_format, scale", [(None, 1.0), ("int16", 2**-15)])
+def test_processor_scales_only_integer_rings_with_a_sample_format(sample_format, scale):
+    """
+    Test that integer ring buffers without a sample format hold plain numbers,
+    saturated to the range of their dtype.
+    """
+    Logger().set_verbose_level("WARNING")
+    samples = np.array([-20000, -3, 0, 5, 20000], dtype=np.int16)
+    source = AudioRingBuffer(8, dtype=np.int16, sample_format=sample_format)
+    floats, integers = AudioRingBuffer(8), AudioRingBuffer(8, dtype=np.int16)
+    for sink in floats, integers:
+        processor = RealtimeAudioProcessor(
+            [
+                {
+                    "processor": SingleChannelAudioMultiplyOperation,
+                    "parameters": {"factor": 3.0},
+                }
+            ],
+            source,
+            sink,
+            block_size=len(samples),
+            sample_rate=48000,
+        )
+        source.write(samples)
+        processor.process_available()
+
+    out = np.zeros(len(samples))
+    floats.read_into(out)
+    np.testing.assert_allclose(out, samples * 3.0 * scale)
+    out = np.zeros(len(samples), dtype=np.int16)
+    integers.read_into(out)
+    np.testing.assert_array_equal(
+        out, np.clip(np.rint(samples * 3.0 * scale), -32768, 32767)
+    )
+
+
+def test_ring_buffer_sample_format_sets_its_dtype():
+    """
+    Test that a sample format sets the dtype of a ring buffer, and rejects
+    another one.
+    """
+    assert AudioRingBuffer(4, sample_format="int24").dtype == np.int32
+    with pytest.raises(ValueError, match="stored as"):
+        AudioRingBuffer(4, dtype=np.int16, sample_format="int32")
+
+
+def test_block_size_must_fit_in_input_buffer():
+    """
+    Test that blocks larger than the input buffer are rejected.
+    """
+    with pytest.raises(ValueError):
+        RealtimeAudioProcessor([], AudioRingBuffer(32), AudioRingBuffer(32), 64, 48000)
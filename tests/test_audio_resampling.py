@@ -0,0 +1,145 @@
+import numpy as np
+import pytest
+
+from semantiva.payload_operations import Pipeline
+from semantiva_audio.data_types.data_types import (
+    SingleChannelAudioDataType,
+    DualChannelAudioDataType,
+    SingleChannelAudioBatchDataType,
+    DualChannelAudioBatchDataType,
+)
+from semantiva_audio.processing.resampling import (
+    PolyphaseResampler,
+    design_polyphase_filter,
+    resample,
+    resampling_ratio,
+)
+from semantiva_audio.processing.resamplers import (
+    SingleChannelAudioResampleOperation,
+    DualChannelAudioResampleOperation,
+    SingleChannelAudioBatchResampleOperation,
+    DualChannelAudioBatchResampleOperation,
+)
+
+
+def reference_resample(samples: np.ndarray, up: int, down: int) -> np.ndarray:
+    """
+    Resample by zero insertion, full convolution and decimation.
+    """
+    phases, delay = design_polyphase_filter(up, down)
+    taps = phases.T.reshape(-1)[: 2 * delay + 1]
+    upsampled = np.zeros(len(samples) * up)
+    upsampled[::up] = samples
+    filtered = np.convolve(upsampled, taps)
+    outputs = -(-len(samples) * up // down)
+    return filtered[np.arange(outputs) * down + delay]
+
+
+def test_resampling_ratio():
+    """
+    Test that sample rates are reduced to coprime factors.
+    """
+    assert resampling_ratio(48000, 44100) == (147, 160)
+    assert resampling_ratio(48000, 16000) == (1, 3)
+    with pytest.raises(ValueError):
+        resampling_ratio(48000, 0)
+
+
+@pytest.mark.parametrize("up, down", [(147, 160), (160, 147), (1, 3), (3, 1)])
+def test_polyphase_resampler_matches_reference(up, down):
+    """
+    Test the polyphase resampler, whole and chunked, against the direct definition.
+    """
+    samples = np.random.randn(2000)
+    expected = reference_resample(samples, up, down)
+
+    np.testing.assert_allclose(resample(samples, up, down), expected, atol=1e-12)
+
+    resampler = PolyphaseResampler(up, down)
+    chunks = [resampler.process(chunk) for chunk in np.array_split(samples, 7)]
+    chunks.append(resampler.flush())
+    np.testing.assert_allclose(np.concatenate(chunks), expected, atol=1e-12)
+
+
+def test_resampling_preserves_tone():
+    """
+    Test that a tone below both Nyquist frequencies keeps its amplitude.
+    """
+    time = np.arange(48000) / 48000
+    tone = np.sin(2 * np.pi * 1000 * time)
+
+    resampled = resample(tone, *resampling_ratio(48000, 16000))
+
+    expected = np.sin(2 * np.pi * 1000 * np.arange(16000) / 16000)
+    np.testing.assert_allclose(resampled[100:-100], expected[100:-100], atol=1e-3)
+
+
+def test_resample_operations():
+    """
+    Test the resample operations on mono, stereo and batch data.
+    """
+    mono = SingleChannelAudioDataType(np.random.randn(4800))
+    output = SingleChannelAudioResampleOperation()(mono, 48000, 16000)
+    assert output.data.shape == (1600,)
+
+    stereo = DualChannelAudioDataType(np.random.randn(4800, 2).astype(np.float32))
+    output = DualChannelAudioResampleOperation()(stereo, 48000, 44100)
+    assert output.data.shape == (4410, 2)
+    assert output.data.dtype == np.float32
+    np.testing.assert_allclose(
+        output.data[:, 1],
+        reference_resample(stereo.data[:, 1].astype(np.float64), 147, 160),
+        atol=1e-5,
+    )
+
+    batch = SingleChannelAudioBatchDataType(np.random.randn(3, 4800))
+    output = SingleChannelAudioBatchResampleOperation()(batch, 48000, 16000)
+    assert output.data.shape == (3, 1600)
+    np.testing.assert_allclose(output.data[2], resample(batch.data[2], 1, 3))
+
+    batch = DualChannelAudioBatchDataType(np.random.randn(3, 4800, 2))
+    output = DualChannelAudioBatchResampleOperation()(batch, 48000, 16000)
+    assert output.data.shape == (3, 1600, 2)
+    np.testing.assert_allclose(
+        output.data[1, :, 0], resample(batch.data[1, :, 0], 1, 3)
+    )
+
+
+def test_resample_operation_streaming():
+    """
+    Test that a stream resampled chunk by chunk matches the whole signal.
+    """
+    samples = np.random.randn(10_000, 2)
+    chunks = [
+        DualChannelAudioDataType.from_validated(samples[start : start + 1024])
+        for start in range(0, len(samples), 1024)
+    ]
+    operation = DualChannelAudioResampleOperation()
+
+    outputs = list(operation.process_stream(chunks, 44100, 48000))
+
+    streamed = np.concatenate([output.data for output in outputs])
+    expected = DualChannelAudioResampleOperation()(
+        DualChannelAudioDataType(samples), 44100, 48000
+    )
+    np.testing.assert_allclose(streamed, expected.data, atol=1e-12)
+
+
+def test_resample_operation_updates_context():
+    """
+    Test that the sample rate of the context is updated in a pipeline.
+    """
+    audio = SingleChannelAudioDataType(np.random.randn(4800))
+    pipeline = Pipeline(
+        [
+            {
+                "processor": SingleChannelAudioResampleOperation,
+                "parameters": {"target_sample_rate": 16000},
+            }
+        ]
+    )
+
+    output, context = pipeline.process(audio, {"sample_rate": 48000})
+
+    assert output.data.shape == (1600,)
+    assert context.get_value("sample_rate") == 16000
@@ -0,0 +1,70 @@
+import multiprocessing
+import pickle
+
+import numpy as np
+import pytest
+
+from semantiva_audio.data_types import (
+    DualChannelAudioDataType,
+    SingleChannelAudioDataType,
+    SharedAudioBuffer,
+    PLANAR,
+)
+
+
+def _negate_in_worker(audio: DualChannelAudioDataType) -> int:
+    """
+    Negate shared samples in place from a worker process.
+    """
+    np.negative(audio.data, out=audio.data)
+    return len(pickle.dumps(audio))
+
+
+def test_shared_memory_pickles_handle():
+    """
+    Test that pickling shared audio sends a handle to the same memory, not the samples.
+    """
+    audio = SingleChannelAudioDataType(
+        np.arange(100_000, dtype=np.int16), sample_format="int16"
+    )
+    shared = audio.to_shared_memory()
+    payload = pickle.dumps(shared)
+    assert len(payload) < 1000
+
+    copy = pickle.loads(payload)
+    copy.data[0] = 7
+    assert shared.data[0] == 7 and copy.sample_format == "int16"
+
+    with pytest.raises(ValueError):
+        copy.shared_buffer.unlink()
+    del copy
+    shared.release_shared_memory()
+    assert shared.shared_buffer is None
+
+
+def test_shared_memory_across_processes():
+    """
+    Test that a worker process writes into the samples seen by the parent process.
+    """
+    samples = np.random.randn(2, 50_000)
+    shared = DualChannelAudioDataType.from_planar(samples).to_shared_memory()
+    assert shared.layout == PLANAR
+
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1) as pool:
+        assert pool.apply(_negate_in_worker, (shared,)) < 1000
+
+    np.testing.assert_array_equal(shared.data, -samples.T)
+    shared.release_shared_memory()
+
+
+def test_shared_buffer_context_manager():
+    """
+    Test that a buffer used as a context manager is closed and unlinked on exit.
+    """
+    with SharedAudioBuffer.create((10, 2), np.float32) as buffer:
+        buffer.array[:] = 1.0
+        name = buffer.name
+    assert buffer.closed and not buffer.owner
+    with pytest.raises(FileNotFoundError):
+        SharedAudioBuffer.attach(name, (10, 2), np.float32)
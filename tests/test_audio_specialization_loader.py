@@ -1,12 +1,61 @@
+import importlib
+import inspect
+import subprocess
+import sys
+
+from semantiva.data_processors import DataOperation, DataProbe
 from semantiva.specializations.specialization_loader import load_specializations
 from semantiva.component_loader import ComponentLoader
+from semantiva_audio.manifest import PROCESSOR_MANIFEST
+from semantiva_audio.processing import processors
 
 
 def test_registering_specialization():
     """Test registering the audio specialization"""
     # ComponentLoader.get_registered_modules()
     load_specializations("audio")
+    assert "semantiva_audio.manifest" in ComponentLoader.get_registered_modules()
     assert (
-        "semantiva_audio.processing.processors"
-        in ComponentLoader.get_registered_modules()
+        ComponentLoader.get_class("SingleChannelAudioMultiplyOperation")
+        is processors.SingleChannelAudioMultiplyOperation
+    )
+
+
+def test_manifest_lists_every_processor():
+    """Test that the manifest maps every processor to its defining module"""
+    defined = {}
+    for module_name in set(PROCESSOR_MANIFEST.values()):
+        module = importlib.import_module(module_name)
+        for name, value in vars(module).items():
+            if (
+                inspect.isclass(value)
+                and issubclass(value, (DataOperation, DataProbe))
+                and value.__module__ == module_name
+            ):
+                defined[name] = module_name
+    assert PROCESSOR_MANIFEST == defined
+    assert processors.DualChannelAudioFIRFilterOperation is ComponentLoader.get_class(
+        "DualChannelAudioFIRFilterOperation"
+    )
+
+
+def test_processors_are_imported_on_first_resolution():
+    """Test that loading the specialization does not import the processors"""
+    script = (
+        "import sys\n"
+        "from semantiva.specializations import load_specializations\n"
+        "from semantiva.component_loader import ComponentLoader\n"
+        "from semantiva_audio.manifest import PROCESSOR_MANIFEST\n"
+        "load_specializations('audio')\n"
+        "modules = set(PROCESSOR_MANIFEST.values())\n"
+        "assert not modules & set(sys.modules)\n"
+        "ComponentLoader.get_class('SingleChannelAudioMultiplyOperation')\n"
+        "heavy = {'semantiva_audio.processing.' + name for name in (\n"
+        "    'statistics', 'convolution', 'spectral', 'resampling')}\n"
+        "imported = (modules | heavy) & set(sys.modules)\n"
+        "assert imported == {'semantiva_audio.processing.processors'}, imported\n"
+        "ComponentLoader.get_class('DualChannelAudioFIRFilterOperation')\n"
+        "assert 'semantiva_audio.processing.filters' in sys.modules\n"
+        "assert 'semantiva_audio.processing.spectral' not in sys.modules\n"
     )
+    subprocess.run([sys.executable, "-c", script], check=True)
@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+from semantiva.payload_operations import Pipeline
+from semantiva_audio.data_types.data_types import (
+    SingleChannelAudioDataType,
+    SpectrogramDataType,
+)
+from semantiva_audio.processing.operations import SpectrogramOperation
+from semantiva_audio.processing.spectrograms import (
+    SingleChannelAudioSTFTOperation,
+    SpectrogramISTFTOperation,
+)
+from semantiva_audio.processing.spectral import get_window, istft, stft
+
+
+class SpectrogramMockGainOperation(SpectrogramOperation):
+    """
+    A mock operation scaling all bins of a spectrogram.
+    """
+
+    def _process_logic(self, data, gain):
+        return SpectrogramDataType(
+            data.data * gain, data.frame_size, data.hop_size, data.window, data.length
+        )
+
+
+def test_windows_are_cached():
+    """
+    Test that windows are computed once per (type, size) and cannot be modified.
+    """
+    window = get_window("hann", 512)
+
+    assert get_window("hann", 512) is window
+    assert not window.flags.writeable
+    assert window[0] == 0.0 and window[256] == 1.0
+    with pytest.raises(ValueError):
+        get_window("triangle", 512)
+
+
+def test_stft_matches_explicit_framing():
+    """
+    Test the strided, batched STFT against a frame-by-frame computation.
+    """
+    samples = np.random.randn(5000)
+    padded = np.pad(samples, 256)
+    window = get_window("hann", 512)
+
+    spectrogram = stft(samples, 512, 128)
+
+    assert spectrogram.shape == (1 + 5000 // 128, 257)
+    for index in (0, 7, spectrogram.shape[0] - 1):
+        frame = padded[index * 128 : index * 128 + 512] * window
+        np.testing.assert_allclose(spectrogram[index], np.fft.rfft(frame), atol=1e-10)
+
+
+@pytest.mark.parametrize("window", ["hann", "hamming", "blackman"])
+@pytest.mark.parametrize("frame_size, hop_size", [(512, 128), (1000, 300)])
+def test_istft_reconstructs_signal(window, frame_size, hop_size):
+    """
+    Test that the inverse STFT reconstructs the signal.
+    """
+    samples = np.random.randn(4321)
+
+    spectrogram = stft(samples, frame_size, hop_size, window)
+    reconstructed = istft(spectrogram, frame_size, hop_size, window, len(samples))
+
+    np.testing.assert_allclose(reconstructed, samples, atol=1e-10)
+
+
+def test_spectrogram_pipeline():
+    """
+    Test computing a spectrogram once, processing it and reconstructing the audio.
+    """
+    audio = SingleChannelAudioDataType(np.random.randn(8000).astype(np.float32))
+    pipeline = Pipeline(
+        [
+            {
+                "processor": SingleChannelAudioSTFTOperation,
+                "parameters": {"frame_size": 1024, "hop_size": 256},
+            },
+            {"processor": SpectrogramMockGainOperation, "parameters": {"gain": 0.5}},
+            {"processor": SpectrogramISTFTOperation},
+        ]
+    )
+
+    output, _ = pipeline.process(audio, {})
+
+    assert isinstance(output, SingleChannelAudioDataType)
+    assert output.data.dtype == np.float32
+    np.testing.assert_allclose(output.data, audio.data * 0.5, atol=1e-5)
+
+
+def test_spectrogram_validation():
+    """
+    Test that spectrograms must be complex and match their frame size.
+    """
+    spectrogram = SpectrogramDataType(np.zeros((10, 257), dtype=np.complex64))
+    assert (spectrogram.frame_size, spectrogram.hop_size) == (512, 128)
+
+    with pytest.raises(AssertionError):
+        SpectrogramDataType(np.zeros((10, 257)))
+    with pytest.raises(AssertionError):
+        SpectrogramDataType(np.zeros((10, 257), dtype=complex), frame_size=1024)
@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from semantiva_audio.data_types.data_types import (
+    SingleChannelAudioDataType,
+    DualChannelAudioDataType,
+)
+from semantiva_audio.processing.statistics import AudioStatistics
+from semantiva_audio.processing.probes import (
+    SingleChannelAudioStatisticsProbe,
+    DualChannelAudioStatisticsProbe,
+)
+
+
+def reference_statistics(samples: np.ndarray) -> dict:
+    """
+    Compute the statistics with one NumPy pass per statistic.
+    """
+    signs = np.signbit(samples)
+    return {
+        "samples": samples.shape[0],
+        "peak": np.abs(samples).max(axis=0),
+        "rms": np.sqrt(np.mean(samples**2, axis=0)),
+        "dc_offset": samples.mean(axis=0),
+        "clipped": np.count_nonzero(np.abs(samples) >= 1.0, axis=0),
+        "zero_crossings": np.count_nonzero(signs[1:] != signs[:-1], axis=0),
+    }
+
+
+def assert_statistics_equal(statistics: AudioStatistics, expected: dict):
+    """
+    Compare statistics with reference values.
+    """
+    for name, value in statistics.as_dict().items():
+        np.testing.assert_allclose(value, expected[name], err_msg=name)
+
+
+def test_statistics_match_reference():
+    """
+    Test blockwise statistics of multi-channel float samples against NumPy.
+    """
+    samples = np.random.randn(10_000, 2) * 0.5 + 0.1
+
+    statistics = AudioStatistics.from_samples(samples, block_size=999)
+
+    assert_statistics_equal(statistics, reference_statistics(samples))
+    assert isinstance(statistics.variance, np.ndarray)
+
+
+def test_statistics_merge_is_exact():
+    """
+    Test that merging the statistics of consecutive chunks, in any grouping,
+    gives the statistics of the whole signal.
+    """
+    samples = np.random.randn(5000)
+    chunks = [samples[:1234], samples[1234:1235], samples[1235:4000], samples[4000:]]
+    parts = [AudioStatistics.from_samples(chunk) for chunk in chunks]
+
+    sequential = AudioStatistics()
+    for part in parts:
+        sequential = sequential.merge(part)
+    tree = parts[0].merge(parts[1]).merge(parts[2].merge(parts[3]))
+
+    expected = reference_statistics(samples)
+    assert_statistics_equal(sequential, expected)
+    assert_statistics_equal(tree, expected)
+    assert isinstance(sequential.rms, float)
+
+
+def test_statistics_of_pcm_samples():
+    """
+    Test that PCM samples are measured in float units, with saturated samples clipped.
+    """
+    audio = SingleChannelAudioDataType(
+        np.array([32767, -32768, 16384, -16384, 0], dtype=np.int16), "int16"
+    )
+
+    statistics = SingleChannelAudioStatisticsProbe()(audio)
+
+    assert statistics.peak == 1.0
+    assert statistics.clipped == 2
+    assert statistics.zero_crossings == 4
+    assert statistics.count == 5
+    assert statistics.dc_offset == pytest.approx(-(2**-15) / 5)
+
+
+def test_statistics_probe_streaming():
+    """
+    Test that in streaming mode the probe accumulates the statistics of the stream.
+    """
+    samples = np.random.randn(4096, 2)
+    chunks = [
+        DualChannelAudioDataType.from_validated(samples[start : start + 1000])
+        for start in range(0, len(samples), 1000)
+    ]
+    probe = DualChannelAudioStatisticsProbe()
+
+    results = list(probe.process_stream(chunks))
+
+    assert len(results) == len(chunks)
+    assert results[0].count == 1000
+    assert_statistics_equal(results[-1], reference_statistics(samples))
+    assert probe.stream_state is None
@@ -0,0 +1,134 @@
+import pytest
+import numpy as np
+
+from semantiva.context_processors.context_types import ContextType
+from semantiva_audio.data_types.data_types import SingleChannelAudioDataType
+from semantiva_audio.data_io.io import (
+    SingleChannelAudioSource,
+    SingleChannelPayloadSink,
+)
+from semantiva_audio.processing.operations import SingleChannelAudioOperation
+from semantiva_audio.processing.processors import SingleChannelAudioMultiplyOperation
+
+
+class SingleChannelMockArraySource(SingleChannelAudioSource):
+    """
+    Mock source serving an in-memory array.
+    """
+
+    def _get_data(self, samples):
+        return SingleChannelAudioDataType(samples)
+
+
+class SingleChannelMockCumulativeSumOperation(SingleChannelAudioOperation):
+    """
+    Mock stateful operation computing the running sum of the signal.
+    """
+
+    def _process_logic(self, data):
+        offset = self.stream_state if self.is_streaming and self.stream_state else 0.0
+        result = np.cumsum(data.data) + offset
+        if self.is_streaming:
+            self.stream_state = result[-1]
+        return SingleChannelAudioDataType(result)
+
+
+class SingleChannelMockCollectorSink(SingleChannelPayloadSink):
+    """
+    Mock sink collecting the chunks of a stream.
+    """
+
+    def __init__(self):
+        self.chunks = []
+        self.closed = False
+
+    @staticmethod
+    def input_data_type():
+        return SingleChannelAudioDataType
+
+    def _send_payload(self, data, context, *args, **kwargs):
+        self.chunks.append(data.data.copy())
+
+    def _end_stream(self, context, *args, **kwargs):
+        self.closed = True
+
+
+@pytest.fixture
+def samples():
+    """
+    Pytest fixture providing random single-channel samples.
+    """
+    return np.random.rand(1000)
+
+
+def test_source_chunks_are_views(samples):
+    """
+    Test that chunks cover the signal in order without copying it.
+    """
+    chunks = list(SingleChannelMockArraySource().iter_chunks(samples, block_size=300))
+
+    assert [len(chunk.data) for chunk in chunks] == [300, 300, 300, 100]
+    assert all(np.shares_memory(chunk.data, samples) for chunk in chunks)
+    np.testing.assert_array_equal(
+        np.concatenate([chunk.data for chunk in chunks]), samples
+    )
+
+
+def test_source_chunks_with_overlap(samples):
+    """
+    Test that consecutive chunks share the requested number of samples.
+    """
+    chunks = list(
+        SingleChannelMockArraySource().iter_chunks(samples, block_size=256, overlap=128)
+    )
+
+    for previous, current in zip(chunks, chunks[1:]):
+        np.testing.assert_array_equal(previous.data[128:], current.data[:128])
+    np.testing.assert_array_equal(chunks[-1].data[-1], samples[-1])
+
+
+def test_source_chunks_invalid_overlap(samples):
+    """
+    Test that an overlap as large as the block is rejected.
+    """
+    with pytest.raises(ValueError):
+        next(
+            SingleChannelMockArraySource().iter_chunks(
+                samples, block_size=100, overlap=100
+            )
+        )
+
+
+def test_stateful_operation_stream_matches_whole_signal(samples):
+    """
+    Test that state carried between chunks reproduces whole-signal processing.
+    """
+    operation = SingleChannelMockCumulativeSumOperation()
+    chunks = SingleChannelMockArraySource().iter_chunks(samples, block_size=128)
+
+    streamed = np.concatenate([c.data for c in operation.process_stream(chunks)])
+
+    np.testing.assert_allclose(
+        streamed, operation(SingleChannelAudioDataType(samples)).data
+    )
+    assert not operation.is_streaming
+
+
+def test_stream_into_sink(samples):
+    """
+    Test chaining a chunked source, operations and a sink.
+    """
+    source = SingleChannelMockArraySource()
+    multiply = SingleChannelAudioMultiplyOperation()
+    sink = SingleChannelMockCollectorSink()
+
+    sink.send_stream(
+        multiply.process_stream(
+            source.iter_chunks(samples, block_size=200), factor=2.0
+        ),
+        ContextType(),
+    )
+
+    assert len(sink.chunks) == 5
+    assert sink.closed
+    np.testing.assert_allclose(np.concatenate(sink.chunks), samples * 2.0)